@@ -0,0 +1,94 @@
+"""
+Import-time benchmark with a regression budget.
+
+Each module is imported in a fresh interpreter under `python -X importtime`, several times. The benchmark reports
+the median cumulative import time, checks it against the module's budget, and checks that no module from
+FORBIDDEN_IMPORTS was loaded on the way. It exits with status 1 when any check fails, so it can gate CI:
+
+    python -m benchmarks.bench_import --repeat 7
+    python -m benchmarks.bench_import --scale 2.0    # relax every budget on a slow machine
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Milliseconds of cumulative import time allowed per module, measured from a cold interpreter. The core budgets
+# leave about 2x headroom over a typical laptop; the CLI also pays for argparse, csv and json.
+IMPORT_BUDGETS_MS = {
+    "src": 5.0,
+    "src.business_day_counter": 80.0,
+    "src.cli": 120.0,
+}
+# Optional dependencies the core modules must not load at import time.
+FORBIDDEN_IMPORTS = ("numpy", "asyncio", "mmap", "concurrent.futures", "src.batch", "src.server",
+                     "src.calendar_file")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr):
+    """
+    Parses the `-X importtime` report.
+
+    :param stderr: str -> stderr of an interpreter run with `-X importtime`.
+    :return: dict -> module name to cumulative import time in microseconds.
+    """
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def measure_import(module, repeat=5):
+    """
+    Imports `module` in `repeat` fresh interpreters.
+
+    :param module: str -> dotted module name.
+    :param repeat: int -> number of interpreters to start.
+    :return: tuple -> (median cumulative import time in milliseconds, set of module names loaded on the way).
+    """
+    timings = []
+    loaded = set()
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                   cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        report = parse_importtime(completed.stderr)
+        timings.append(report[module] / 1000.0)
+        loaded.update(report)
+    return statistics.median(timings), loaded
+
+
+def check_module(module, budget_ms, repeat=5):
+    """
+    :return: tuple -> (median milliseconds, list of forbidden modules loaded, whether the module is within budget).
+    """
+    median_ms, loaded = measure_import(module, repeat)
+    forbidden = sorted(name for name in FORBIDDEN_IMPORTS if name in loaded and name != module)
+    return median_ms, forbidden, median_ms <= budget_ms and not forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier applied to every budget")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<28} {'median ms':>10} {'budget ms':>10}  status")
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        budget_ms *= args.scale
+        median_ms, forbidden, ok = check_module(module, budget_ms, args.repeat)
+        failed = failed or not ok
+        status = "ok" if ok else "FAIL"
+        if forbidden:
+            status += f" (loads {', '.join(forbidden)})"
+        print(f"{module:<28} {median_ms:>10.1f} {budget_ms:>10.1f}  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Scaling benchmark for the process-pool batch runner.
+
+Generates random date pairs and runs the business-day count with 1..N workers, printing throughput and speedup
+relative to one worker. Scaling should be close to linear up to the number of physical cores:
+
+    python -m benchmarks.bench_parallel --rows 1000000 --chunk-size 50000
+"""
+import argparse
+import io
+import logging
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from src.parallel import run_parallel
+
+HOLIDAY_RULES = [
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+
+
+def generate_csv(rows, seed=0):
+    """
+    :return: str -> CSV document with `rows` random (start_date, end_date) pairs between 2000 and 2030.
+    """
+    generator = random.Random(seed)
+    base = date(2000, 1, 1)
+    lines = ["start_date,end_date"]
+    for _ in range(rows):
+        start_date = base + timedelta(days=generator.randrange(10000))
+        end_date = start_date + timedelta(days=generator.randrange(-30, 1000))
+        lines.append(f"{start_date.isoformat()},{end_date.isoformat()}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    csv_input = generate_csv(args.rows)
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+    for workers in range(1, args.max_workers + 1):
+        started = time.perf_counter()
+        run_parallel("business", io.StringIO(csv_input), io.StringIO(), chunk_size=args.chunk_size,
+                     workers=workers, holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2033)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {args.rows / elapsed:>12.0f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Throughput and latency benchmark for the asyncio query server.
+
+Starts the server in-process and drives it from several concurrent connections, each sending pipelined business-day
+queries. Prints requests per second, the mean coalesced batch size and latency percentiles:
+
+    python -m benchmarks.bench_server --connections 16 --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from src.business_calendar import BusinessCalendar
+from src.server import BusinessDayServer
+
+from benchmarks.bench_parallel import HOLIDAY_RULES
+
+
+async def client(port, requests, pipeline, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for offset in range(0, len(requests), pipeline):
+        window = requests[offset:offset + pipeline]
+        started = time.perf_counter()
+        writer.write(b"".join(window))
+        await writer.drain()
+        for _ in window:
+            await reader.readline()
+        latencies.extend([time.perf_counter() - started] * len(window))
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args):
+    calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2033)
+    server = BusinessDayServer({"default": calendar}, batch_window=args.batch_window)
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+
+    generator = random.Random(0)
+    base = date(2000, 1, 1)
+    per_connection = args.requests // args.connections
+    workloads = []
+    for _ in range(args.connections):
+        requests = []
+        for index in range(per_connection):
+            start_date = base + timedelta(days=generator.randrange(10000))
+            end_date = start_date + timedelta(days=generator.randrange(1000))
+            requests.append(json.dumps({"id": index, "op": "business", "start_date": start_date.isoformat(),
+                                        "end_date": end_date.isoformat()}).encode() + b"\n")
+        workloads.append(requests)
+
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, args.pipeline, latencies) for requests in workloads))
+    elapsed = time.perf_counter() - started
+    await server.wait_connections_closed()
+    listener.close()
+    await listener.wait_closed()
+
+    stats = server.coalescer.stats
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{len(latencies)} requests in {elapsed:.2f}s: {len(latencies) / elapsed:.0f} req/s, "
+          f"{stats['requests'] / stats['batches']:.1f} requests/batch")
+    print(f"latency p50 {percentiles[49] * 1000:.2f} ms, p99 {percentiles[98] * 1000:.2f} ms, "
+          f"max {max(latencies) * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--pipeline", type=int, default=32, help="Requests sent per round trip per connection.")
+    parser.add_argument("--batch-window", type=float, default=0.002)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Benchmark suite for the counting API.
+
+Times `BusinessDayCounter.weekdays_between_two_dates` and `business_days_between_two_dates` along four axes: range
+length (1 day to 1000 years), number of holiday rules (1 to 10k), size of the static public holiday list (up to 1M)
+and, for `business_days_between_many`, batch size. Every case reports ops/s, latency percentiles and the tracemalloc
+peak of a separate traced pass, and the results are written as JSON so two runs can be compared:
+
+    python -m benchmarks.bench_suite --output before.json
+    python -m benchmarks.bench_suite --output after.json --compare before.json
+"""
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from itertools import cycle, islice
+
+import numpy as np
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.factory import compile_rules
+
+from benchmarks.bench_parallel import HOLIDAY_RULES
+
+RANGE_LENGTHS = (1, 7, 30, 365, 3650, 36500, 365000)
+RULE_COUNTS = (1, 10, 100, 1000, 10000)
+HOLIDAY_LIST_SIZES = (1, 100, 10000, 1000000)
+BATCH_SIZES = (1, 10, 100, 1000, 10000, 100000)
+
+# Reduced axes for a smoke run.
+QUICK_LIMITS = {"range_length": 36500, "rule_count": 1000, "holiday_list_size": 10000, "batch_size": 10000}
+
+# Number of distinct inputs cycled through by each case, so caches see realistic variety.
+DISTINCT_INPUTS = 64
+# Calls run under tracemalloc for the memory figure.
+TRACED_CALLS = 20
+PERCENTILES = (50, 90, 99)
+
+
+def generate_rules(count):
+    """
+    :return: list of `count` holiday rule dicts cycling through the three holiday types. Rules repeating a
+             (type, month, day, occurrence) key are deduplicated when compiled.
+    """
+    rules = []
+    for index in range(count):
+        month, day = index % 12 + 1, index // 12 % 28 + 1
+        if index % 3 == 0:
+            rules.append({"holiday_type": "public_holiday", "month": month, "day": day})
+        elif index % 3 == 1:
+            rules.append({"holiday_type": "moveable_holiday", "month": month, "day": day})
+        else:
+            rules.append({"holiday_type": "certain_occurrence_holiday", "month": month, "day": index // 12 % 7,
+                          "occurrence": index // 84 % 5 + 1})
+    return rules
+
+
+def generate_holiday_list(size, generator):
+    """
+    :return: list of `size` random dates between 1000 and 3000, duplicates allowed.
+    """
+    base = date(1000, 1, 1).toordinal()
+    return [date.fromordinal(base + generator.randrange(730000)) for _ in range(size)]
+
+
+def generate_ranges(length, generator, first_year=1000):
+    """
+    :return: list of DISTINCT_INPUTS (start, end) pairs `length` days apart, starting within 300 years of
+             `first_year`.
+    """
+    base = date(first_year, 1, 1)
+    starts = [base + timedelta(days=generator.randrange(109500)) for _ in range(DISTINCT_INPUTS)]
+    return [(start, start + timedelta(days=length)) for start in starts]
+
+
+def percentile(sorted_values, percent):
+    """
+    :return: Nearest-rank percentile of an ascending list.
+    """
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(function, inputs, min_time, max_ops, items_per_op=1):
+    """
+    Calls `function(*arguments)` for the inputs in turn until `min_time` seconds or `max_ops` calls have passed,
+    timing every call, then repeats a few calls under tracemalloc.
+
+    :param function: Callable to measure.
+    :param inputs: list of argument tuples, cycled through.
+    :param min_time: float -> Minimum seconds to spend timing.
+    :param max_ops: int -> Maximum number of timed calls.
+    :param items_per_op: int -> Rows handled by one call, for batch functions.
+    :return: dict -> ops, seconds, ops_per_second, items_per_second, latency_us percentiles and tracemalloc_peak_bytes.
+    """
+    latencies = []
+    clock = time.perf_counter
+    started = clock()
+    for arguments in cycle(inputs):
+        call_started = clock()
+        function(*arguments)
+        finished = clock()
+        latencies.append(finished - call_started)
+        if len(latencies) >= max_ops or finished - started >= min_time:
+            break
+    seconds = sum(latencies)
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for arguments in islice(cycle(inputs), min(TRACED_CALLS, len(latencies))):
+        function(*arguments)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    latencies.sort()
+    latency_us = {f"p{percent}": percentile(latencies, percent) * 1e6 for percent in PERCENTILES}
+    latency_us["max"] = latencies[-1] * 1e6
+    return {"ops": len(latencies), "seconds": seconds, "ops_per_second": len(latencies) / seconds,
+            "items_per_second": len(latencies) * items_per_op / seconds, "latency_us": latency_us,
+            "tracemalloc_peak_bytes": peak}
+
+
+def limited(values, axis, quick):
+    """
+    :return: The axis values, capped at QUICK_LIMITS in quick mode.
+    """
+    return [value for value in values if not quick or value <= QUICK_LIMITS[axis]]
+
+
+def iter_cases(quick):
+    """
+    Yields (axis, value, function name, callable, inputs, items_per_op, setup seconds) for every case of the suite.
+    Inputs and calendars are built before timing starts; their cost is reported as setup seconds.
+    """
+    generator = random.Random(0)
+    counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+
+    for length in limited(RANGE_LENGTHS, "range_length", quick):
+        ranges = generate_ranges(length, generator)
+        yield "range_length", length, "weekdays_between_two_dates", counter.weekdays_between_two_dates, ranges, 1, 0.0
+        yield ("range_length", length, "business_days_between_two_dates",
+               lambda start, end: counter.business_days_between_two_dates(start, end, holiday_rules=HOLIDAY_RULES),
+               ranges, 1, 0.0)
+
+    ranges = generate_ranges(365, generator, first_year=1900)
+    for count in limited(RULE_COUNTS, "rule_count", quick):
+        started = time.perf_counter()
+        rules = compile_rules(generate_rules(count))
+        setup = time.perf_counter() - started
+        yield ("rule_count", count, "business_days_between_two_dates",
+               lambda start, end, rules=rules: counter.business_days_between_two_dates(start, end,
+                                                                                       holiday_rules=rules),
+               ranges, 1, setup)
+
+    ranges = generate_ranges(365, generator)
+    for size in limited(HOLIDAY_LIST_SIZES, "holiday_list_size", quick):
+        holidays = generate_holiday_list(size, generator)
+        yield ("holiday_list_size", size, "business_days_between_two_dates",
+               lambda start, end, holidays=holidays: counter.business_days_between_two_dates(
+                   start, end, public_holiday_list=holidays),
+               ranges, 1, 0.0)
+        started = time.perf_counter()
+        calendar = BusinessCalendar(public_holiday_list=holidays, start_year=1000, end_year=3000)
+        setup = time.perf_counter() - started
+        yield ("holiday_list_size", size, "business_days_between_two_dates[calendar]",
+               lambda start, end, calendar=calendar: counter.business_days_between_two_dates(start, end,
+                                                                                             calendar=calendar),
+               ranges, 1, setup)
+
+    calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2033)
+    base = date(2000, 1, 1).toordinal()
+    for size in limited(BATCH_SIZES, "batch_size", quick):
+        batches = []
+        for _ in range(4):
+            starts = base + np.array([generator.randrange(10000) for _ in range(size)], dtype=np.int64)
+            ends = starts + np.array([generator.randrange(-30, 1000) for _ in range(size)], dtype=np.int64)
+            batches.append((starts, ends))
+        yield ("batch_size", size, "business_days_between_many",
+               lambda starts, ends: counter.business_days_between_many(starts, ends, calendar=calendar),
+               batches, size, 0.0)
+
+
+def run_suite(quick=False, min_time=0.2, max_ops=100000):
+    """
+    Runs every case of the suite.
+
+    :param quick: bool -> Use the reduced axes of QUICK_LIMITS.
+    :param min_time: float -> Seconds to spend timing each case.
+    :param max_ops: int -> Maximum number of timed calls per case.
+    :return: dict -> {"metadata": ..., "results": [...]}, ready for JSON.
+    """
+    results = []
+    for axis, value, name, function, inputs, items_per_op, setup in iter_cases(quick):
+        result = {"axis": axis, "value": value, "function": name, "setup_seconds": setup}
+        result.update(measure(function, inputs, min_time, max_ops, items_per_op))
+        results.append(result)
+        print(format_result(result), file=sys.stderr)
+    metadata = {"created": datetime.now(timezone.utc).isoformat(), "python": platform.python_version(),
+                "implementation": platform.python_implementation(), "platform": platform.platform(),
+                "numpy": np.__version__, "quick": quick, "min_time": min_time, "max_ops": max_ops}
+    return {"metadata": metadata, "results": results}
+
+
+def format_result(result, baseline=None):
+    """
+    :return: str -> One table row; with a baseline result, the ops/s ratio against it.
+    """
+    latency = result["latency_us"]
+    row = (f"{result['axis']:>17} {result['value']:>8} {result['function']:<43} {result['ops_per_second']:>12.0f} "
+           f"{latency['p50']:>10.1f} {latency['p99']:>10.1f} {result['tracemalloc_peak_bytes']:>12}")
+    if baseline is not None:
+        row += f" {result['ops_per_second'] / baseline['ops_per_second']:>7.2f}x"
+    return row
+
+
+def compare(report, baseline_report):
+    """
+    :return: list of str -> Rows of the cases present in both reports, with the ops/s ratio of `report`.
+    """
+    baseline = {(result["axis"], result["value"], result["function"]): result
+                for result in baseline_report["results"]}
+    return [format_result(result, baseline[key]) for result in report["results"]
+            if (key := (result["axis"], result["value"], result["function"])) in baseline]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    parser.add_argument("--compare", help="JSON report of an earlier run to compare ops/s against.")
+    parser.add_argument("--quick", action="store_true", help="Cap every axis for a smoke run.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds to spend timing each case.")
+    parser.add_argument("--max-ops", type=int, default=100000, help="Maximum timed calls per case.")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'axis':>17} {'value':>8} {'function':<43} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10} "
+          f"{'peak bytes':>12}", file=sys.stderr)
+    report = run_suite(quick=args.quick, min_time=args.min_time, max_ops=args.max_ops)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline_report = json.load(baseline_file)
+        print("\nRelative to", args.compare, file=sys.stderr)
+        for row in compare(report, baseline_report):
+            print(row, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Thread scaling benchmark for shared calendars.
+
+One precomputed BusinessCalendar is shared by every thread of a ThreadPoolExecutor, and each thread counts its share
+of random date pairs with no lock on the query path. Prints throughput and speedup relative to one thread. On a
+standard (GIL) build the speedup stays around 1; on a free-threaded build it should follow the number of cores:
+
+    python -m benchmarks.bench_threads --queries 400000 --max-threads 8
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+
+from benchmarks.bench_parallel import HOLIDAY_RULES
+
+
+def generate_pairs(count, seed=0):
+    """
+    :return: list of `count` random (start_date, end_date) pairs between 2000 and 2030.
+    """
+    generator = random.Random(seed)
+    base = date(2000, 1, 1)
+    pairs = []
+    for _ in range(count):
+        start_date = base + timedelta(days=generator.randrange(10000))
+        pairs.append((start_date, start_date + timedelta(days=generator.randrange(-30, 1000))))
+    return pairs
+
+
+def count_slice(calendar, pairs):
+    """
+    Counts one thread's share of the pairs with its own quiet counter and the shared calendar.
+    """
+    counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+    return [counter.business_days_between_two_dates(start_date, end_date, calendar=calendar)
+            for start_date, end_date in pairs]
+
+
+def run_threads(calendar, pairs, threads):
+    """
+    :return: float -> Seconds taken to count every pair with `threads` threads.
+    """
+    slices = [pairs[index::threads] for index in range(threads)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda pair_slice: count_slice(calendar, pair_slice), slices))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=200000)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))},"
+          f" GIL enabled: {gil_enabled}, CPUs: {os.cpu_count()}")
+
+    calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2033).precompute()
+    pairs = generate_pairs(args.queries)
+    baseline = None
+    print(f"{'threads':>8} {'seconds':>9} {'queries/s':>12} {'speedup':>8}")
+    for threads in range(1, args.max_threads + 1):
+        elapsed = run_threads(calendar, pairs, threads)
+        baseline = baseline or elapsed
+        print(f"{threads:>8} {elapsed:>9.2f} {args.queries / elapsed:>12.0f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Business-day counting package.
+
+Importing the package loads no submodules and configures no logging; applications configure logging themselves.
+The public names below resolve on first access, so `src.BusinessCalendar` pulls in only the core modules, and the
+NumPy batch functions, the memory-mapped calendar files and the server are imported only by code that uses them.
+"""
+import importlib
+
+LAZY_ATTRIBUTES = {
+    "BusinessCalendar": "src.business_calendar",
+    "BusinessDayCounter": "src.business_day_counter",
+    "CalendarRegistry": "src.calendar_registry",
+    "DayUtils": "src.date_utils",
+    "HolidayExpansionCache": "src.factory",
+    "HolidayFactory": "src.factory",
+    "MappedBusinessCalendar": "src.calendar_file",
+    "MutableBusinessCalendar": "src.mutable_calendar",
+    "ResultCache": "src.result_cache",
+    "StageProfiler": "src.profiling",
+    "add_business_days_many": "src.batch",
+    "business_days_between_many": "src.batch",
+    "load_or_build_calendar": "src.calendar_file",
+    "profile": "src.profiling",
+    "write_calendar_file": "src.calendar_file",
+}
+
+__all__ = sorted(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
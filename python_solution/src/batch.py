@@ -0,0 +1,292 @@
+import logging
+from datetime import MAXYEAR, date
+
+import numpy as np
+
+from src.business_calendar import BusinessCalendar, DEFAULT_ITER_CHUNK_SIZE
+from src.date_utils import DEFAULT_WEEKMASK, NUMBER_OF_DAYS_IN_A_WEEK, UNIX_EPOCH_ORDINAL, build_weekend_days_table
+
+logger = logging.getLogger(__name__)
+
+
+def to_ordinals(values):
+    """
+    Converts an array of dates to proleptic Gregorian ordinals.
+
+    :param values: array-like of `datetime64` values or integer ordinals.
+    :return: numpy.ndarray -> int64 array of ordinals.
+    :raises TypeError: If the array holds neither dates nor integers.
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[D]").astype(np.int64) + UNIX_EPOCH_ORDINAL
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64, copy=False)
+    raise TypeError("Dates must be a datetime64 array or an integer ordinal array")
+
+
+def total_weekend_days_count(start_ordinals, total_days, weekmask=DEFAULT_WEEKMASK):
+    """
+    Vectorized form of `DayUtils.total_weekend_days_count`: full weeks contribute their weekend days and the
+    remainder is resolved through the weekmask's precomputed (start weekday, remainder) table.
+
+    :param start_ordinals: numpy.ndarray -> ordinals of the start dates.
+    :param total_days: numpy.ndarray -> number of days strictly between start and end, non-negative.
+    :param weekmask: str -> canonical weekmask.
+    :return: numpy.ndarray -> weekend days per row.
+    """
+    weekend_days_table = np.array(build_weekend_days_table(weekmask), dtype=np.int64)
+    quotient, remainder = np.divmod(total_days, NUMBER_OF_DAYS_IN_A_WEEK)
+    start_date_index = (start_ordinals + 6) % NUMBER_OF_DAYS_IN_A_WEEK
+    return quotient * weekmask.count("0") + weekend_days_table[start_date_index, remainder]
+
+
+def business_days_before(ordinals, calendar):
+    """
+    Vectorized form of `BusinessCalendar.business_days_before`.
+
+    :param ordinals: numpy.ndarray -> proleptic Gregorian ordinals.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :return: numpy.ndarray -> cumulative business-day position of each ordinal.
+    """
+    weeks, rest = np.divmod(ordinals, NUMBER_OF_DAYS_IN_A_WEEK)
+    partial_week_weekdays = np.array(calendar.partial_week_weekdays, dtype=np.int64)
+    holiday_ordinals = calendar.holiday_arrays()[0]
+    return (weeks * calendar.weekdays_per_week + partial_week_weekdays[rest]
+            - np.searchsorted(holiday_ordinals, ordinals, side="left"))
+
+
+def business_day_ordinals(positions, calendar):
+    """
+    Vectorized form of `BusinessCalendar.business_day_ordinal`.
+
+    :param positions: numpy.ndarray -> zero-based business-day positions.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :return: numpy.ndarray -> ordinals of the business days at those positions.
+    """
+    holiday_slots = calendar.holiday_arrays()[1]
+    weekday_positions = positions + np.searchsorted(holiday_slots, positions, side="right")
+    weeks, rest = np.divmod(weekday_positions, calendar.weekdays_per_week)
+    return weeks * NUMBER_OF_DAYS_IN_A_WEEK + np.array(calendar.weekday_offsets, dtype=np.int64)[rest]
+
+
+def calendar_for_ordinals(start_ordinals, end_ordinals, public_holiday_list=None, holiday_rules=None,
+                          weekmask=DEFAULT_WEEKMASK):
+    """
+    Builds a BusinessCalendar whose horizon covers every row of the batch.
+
+    :param start_ordinals: numpy.ndarray -> ordinals of the start dates.
+    :param end_ordinals: numpy.ndarray -> ordinals of the end dates.
+    :param public_holiday_list: list of date objects -> static public holidays (optional).
+    :param holiday_rules: list of dictionaries -> rule based public holidays (optional).
+    :param weekmask: str -> working days of the week, Monday first.
+    :return: BusinessCalendar
+    """
+    if start_ordinals.size == 0:
+        return BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                weekmask=weekmask)
+    start_year = date.fromordinal(int(min(start_ordinals.min(), end_ordinals.min()))).year
+    end_year = date.fromordinal(int(max(start_ordinals.max(), end_ordinals.max()))).year
+    # The calendar indexes January 1st of the year after its horizon, so rows in MAXYEAR stay outside it.
+    return BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                            start_year=min(start_year, MAXYEAR - 1), end_year=min(end_year, MAXYEAR - 1),
+                            weekmask=weekmask)
+
+
+def business_days_between_many(starts, ends, calendar=None, public_holiday_list=None, holiday_rules=None,
+                               return_mask=False, weekmask=DEFAULT_WEEKMASK):
+    """
+    Counts business days strictly between each (start, end) pair using array operations only.
+
+    Rows where start >= end, or where either date lies outside the calendar horizon, are invalid: they produce 0
+    and are reported as False in the optional mask instead of raising per row.
+
+    :param starts: array-like of `datetime64[D]` values or integer ordinals.
+    :param ends: array-like of `datetime64[D]` values or integer ordinals, broadcastable against `starts`.
+    :param calendar: BusinessCalendar -> precompiled holidays (optional).
+    :param public_holiday_list: list of date objects -> static public holidays, used when no calendar is given.
+    :param holiday_rules: list of dictionaries -> rule based public holidays, used when no calendar is given.
+    :param return_mask: bool -> also return the boolean validity mask.
+    :param weekmask: str -> working days of the week, used when no calendar is given.
+    :return: numpy.ndarray of int64 counts, or a (counts, mask) tuple when `return_mask` is True.
+    """
+    start_ordinals, end_ordinals = np.broadcast_arrays(to_ordinals(starts), to_ordinals(ends))
+
+    if calendar is None:
+        # Only rows that can be counted at all size the horizon: empty ranges, NaT and out-of-range dates would
+        # otherwise widen it, or fail the whole batch, instead of being masked.
+        countable = ((start_ordinals < end_ordinals) & (start_ordinals >= 1)
+                     & (end_ordinals <= date.max.toordinal()))
+        calendar = calendar_for_ordinals(start_ordinals[countable], end_ordinals[countable],
+                                         public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                         weekmask=weekmask)
+    elif public_holiday_list or holiday_rules:
+        raise ValueError("Pass either a calendar or public_holiday_list/holiday_rules, not both.")
+
+    horizon_start = date(calendar.start_year, 1, 1).toordinal()
+    horizon_end = date(calendar.end_year, 12, 31).toordinal()
+    valid = ((start_ordinals < end_ordinals)
+             & (start_ordinals >= horizon_start) & (end_ordinals <= horizon_end))
+
+    total_days = np.where(valid, end_ordinals - start_ordinals - 1, 0)
+    total_weekend_days = total_weekend_days_count(start_ordinals, total_days, weekmask=calendar.weekmask)
+
+    holiday_ordinals = calendar.holiday_arrays()[0]
+    public_holidays = (np.searchsorted(holiday_ordinals, end_ordinals, side="left")
+                       - np.searchsorted(holiday_ordinals, start_ordinals, side="right"))
+
+    total_business_days = np.where(valid, total_days - total_weekend_days - public_holidays, 0)
+    logger.info("Counted business days for %d rows, %d invalid.", valid.size, valid.size - int(valid.sum()))
+
+    if return_mask:
+        return total_business_days, valid
+    return total_business_days
+
+
+def iter_business_day_chunks(start_ordinal, end_ordinal, calendar, chunk_size=DEFAULT_ITER_CHUNK_SIZE,
+                             as_ordinals=False):
+    """
+    Chunked form of `BusinessCalendar.iter_business_ordinals`: yields the business days strictly between two
+    ordinals as arrays of at most `chunk_size` elements. Each chunk maps a contiguous run of business-day positions
+    back to dates with `business_day_ordinals`, so only one chunk is held in memory at a time, whatever the length
+    of the range. The horizon and chunk size are checked when the iterator is created.
+
+    :param start_ordinal: int -> proleptic Gregorian ordinal of the start date.
+    :param end_ordinal: int -> proleptic Gregorian ordinal of the end date.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :param chunk_size: int -> maximum number of dates per chunk.
+    :param as_ordinals: bool -> yield int64 ordinals instead of `datetime64[D]` dates.
+    :return: iterator of numpy.ndarray -> consecutive chunks in increasing date order, none if the range is empty.
+    :raises ValueError: If either ordinal is outside the calendar horizon or `chunk_size` is not positive.
+    """
+    calendar.check_ordinal_horizon(start_ordinal, end_ordinal)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    first_position = calendar.business_days_before(start_ordinal + 1)
+    end_position = calendar.business_days_before(end_ordinal)
+    return generate_business_day_chunks(first_position, end_position, calendar, chunk_size, as_ordinals)
+
+
+def generate_business_day_chunks(first_position, end_position, calendar, chunk_size, as_ordinals):
+    """
+    Generator behind `iter_business_day_chunks`, over the business-day positions [first_position, end_position).
+    """
+    for chunk_start in range(first_position, end_position, chunk_size):
+        positions = np.arange(chunk_start, min(chunk_start + chunk_size, end_position), dtype=np.int64)
+        ordinals = business_day_ordinals(positions, calendar)
+        yield ordinals if as_ordinals else (ordinals - UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def business_day_distance_matrix(dates, calendar, condensed=False, dtype="int64"):
+    """
+    Business days strictly between every pair of dates. Each date's position is looked up once, as P(d) and
+    P(d + 1) with `business_days_before`, after which the count for the pair (start d_i, end d_j) is the difference
+    max(P(d_j) - P(d_i + 1), 0), filled in with array arithmetic. The cost is O(N log H) lookups plus O(N^2) fill.
+
+    The full matrix holds the count from row date to column date, 0 when the column date is not after the row
+    date plus one day, matching `BusinessCalendar.business_days_between`. The condensed form holds the entries above
+    the diagonal, row by row (the order of `scipy.spatial.distance.pdist`); for dates sorted in increasing order
+    those are all the non-zero counts.
+
+    :param dates: array-like of `datetime64[D]` values or integer ordinals, one-dimensional.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :param condensed: bool -> return the N * (N - 1) / 2 upper-triangle entries instead of the N x N matrix.
+    :param dtype: numpy dtype of the result; int32 holds any count and halves the memory of a large matrix.
+    :return: numpy.ndarray -> N x N matrix, or one-dimensional condensed array.
+    :raises ValueError: If the dates are not one-dimensional or lie outside the calendar horizon.
+    """
+    ordinals = to_ordinals(dates)
+    if ordinals.ndim != 1:
+        raise ValueError("Dates must be a one-dimensional array")
+    horizon_start = date(calendar.start_year, 1, 1).toordinal()
+    horizon_end = date(calendar.end_year, 12, 31).toordinal()
+    if ordinals.size and (ordinals.min() < horizon_start or ordinals.max() > horizon_end):
+        raise ValueError(f"Dates must be within the calendar horizon {calendar.start_year}-{calendar.end_year}")
+
+    end_positions = business_days_before(ordinals, calendar).astype(dtype)
+    start_positions = business_days_before(ordinals + 1, calendar).astype(dtype)
+    size = ordinals.size
+    if not condensed:
+        result = np.subtract(end_positions[np.newaxis, :], start_positions[:, np.newaxis], dtype=dtype)
+        return np.maximum(result, 0, out=result)
+
+    result = np.empty(size * (size - 1) // 2, dtype=dtype)
+    offset = 0
+    for row in range(size - 1):
+        row_length = size - row - 1
+        np.subtract(end_positions[row + 1:], start_positions[row], out=result[offset:offset + row_length])
+        offset += row_length
+    return np.maximum(result, 0, out=result)
+
+
+def rolling_business_days(dates, window, calendar):
+    """
+    Business days in the trailing window of `window` calendar days ending on each date, the date included: for d
+    the count over [d - window + 1, d], which equals `calendar.business_days_between(d - window, d + 1)`.
+
+    One pass builds the cumulative business-day index of the calendar days the windows cover, from the weekmask
+    and the calendar's holidays, after which each window is the difference of two entries. The cost is O(N + S)
+    for N dates spanning S days, with no per-date search or holiday expansion.
+
+    :param dates: array-like of `datetime64[D]` values or integer ordinals, in any order.
+    :param window: int -> window length in calendar days, at least 1.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :return: numpy.ndarray -> int64 count per date, in the shape of `dates`.
+    :raises ValueError: If the window is not positive or a window leaves the calendar horizon.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1 day")
+    ordinals = to_ordinals(dates)
+    if ordinals.size == 0:
+        return np.zeros(ordinals.shape, dtype=np.int64)
+
+    first_ordinal = int(ordinals.min()) - window + 1
+    end_ordinal = int(ordinals.max()) + 1
+    if first_ordinal < date(calendar.start_year, 1, 1).toordinal() or \
+            end_ordinal > date(calendar.end_year, 12, 31).toordinal() + 1:
+        raise ValueError(f"Windows must be within the calendar horizon {calendar.start_year}-{calendar.end_year}")
+
+    is_working_offset = np.zeros(NUMBER_OF_DAYS_IN_A_WEEK, dtype=bool)
+    is_working_offset[list(calendar.weekday_offsets)] = True
+    is_business_day = is_working_offset[np.arange(first_ordinal, end_ordinal) % NUMBER_OF_DAYS_IN_A_WEEK]
+    holiday_ordinals = calendar.holiday_arrays()[0]
+    holidays = holiday_ordinals[np.searchsorted(holiday_ordinals, first_ordinal, side="left"):
+                                np.searchsorted(holiday_ordinals, end_ordinal, side="left")]
+    is_business_day[holidays - first_ordinal] = False
+
+    cumulative = np.zeros(is_business_day.size + 1, dtype=np.int64)
+    np.cumsum(is_business_day, out=cumulative[1:])
+    return cumulative[ordinals - first_ordinal + 1] - cumulative[ordinals - first_ordinal - window + 1]
+
+
+def add_business_days_many(dates, business_days, calendar):
+    """
+    Vectorized form of `BusinessCalendar.add_business_days`: moves every date by its offset in business days,
+    backwards for negative offsets. Whole weeks are jumped arithmetically and holidays are resolved with one
+    searchsorted over the calendar's holiday positions.
+
+    :param dates: array-like of `datetime64[D]` values or integer ordinals.
+    :param business_days: array-like of int offsets, broadcastable against `dates`.
+    :param calendar: BusinessCalendar -> compiled holidays.
+    :return: numpy.ndarray -> resulting dates, `datetime64[D]` when the input was datetime64, ordinals otherwise.
+    :raises ValueError: If a date or a result lies outside the calendar horizon.
+    """
+    is_datetime = np.issubdtype(np.asarray(dates).dtype, np.datetime64)
+    ordinals, offsets = np.broadcast_arrays(to_ordinals(dates), np.asarray(business_days, dtype=np.int64))
+
+    horizon_start = date(calendar.start_year, 1, 1).toordinal()
+    horizon_end = date(calendar.end_year, 12, 31).toordinal()
+    if ordinals.size and (ordinals.min() < horizon_start or ordinals.max() > horizon_end):
+        raise ValueError(f"Dates must be within the calendar horizon {calendar.start_year}-{calendar.end_year}")
+
+    positions = np.where(offsets > 0,
+                         business_days_before(ordinals + 1, calendar) + offsets - 1,
+                         business_days_before(ordinals, calendar) + offsets)
+    result = np.where(offsets == 0, ordinals, business_day_ordinals(positions, calendar))
+
+    if result.size and (result.min() < horizon_start or result.max() > horizon_end):
+        raise ValueError(f"Results must be within the calendar horizon {calendar.start_year}-{calendar.end_year}")
+
+    if is_datetime:
+        return (result - UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+    return result
@@ -0,0 +1,549 @@
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import MAXYEAR, MINYEAR, date
+
+from src.date_utils import (DEFAULT_WEEKMASK, NUMBER_OF_DAYS_IN_A_WEEK, build_weekday_year_bitmap,
+                            normalize_weekmask, working_days_of)
+from src.factory import HolidayFactory, compile_rules
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_START_YEAR = 1900
+DEFAULT_END_YEAR = 2200
+# Ranges whose end lies at most this many years after their start are counted with bitmap popcounts.
+BITMAP_MAX_YEAR_SPAN = 1
+# Dates per array yielded by the chunked business-day iterators.
+DEFAULT_ITER_CHUNK_SIZE = 65536
+
+
+def rule_set_hash(public_holiday_list=None, holiday_rules=None):
+    """
+    Stable SHA-256 digest of a holiday rule set, used to tell whether a stored calendar was compiled from the same
+    static holidays and rules. Order and duplicates of the static holidays do not change the digest, and a rule
+    hashes the same as a dictionary or as a compiled HolidayRule.
+
+    :param public_holiday_list: list of date objects -> static public holidays (optional).
+    :param holiday_rules: list of dictionaries or HolidayRule objects -> rule based public holidays (optional).
+    :return: bytes -> 32-byte digest.
+    """
+    import hashlib
+    import json
+
+    rule_set = {
+        "public_holidays": sorted({holiday.isoformat() for holiday in public_holiday_list or []}),
+        "holiday_rules": [holiday_rule.as_dict() for holiday_rule in compile_rules(holiday_rules)],
+    }
+    return hashlib.sha256(json.dumps(rule_set, sort_keys=True).encode()).digest()
+
+
+def merge_business_ordinals(first_ordinal, end_ordinal, weekday_offsets, holiday_ordinals, holiday_index):
+    """
+    Generates the business-day ordinals in [first_ordinal, end_ordinal). Weekends are skipped by stepping through
+    the working-day offsets of each week, and holidays by a merge against the sorted holiday ordinals, which only
+    ever hold working days.
+
+    :param first_ordinal: int -> First ordinal of the range.
+    :param end_ordinal: int -> Ordinal just after the range.
+    :param weekday_offsets: tuple of int -> Working-day offsets within a week starting on an ordinal divisible by 7.
+    :param holiday_ordinals: sequence of int -> Sorted holiday ordinals.
+    :param holiday_index: int -> Index of the first holiday not before `first_ordinal`.
+    :return: generator of int -> Business-day ordinals in increasing order.
+    """
+    holiday_count = len(holiday_ordinals)
+    next_holiday = holiday_ordinals[holiday_index] if holiday_index < holiday_count else end_ordinal
+    week_start = first_ordinal - first_ordinal % NUMBER_OF_DAYS_IN_A_WEEK
+    while week_start < end_ordinal:
+        for offset in weekday_offsets:
+            ordinal = week_start + offset
+            if ordinal < first_ordinal:
+                continue
+            if ordinal >= end_ordinal:
+                return
+            if ordinal == next_holiday:
+                holiday_index += 1
+                next_holiday = holiday_ordinals[holiday_index] if holiday_index < holiday_count else end_ordinal
+                continue
+            yield ordinal
+        week_start += NUMBER_OF_DAYS_IN_A_WEEK
+
+
+class BusinessCalendar:
+    """
+    A compiled holiday calendar that answers business-day queries without re-expanding holiday rules.
+
+    The calendar is built once from a static `public_holiday_list` and/or `holiday_rules`. Every holiday that
+    falls on a working day of the weekmask inside the horizon is stored as a date ordinal in a sorted, deduplicated tuple. Because the
+    tuple is deduplicated, the bisect position of an ordinal is the cumulative count of holidays before it, so a
+    range query costs one weekday formula and two bisects regardless of how many holidays the calendar holds.
+
+    Each year of the horizon also has a 366-bit business-day bitmap, built on first use, so `is_business_day` is a
+    single bit test and short ranges are counted with masked popcounts. Ranges spanning several years add the
+    partial first and last years from the bitmaps to a difference of the cumulative per-year totals, so their cost
+    does not depend on the length of the range or the number of holidays.
+
+    A calendar is never modified by queries except to fill in these lazy structures, and each of those writes stores
+    the same value whichever thread makes it, so one calendar can be shared by threads (including on free-threaded
+    builds) without locks. `precompute()` builds them up front so that shared readers only read.
+
+    Attributes:
+        start_year (int): First year for which holiday rules are expanded.
+        end_year (int): Last year for which holiday rules are expanded.
+        weekmask (str): Working days of the week, Monday first.
+        rule_hash (bytes): `rule_set_hash` of the static holidays and rules the calendar was compiled from.
+        holiday_ordinals (tuple): Sorted, unique ordinals of holidays falling on working weekdays.
+        holiday_slots (tuple): Business-day position of each holiday, used to invert positions back to dates.
+        year_bitmaps (dict): Business-day bitmap per year, filled in by `year_bitmap()`.
+        year_business_days (tuple): Business days in each year of the horizon, built by `build_year_tables()`.
+        cumulative_business_days (tuple): Business days from the start of the horizon up to January 1st of each
+            year of the horizon and of the year after it, built by `build_year_tables()`.
+        version (int): Incremented on every change of the holidays; always 0 for this immutable calendar.
+
+    Methods:
+        is_business_day(): Checks whether a date is a business day.
+        business_days_between(): Counts business days strictly between two dates.
+        holidays_between(): Counts weekday holidays strictly between two dates.
+        business_days_before(): Cumulative number of business days before an ordinal.
+        business_day_ordinal(): Ordinal of the business day at a given position.
+        add_business_days(): Moves a date forwards or backwards by a number of business days.
+        iter_business_ordinals(): Lazily yields the business days strictly between two ordinals.
+    """
+
+    version = 0
+    numpy_holidays = None
+
+    def __init__(self, public_holiday_list=None, holiday_rules=None,
+                 start_year=DEFAULT_START_YEAR, end_year=DEFAULT_END_YEAR, weekmask=DEFAULT_WEEKMASK):
+        """
+        Builds the holiday index for the given horizon.
+
+        Args:
+            public_holiday_list (list): Static public holidays as date objects (optional).
+            holiday_rules (list): Rule dictionaries or compiled HolidayRule objects (optional).
+            start_year (int): First year for which holiday rules are expanded.
+            end_year (int): Last year for which holiday rules are expanded.
+            weekmask (str): Working days of the week, Monday first (see `DayUtils`).
+
+        Raises:
+            ValueError: If the horizon is invalid (see `set_horizon`) or the weekmask is invalid.
+        """
+        self.set_horizon(start_year, end_year)
+        self.set_weekmask(weekmask)
+        self.rule_hash = rule_set_hash(public_holiday_list, holiday_rules)
+
+        holiday_ordinals = set()
+        for holiday in public_holiday_list or []:
+            holiday_ordinals.add(holiday.toordinal())
+
+        if holiday_rules:
+            holiday_objects = HolidayFactory(holiday_rules=holiday_rules,
+                                             start_date=date(start_year, 1, 1),
+                                             end_date=date(end_year, 12, 31),
+                                             weekmask=self.weekmask).get_objects()
+            for holiday_object in holiday_objects:
+                for holiday in holiday_object.get_holiday():
+                    holiday_ordinals.add(holiday.toordinal())
+
+        self.set_holidays(holiday_ordinals)
+        logger.info("Compiled calendar for %d-%d with %d weekday holidays.",
+                    start_year, end_year, len(self.holiday_ordinals))
+
+    @classmethod
+    def from_ordinals(cls, holiday_ordinals, start_year=DEFAULT_START_YEAR, end_year=DEFAULT_END_YEAR,
+                      weekmask=DEFAULT_WEEKMASK, rule_hash=b""):
+        """
+        Builds a calendar directly from holiday ordinals, without expanding any rule. Used for calendars derived
+        from other calendars.
+
+        Args:
+            holiday_ordinals (iterable): Proleptic Gregorian ordinals of the holidays, in any order.
+            start_year (int): First year of the horizon.
+            end_year (int): Last year of the horizon.
+            weekmask (str): Working days of the week, Monday first.
+            rule_hash (bytes): Identity of the holiday source, see `rule_set_hash`.
+
+        Returns:
+            BusinessCalendar: The compiled calendar.
+
+        Raises:
+            ValueError: If the horizon is invalid (see `set_horizon`) or the weekmask is invalid.
+        """
+        calendar = cls.__new__(cls)
+        calendar.set_horizon(start_year, end_year)
+        calendar.set_weekmask(weekmask)
+        calendar.rule_hash = rule_hash
+        calendar.set_holidays(holiday_ordinals)
+        return calendar
+
+    def set_horizon(self, start_year, end_year):
+        """
+        Sets the horizon and the ordinal of January 1st of each of its years, plus the year after it.
+
+        :param start_year: int -> First year of the horizon.
+        :param end_year: int -> Last year of the horizon.
+        :raises ValueError: If `start_year` is after `end_year`, or the horizon is not within MINYEAR and MAXYEAR - 1
+                            (January 1st of the year after the horizon must be a valid date).
+        """
+        if start_year > end_year:
+            raise ValueError("start_year must not be after end_year")
+        if start_year < MINYEAR or end_year > MAXYEAR - 1:
+            raise ValueError(f"The calendar horizon must lie within {MINYEAR}-{MAXYEAR - 1}, got "
+                             f"{start_year}-{end_year}")
+        self.start_year = start_year
+        self.end_year = end_year
+        self.year_first_ordinals = tuple(date(year, 1, 1).toordinal() for year in range(start_year, end_year + 2))
+        self.reset_year_tables()
+
+    def set_weekmask(self, weekmask):
+        """
+        Sets the weekmask and the per-week tables derived from it, dropping any year bitmap built for another mask.
+
+        :param weekmask: Working days of the week, Monday first (see `DayUtils`).
+        :raises ValueError: If the weekmask is invalid.
+        """
+        self.weekmask = normalize_weekmask(weekmask)
+        self.working_days = working_days_of(self.weekmask)
+        self.weekdays_per_week = len(self.working_days)
+        # Ordinal 0 is a Sunday: count and list the working days of the week [0, 7) that starts there.
+        self.partial_week_weekdays = tuple(
+            sum(1 for offset in range(i) if (offset + 6) % NUMBER_OF_DAYS_IN_A_WEEK in self.working_days)
+            for i in range(NUMBER_OF_DAYS_IN_A_WEEK))
+        self.weekday_offsets = tuple(offset for offset in range(NUMBER_OF_DAYS_IN_A_WEEK)
+                                     if (offset + 6) % NUMBER_OF_DAYS_IN_A_WEEK in self.working_days)
+        self.year_bitmaps = {}
+        self.reset_year_tables()
+
+    def set_holidays(self, holiday_ordinals):
+        """
+        Indexes the holidays: keeps those on working days of the weekmask, sorted and unique, and computes the
+        business-day slot of each.
+
+        :param holiday_ordinals: iterable of int -> Proleptic Gregorian ordinals, in any order, duplicates allowed.
+        """
+        self.holiday_ordinals = tuple(sorted({ordinal for ordinal in holiday_ordinals
+                                              if self.is_weekday_ordinal(ordinal)}))
+        self.holiday_slots = tuple(self.weekdays_before(ordinal) - index
+                                   for index, ordinal in enumerate(self.holiday_ordinals))
+        self.numpy_holidays = None
+        self.year_bitmaps = {}
+        self.reset_year_tables()
+
+    def holiday_arrays(self):
+        """
+        NumPy copies of `holiday_ordinals` and `holiday_slots` for the vectorized functions in `src.batch`, built on
+        first use and rebuilt only after `version` changes. NumPy is imported here, so the calendar itself does not
+        depend on it.
+
+        :return: tuple -> (holiday ordinals, holiday slots) as read-only int64 arrays.
+        """
+        arrays = self.numpy_holidays
+        if arrays is None or arrays[2] != self.version:
+            import numpy as np
+
+            version = self.version
+            ordinals = np.array(self.holiday_ordinals, dtype=np.int64)
+            slots = np.array(self.holiday_slots, dtype=np.int64)
+            ordinals.flags.writeable = slots.flags.writeable = False
+            arrays = self.numpy_holidays = (ordinals, slots, version)
+        return arrays[0], arrays[1]
+
+    def reset_year_tables(self):
+        """
+        Drops the per-year totals; they are rebuilt on the next multi-year count.
+        """
+        self.year_business_days = None
+        self.cumulative_business_days = None
+
+    def build_year_tables(self):
+        """
+        Builds the business-day total of every year of the horizon and the cumulative table across years, with one
+        `business_days_before` per year boundary.
+
+        :return: tuple -> `cumulative_business_days`, entry i counting the business days from January 1st of
+                 start_year up to January 1st of start_year + i.
+        """
+        cumulative = self.cumulative_business_days
+        if cumulative is None:
+            first = self.business_days_before(self.year_first_ordinals[0])
+            cumulative = tuple(self.business_days_before(ordinal) - first for ordinal in self.year_first_ordinals)
+            self.year_business_days = tuple(cumulative[index + 1] - cumulative[index]
+                                            for index in range(len(cumulative) - 1))
+            self.cumulative_business_days = cumulative
+        return cumulative
+
+    def precompute(self):
+        """
+        Builds every year bitmap and the per-year tables now rather than on first use, e.g. before sharing the
+        calendar with worker threads.
+
+        :return: BusinessCalendar -> The calendar itself.
+        """
+        for year in range(self.start_year, self.end_year + 1):
+            self.year_bitmap(year)
+        self.build_year_tables()
+        return self
+
+    def business_days_in_year(self, year):
+        """
+        :param year: int -> A year inside the horizon.
+        :return: int -> Number of business days in the year.
+        """
+        self.build_year_tables()
+        return self.year_business_days[year - self.start_year]
+
+    def is_weekday_ordinal(self, ordinal):
+        """
+        Checks whether a date ordinal falls on a working day of the weekmask. Ordinal 1 (0001-01-01) is a Monday.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal of the date.
+        :return: bool -> True if the weekday of the ordinal is a working day.
+        """
+        return (ordinal + 6) % NUMBER_OF_DAYS_IN_A_WEEK in self.working_days
+
+    def weekdays_before(self, ordinal):
+        """
+        Counts working weekdays among all ordinals lower than `ordinal`, using whole weeks plus a partial week.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal.
+        :return: int -> Number of weekdays before the ordinal.
+        """
+        weeks, rest = divmod(ordinal, NUMBER_OF_DAYS_IN_A_WEEK)
+        return weeks * self.weekdays_per_week + self.partial_week_weekdays[rest]
+
+    def weekday_ordinal(self, weekday_position):
+        """
+        Inverse of `weekdays_before`: the ordinal of the weekday that has `weekday_position` weekdays before it.
+
+        :param weekday_position: int -> Zero-based index of the weekday.
+        :return: int -> Proleptic Gregorian ordinal.
+        """
+        weeks, rest = divmod(weekday_position, self.weekdays_per_week)
+        return weeks * NUMBER_OF_DAYS_IN_A_WEEK + self.weekday_offsets[rest]
+
+    def holidays_before(self, ordinal):
+        """
+        Cumulative number of weekday holidays strictly before `ordinal`.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal.
+        :return: int -> Number of holidays before the ordinal.
+        """
+        return bisect_left(self.holiday_ordinals, ordinal)
+
+    def business_days_before(self, ordinal):
+        """
+        Cumulative number of business days strictly before `ordinal`. The difference of two positions is the
+        number of business days in the half-open range between them.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal.
+        :return: int -> Business-day position of the ordinal.
+        """
+        return self.weekdays_before(ordinal) - self.holidays_before(ordinal)
+
+    def business_day_ordinal(self, position):
+        """
+        Inverse of `business_days_before`: the ordinal of the business day that has `position` business days
+        before it. Holiday i sits at business position `holiday_slots[i]`, so the number of holidays preceding the
+        target is one bisect over the slots; the target is then that many weekdays further along.
+
+        :param position: int -> Zero-based business-day position.
+        :return: int -> Proleptic Gregorian ordinal of a business day.
+        """
+        return self.weekday_ordinal(position + bisect_right(self.holiday_slots, position))
+
+    def year_bitmap(self, year):
+        """
+        Business-day bitmap of a year: the weekmask's working-day bitmap with the bits of the year's holidays
+        cleared. Built on first use and kept in `year_bitmaps`.
+
+        :param year: int -> A year inside the horizon.
+        :return: int -> Bitmap with bit i set when day i of the year (0 = January 1st) is a business day.
+        """
+        bitmap = self.year_bitmaps.get(year)
+        if bitmap is None:
+            first_ordinal = self.year_first_ordinals[year - self.start_year]
+            bitmap = build_weekday_year_bitmap(self.weekmask, year)
+            holidays = self.holiday_ordinals
+            for index in range(bisect_left(holidays, first_ordinal),
+                               bisect_left(holidays, self.year_first_ordinals[year - self.start_year + 1])):
+                bitmap &= ~(1 << (holidays[index] - first_ordinal))
+            self.year_bitmaps[year] = bitmap
+        return bitmap
+
+    def count_bitmap_range(self, start_ordinal, end_ordinal):
+        """
+        Counts business days in the half-open ordinal range [start_ordinal, end_ordinal) with one masked popcount
+        per year touched.
+
+        :param start_ordinal: int -> First ordinal of the range, inside the horizon.
+        :param end_ordinal: int -> Ordinal after the last one of the range, not lower than `start_ordinal`.
+        :return: int -> Number of business days.
+        """
+        count = 0
+        index = bisect_right(self.year_first_ordinals, start_ordinal) - 1
+        while True:
+            first_ordinal, next_ordinal = self.year_first_ordinals[index], self.year_first_ordinals[index + 1]
+            low = max(start_ordinal, first_ordinal) - first_ordinal
+            high = min(end_ordinal, next_ordinal) - first_ordinal
+            count += (self.year_bitmap(self.start_year + index) >> low & ((1 << (high - low)) - 1)).bit_count()
+            if end_ordinal <= next_ordinal:
+                return count
+            index += 1
+
+    def count_year_table_range(self, start_ordinal, end_ordinal):
+        """
+        Counts business days in the half-open ordinal range [start_ordinal, end_ordinal) spanning several years:
+        the partial first and last years come from their bitmaps, the years in between from the cumulative table.
+
+        :param start_ordinal: int -> First ordinal of the range, inside the horizon.
+        :param end_ordinal: int -> Ordinal after the last one of the range, inside the horizon and in a later year.
+        :return: int -> Number of business days.
+        """
+        cumulative = self.cumulative_business_days or self.build_year_tables()
+        year_first_ordinals = self.year_first_ordinals
+        start_index = bisect_right(year_first_ordinals, start_ordinal) - 1
+        end_index = bisect_right(year_first_ordinals, end_ordinal) - 1
+        # Days from start_ordinal to the end of its year, and from January 1st of the last year to end_ordinal.
+        first_year = self.year_bitmap(self.start_year + start_index) >> start_ordinal - year_first_ordinals[start_index]
+        last_year = (self.year_bitmap(self.start_year + end_index)
+                     & (1 << end_ordinal - year_first_ordinals[end_index]) - 1)
+        return first_year.bit_count() + cumulative[end_index] - cumulative[start_index + 1] + last_year.bit_count()
+
+    def is_business_day(self, day):
+        """
+        Checks whether a date is a business day: a working day of the weekmask that is not a holiday.
+
+        :param day: date object to check.
+        :return: bool -> True for a business day.
+        :raises ValueError: If the date is outside the calendar horizon.
+        """
+        self.check_horizon(day, day)
+        offset = day.toordinal() - self.year_first_ordinals[day.year - self.start_year]
+        return bool(self.year_bitmap(day.year) >> offset & 1)
+
+    def check_horizon(self, start_date, end_date):
+        """
+        Ensures a query lies inside the years for which holiday rules were expanded.
+
+        :param start_date: date object indicating the start date of the range.
+        :param end_date: date object indicating the end date of the range.
+        :raises ValueError: If either date is outside the calendar horizon.
+        """
+        if start_date.year < self.start_year or end_date.year > self.end_year:
+            raise ValueError(f"Dates must be within the calendar horizon {self.start_year}-{self.end_year}")
+
+    def check_ordinal_horizon(self, start_ordinal, end_ordinal):
+        """
+        Integer counterpart of `check_horizon`.
+
+        :param start_ordinal: int -> Proleptic Gregorian ordinal of the start date.
+        :param end_ordinal: int -> Proleptic Gregorian ordinal of the end date.
+        :raises ValueError: If either ordinal is outside the calendar horizon.
+        """
+        if start_ordinal < self.year_first_ordinals[0] or end_ordinal >= self.year_first_ordinals[-1]:
+            raise ValueError(f"Dates must be within the calendar horizon {self.start_year}-{self.end_year}")
+
+    def holidays_between(self, start_date, end_date):
+        """
+        Counts weekday holidays strictly between two dates.
+
+        :param start_date: date object indicating the start date of the range.
+        :param end_date: date object indicating the end date of the range.
+        :return: int -> Number of holidays in the range.
+        """
+        self.check_horizon(start_date, end_date)
+        start_ordinal, end_ordinal = start_date.toordinal(), end_date.toordinal()
+        if end_ordinal - start_ordinal <= 1:
+            return 0
+        return bisect_left(self.holiday_ordinals, end_ordinal) - bisect_right(self.holiday_ordinals, start_ordinal)
+
+    def business_days_between(self, start_date, end_date):
+        """
+        Counts business days strictly between two dates, matching `BusinessDayCounter.business_days_between_two_dates`.
+
+        :param start_date: date object indicating the start date of the range.
+        :param end_date: date object indicating the end date of the range.
+        :return: int -> Number of business days, 0 if the range is empty.
+        """
+        self.check_horizon(start_date, end_date)
+        start_ordinal, end_ordinal = start_date.toordinal(), end_date.toordinal()
+        if end_ordinal - start_ordinal <= 1:
+            return 0
+        if end_date.year - start_date.year <= BITMAP_MAX_YEAR_SPAN:
+            return self.count_bitmap_range(start_ordinal + 1, end_ordinal)
+        return self.count_year_table_range(start_ordinal + 1, end_ordinal)
+
+    def business_days_between_ordinals(self, start_ordinal, end_ordinal):
+        """
+        Integer counterpart of `business_days_between`: no date object is created.
+
+        :param start_ordinal: int -> Proleptic Gregorian ordinal of the start date.
+        :param end_ordinal: int -> Proleptic Gregorian ordinal of the end date.
+        :return: int -> Number of business days strictly between the two, 0 if the range is empty.
+        :raises ValueError: If either ordinal is outside the calendar horizon.
+        """
+        self.check_ordinal_horizon(start_ordinal, end_ordinal)
+        if end_ordinal - start_ordinal <= 1:
+            return 0
+        return self.count_year_table_range(start_ordinal + 1, end_ordinal)
+
+    def iter_business_ordinals(self, start_ordinal, end_ordinal):
+        """
+        Lazily yields the ordinals of the business days strictly between two ordinals, in increasing order. The
+        horizon is checked when the iterator is created; memory use does not depend on the length of the range.
+
+        :param start_ordinal: int -> Proleptic Gregorian ordinal of the start date.
+        :param end_ordinal: int -> Proleptic Gregorian ordinal of the end date.
+        :return: iterator of int -> Business-day ordinals, empty if the range is empty.
+        :raises ValueError: If either ordinal is outside the calendar horizon.
+        """
+        self.check_ordinal_horizon(start_ordinal, end_ordinal)
+        holiday_ordinals = self.holiday_ordinals
+        return merge_business_ordinals(start_ordinal + 1, end_ordinal, self.weekday_offsets, holiday_ordinals,
+                                       bisect_right(holiday_ordinals, start_ordinal))
+
+    def add_business_days(self, start_date, business_days):
+        """
+        Returns the date `business_days` business days after `start_date`, or before it when negative.
+
+        Offsets use the same semantics as the counting path: for a positive offset n the result is the n-th
+        business day after `start_date`, so `business_days_between(start_date, result)` is n - 1.
+
+        :param start_date: date object to move from.
+        :param business_days: int -> Number of business days to move, may be negative.
+        :return: date -> The resulting business day, `start_date` itself when the offset is 0.
+        :raises ValueError: If the start date or the result is outside the calendar horizon.
+        """
+        self.check_horizon(start_date, start_date)
+        if business_days == 0:
+            return start_date
+        return date.fromordinal(self.add_business_days_ordinal(start_date.toordinal(), business_days))
+
+    def add_business_days_ordinal(self, ordinal, business_days):
+        """
+        Integer counterpart of `add_business_days`: no date object is created.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal to move from.
+        :param business_days: int -> Number of business days to move, may be negative.
+        :return: int -> Ordinal of the resulting business day, `ordinal` itself when the offset is 0.
+        :raises ValueError: If the start or the result is outside the calendar horizon.
+        """
+        self.check_ordinal_horizon(ordinal, ordinal)
+        if business_days == 0:
+            return ordinal
+        if business_days > 0:
+            position = self.business_days_before(ordinal + 1) + business_days - 1
+        else:
+            position = self.business_days_before(ordinal) + business_days
+
+        result = self.business_day_ordinal(position)
+        self.check_ordinal_horizon(result, result)
+        return result
+
+    def subtract_business_days(self, start_date, business_days):
+        """
+        Returns the date `business_days` business days before `start_date`.
+
+        :param start_date: date object to move from.
+        :param business_days: int -> Number of business days to move back.
+        :return: date -> The resulting business day.
+        """
+        return self.add_business_days(start_date, -business_days)
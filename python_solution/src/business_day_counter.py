@@ -1,12 +1,103 @@
 import logging
-from src.factory import HolidayFactory
+from datetime import MAXYEAR, MINYEAR, date
+from functools import lru_cache
+from itertools import chain
+from src.business_calendar import BusinessCalendar, DEFAULT_ITER_CHUNK_SIZE
+from src.date_utils import NUMBER_OF_DAYS_IN_A_WEEK, PROLEPTIC, epoch_offset
+from src.factory import HolidayFactory, compile_rules, rule_set_key
+from src.profiling import ACTIVE_PROFILER, GET_HOLIDAYS
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+COUNTER_NAMES = ("calls", "zero_range_returns", "holidays_subtracted", "errors")
+# Calendars compiled by the offset API for an estimated horizon, kept for the next query on the same holidays.
+OFFSET_CALENDARS_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=OFFSET_CALENDARS_CACHE_SIZE)
+def compile_offset_calendar(public_holidays, holiday_rules, start_year, end_year, weekmask):
+    """
+    Memoized BusinessCalendar of the offset API. Calendars are immutable once compiled, so one instance can serve
+    every counter and thread.
+
+    :param public_holidays: tuple of date objects -> static public holidays.
+    :param holiday_rules: tuple of (HolidayRule, description) pairs, as compiled by `compile_rules`.
+    :param start_year: int -> First year of the horizon.
+    :param end_year: int -> Last year of the horizon.
+    :param weekmask: str -> A canonical weekmask.
+    :return: BusinessCalendar
+    """
+    return BusinessCalendar(public_holiday_list=public_holidays,
+                            holiday_rules=[holiday_rule for holiday_rule, description in holiday_rules],
+                            start_year=start_year, end_year=end_year, weekmask=weekmask)
+
+
 class BusinessDayCounter:
-    def __init__(self, day_utils_obj):
+    def __init__(self, day_utils_obj, quiet=False, result_cache=None):
+        """
+        :param day_utils_obj: DayUtils object used for the date arithmetic.
+        :param quiet: bool -> fast-path mode. No log record or message string is built per query; activity is
+                      only reflected in the aggregate counters returned by get_counters().
+        :param result_cache: ResultCache -> memoizes business_days_between_two_dates by date pair and holiday
+                             source (optional). May be shared by counters; the key includes the weekmask.
+        """
         self.day_utils_obj = day_utils_obj
+        self.quiet = quiet
+        self.result_cache = result_cache
+        self.counters = dict.fromkeys(COUNTER_NAMES, 0)
+
+    def get_counters(self):
+        """
+        Returns a snapshot of the aggregate counters: calls, zero-range returns, holidays subtracted and
+        swallowed errors.
+
+        :return: dict
+        """
+        return dict(self.counters)
+
+    def reset_counters(self):
+        """
+        Resets every aggregate counter to 0.
+        """
+        self.counters = dict.fromkeys(COUNTER_NAMES, 0)
+
+    def check_calendar(self, calendar, public_holiday_list=None, holiday_rules=None):
+        """
+        Ensures a compiled calendar is not mixed with ad-hoc holidays and uses the same weekmask as the DayUtils
+        object, so weekend and holiday counts agree.
+
+        :param calendar: BusinessCalendar or None.
+        :param public_holiday_list: A list of datetime objects representing static public holidays (optional).
+        :param holiday_rules: A list of dictionaries containing rules for dynamic holiday generation (optional).
+        :raises ValueError: If the arguments are inconsistent.
+        """
+        if calendar is None:
+            return
+        if public_holiday_list or holiday_rules:
+            raise ValueError("Pass either a calendar or public_holiday_list/holiday_rules, not both.")
+        if calendar.weekmask != self.day_utils_obj.weekmask:
+            raise ValueError(f"Calendar weekmask {calendar.weekmask} does not match DayUtils weekmask "
+                             f"{self.day_utils_obj.weekmask}.")
+
+    def get_quiet_total_days(self, start_date, end_date):
+        """
+        Fast-path counterpart of get_total_days: validates and counts the days strictly between two dates
+        without logging.
+
+        :param start_date: datetime object indicating the start date of the range.
+        :param end_date: datetime object indicating the end date of the range.
+
+        :return: int - The number of days between the two dates, 0 for empty, reversed or invalid ranges.
+        """
+        if not isinstance(start_date, date) or not isinstance(end_date, date):
+            self.counters["errors"] += 1
+            return 0
+
+        total_days = end_date.toordinal() - start_date.toordinal() - 1
+        if total_days <= 0:
+            self.counters["zero_range_returns"] += 1
+            return 0
+        return total_days
 
     def get_total_days(self, start_date, end_date, total_days):
         """
@@ -40,17 +131,22 @@ class BusinessDayCounter:
 
             :return: int - The updated count of public holidays after considering static holidays and rule-generated holidays.
             """
+        profiler = ACTIVE_PROFILER.get()
+        if profiler is not None:
+            token = profiler.start()
 
-        if public_holiday_list:
-            public_holidays += self.day_utils_obj.calculate_public_holidays(start_date=start_date, end_date=end_date,
-                                                                   public_holiday_list=public_holiday_list)
+        # Static and rule-generated holidays are counted in one pass, so a date produced twice is subtracted once.
+        holidays = public_holiday_list
         if holiday_rules:
-            holiday_objects = HolidayFactory(start_date=start_date, end_date=end_date,
-                                                     holiday_rules=holiday_rules).get_objects()
-
-            public_holiday_generated_by_rules = [item for sublist in holiday_objects for item in sublist.get_holiday()]
+            public_holiday_generated_by_rules = HolidayFactory(start_date=start_date, end_date=end_date,
+                                                               holiday_rules=holiday_rules,
+                                                               weekmask=self.day_utils_obj.weekmask).iter_holidays()
+            holidays = chain(public_holiday_list or (), public_holiday_generated_by_rules)
+        if public_holiday_list or holiday_rules:
             public_holidays += self.day_utils_obj.calculate_public_holidays(start_date=start_date, end_date=end_date,
-                                                                   public_holiday_list=public_holiday_generated_by_rules)
+                                                                            public_holiday_list=holidays)
+        if profiler is not None:
+            profiler.stop(GET_HOLIDAYS, token)
         return public_holidays
 
     def weekdays_between_two_dates(self, start_date, end_date):
@@ -60,44 +156,443 @@ class BusinessDayCounter:
         :param end_date: @type object -> datetime, which indicates start date of between two dates.
         :return: @types int
         """
-        logging.info(f"Calculating weekdays between {start_date} and {end_date}.")
+        self.counters["calls"] += 1
+        if self.quiet:
+            total_days = self.get_quiet_total_days(start_date=start_date, end_date=end_date)
+            if total_days == 0: return 0
+            return total_days - self.day_utils_obj.count_weekend_days(start_date=start_date, total_days=total_days)
+
+        logger.info("Calculating weekdays between %s and %s.", start_date, end_date)
 
         total_days = 0
         total_days += self.get_total_days(start_date=start_date, end_date=end_date, total_days=total_days)
-        if total_days == 0: return 0
+        if total_days == 0:
+            self.counters["zero_range_returns"] += 1
+            return 0
 
         total_weekend_days = self.day_utils_obj.total_weekend_days_count(start_date=start_date, total_days=total_days)
         total_week_days = total_days - total_weekend_days
 
-        logging.info(f"Total days: {total_days}, Weekend days: {total_weekend_days}, Weekdays: {total_week_days}")
+        logger.info("Total days: %s, Weekend days: %s, Weekdays: %s", total_days, total_weekend_days, total_week_days)
 
         return total_week_days
 
-    def business_days_between_two_dates(self, start_date, end_date, public_holiday_list=None, holiday_rules=None):
+    def business_days_between_two_dates(self, start_date, end_date, public_holiday_list=None, holiday_rules=None,
+                                        calendar=None):
         """
              This methods calculates the number of business days between two dates up to some conditions.
              :param start_date: @type object -> datetime, which indicates start date of between two dates.
              :param end_date: @type object -> datetime, which indicates start date of between two dates.
              :param public_holiday_list: @type list of datetimes -> static public holidays.
              :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+
+             :return: @types int
+             """
+        self.check_calendar(calendar, public_holiday_list=public_holiday_list, holiday_rules=holiday_rules)
+
+        self.counters["calls"] += 1
+        if self.result_cache is not None:
+            key = self.result_cache_key(start_date, end_date, public_holiday_list=public_holiday_list,
+                                        holiday_rules=holiday_rules, calendar=calendar)
+            if key is not None:
+                return self.result_cache.get_or_compute(key, lambda: self.count_business_days(
+                    start_date, end_date, public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                    calendar=calendar))
+        return self.count_business_days(start_date, end_date, public_holiday_list=public_holiday_list,
+                                        holiday_rules=holiday_rules, calendar=calendar)
+
+    def result_cache_key(self, start_date, end_date, public_holiday_list=None, holiday_rules=None, calendar=None):
+        """
+        Builds the result cache key of a query: the date pair, the weekmask and the identity of the holiday source.
+        A calendar is identified by the object and its `version`, so a mutated calendar misses; ad-hoc holidays by
+        the holiday tuple and `rule_set_key` of the rules, which ignores descriptions.
+
+        :param start_date: datetime object indicating the start date of the range.
+        :param end_date: datetime object indicating the end date of the range.
+        :param public_holiday_list: A list of datetime objects representing static public holidays (optional).
+        :param holiday_rules: A list of dictionaries containing rules for dynamic holiday generation (optional).
+        :param calendar: BusinessCalendar or None.
+
+        :return: tuple, or None when the query cannot be cached (unhashable arguments or malformed rules).
+        """
+        try:
+            if calendar is not None:
+                source = (calendar, calendar.version)
+            else:
+                source = (tuple(public_holiday_list or ()), rule_set_key(holiday_rules))
+            key = (start_date, end_date, self.day_utils_obj.weekmask, source)
+            hash(key)
+        except (AttributeError, TypeError):
+            return None
+        return key
+
+    def count_business_days(self, start_date, end_date, public_holiday_list=None, holiday_rules=None,
+                            calendar=None):
+        """
+             Uncached body of business_days_between_two_dates.
+             :param start_date: @type object -> datetime, which indicates start date of between two dates.
+             :param end_date: @type object -> datetime, which indicates start date of between two dates.
+             :param public_holiday_list: @type list of datetimes -> static public holidays.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
 
              :return: @types int
              """
-        logging.info(f"Business days between {start_date} and {end_date}.")
+        if self.quiet:
+            return self.quiet_business_days_between_two_dates(start_date, end_date,
+                                                              public_holiday_list=public_holiday_list,
+                                                              holiday_rules=holiday_rules, calendar=calendar)
+
+        logger.info("Business days between %s and %s.", start_date, end_date)
         total_days, public_holidays = 0, 0
 
         total_days += self.get_total_days(start_date=start_date, end_date=end_date, total_days=total_days)
-        if total_days == 0: return 0
+        if total_days == 0:
+            self.counters["zero_range_returns"] += 1
+            return 0
 
         total_weekend_days = self.day_utils_obj.total_weekend_days_count(start_date=start_date, total_days=total_days)
         try:
-            public_holidays += self.get_holidays(start_date=start_date, end_date=end_date, public_holidays=public_holidays,
-                                                 public_holiday_list=public_holiday_list, holiday_rules=holiday_rules)
+            if calendar is not None:
+                public_holidays += calendar.holidays_between(start_date=start_date, end_date=end_date)
+            else:
+                public_holidays += self.get_holidays(start_date=start_date, end_date=end_date,
+                                                     public_holidays=public_holidays,
+                                                     public_holiday_list=public_holiday_list,
+                                                     holiday_rules=holiday_rules)
             total_business_days = total_days - total_weekend_days - public_holidays
-            logging.info(f"Total days: {total_days}, Weekend days: {total_weekend_days}, Business: {total_business_days}")
+            self.counters["holidays_subtracted"] += public_holidays
+            logger.info("Total days: %s, Weekend days: %s, Business: %s",
+                        total_days, total_weekend_days, total_business_days)
 
             return total_business_days
 
         except Exception as e:
+            self.counters["errors"] += 1
             logger.error(e)
             return 0
+
+    def quiet_business_days_between_two_dates(self, start_date, end_date, public_holiday_list=None,
+                                              holiday_rules=None, calendar=None):
+        """
+             Fast-path body of business_days_between_two_dates used in quiet mode. It gives the same results but
+             builds no log records or message strings; errors and empty ranges only update the counters.
+             :param start_date: @type object -> datetime, which indicates start date of between two dates.
+             :param end_date: @type object -> datetime, which indicates start date of between two dates.
+             :param public_holiday_list: @type list of datetimes -> static public holidays.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+
+             :return: @types int
+             """
+        total_days = self.get_quiet_total_days(start_date=start_date, end_date=end_date)
+        if total_days == 0: return 0
+
+        try:
+            total_weekend_days = self.day_utils_obj.count_weekend_days(start_date=start_date, total_days=total_days)
+            if calendar is not None:
+                public_holidays = calendar.holidays_between(start_date=start_date, end_date=end_date)
+            else:
+                holidays = public_holiday_list or ()
+                if holiday_rules:
+                    holidays = chain(holidays, HolidayFactory(
+                        start_date=start_date, end_date=end_date, holiday_rules=holiday_rules, quiet=True,
+                        weekmask=self.day_utils_obj.weekmask).iter_holidays())
+                public_holidays = self.day_utils_obj.count_public_holidays(
+                    start_date=start_date, end_date=end_date, public_holiday_list=holidays)
+        except Exception:
+            self.counters["errors"] += 1
+            return 0
+
+        self.counters["holidays_subtracted"] += public_holidays
+        return total_days - total_weekend_days - public_holidays
+
+    def weekdays_between_ordinals(self, start_ordinal, end_ordinal, epoch=PROLEPTIC):
+        """
+             Integer counterpart of weekdays_between_two_dates for data that arrives as day numbers. No date object
+             or log record is created; activity is only reflected in the aggregate counters.
+             :param start_ordinal: @type int -> day number of the start date.
+             :param end_ordinal: @type int -> day number of the end date.
+             :param epoch: @type str -> PROLEPTIC (date.toordinal()) or UNIX_EPOCH (days since 1970-01-01).
+
+             :return: @types int
+             """
+        self.counters["calls"] += 1
+        total_days = self.day_utils_obj.days_count_between_ordinals(start_ordinal, end_ordinal)
+        if total_days == 0:
+            self.counters["zero_range_returns"] += 1
+            return 0
+        return total_days - self.day_utils_obj.count_weekend_days_ordinal(start_ordinal, total_days, epoch)
+
+    def business_days_between_ordinals(self, start_ordinal, end_ordinal, public_holiday_list=None,
+                                       holiday_rules=None, calendar=None, epoch=PROLEPTIC):
+        """
+             Integer counterpart of business_days_between_two_dates, with the semantics of the quiet mode: errors
+             and empty ranges return 0 and only update the counters. With a calendar or a holiday list no date object
+             is created; holiday_rules are expanded as dates, so compile them into a calendar for the hot path.
+             :param start_ordinal: @type int -> day number of the start date.
+             :param end_ordinal: @type int -> day number of the end date.
+             :param public_holiday_list: @type list of int -> static public holidays, as day numbers of the same epoch.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+             :param epoch: @type str -> PROLEPTIC (date.toordinal()) or UNIX_EPOCH (days since 1970-01-01).
+
+             :return: @types int
+             """
+        self.check_calendar(calendar, public_holiday_list=public_holiday_list, holiday_rules=holiday_rules)
+
+        self.counters["calls"] += 1
+        total_days = self.day_utils_obj.days_count_between_ordinals(start_ordinal, end_ordinal)
+        if total_days == 0:
+            self.counters["zero_range_returns"] += 1
+            return 0
+
+        try:
+            offset = epoch_offset(epoch)
+            total_weekend_days = self.day_utils_obj.count_weekend_days_ordinal(start_ordinal, total_days, epoch)
+            if calendar is not None:
+                start_ordinal, end_ordinal = start_ordinal + offset, end_ordinal + offset
+                calendar.check_ordinal_horizon(start_ordinal, end_ordinal)
+                public_holidays = calendar.holidays_before(end_ordinal) - calendar.holidays_before(start_ordinal + 1)
+            else:
+                holiday_ordinals = public_holiday_list or ()
+                if holiday_rules:
+                    holidays = HolidayFactory(start_date=date.fromordinal(start_ordinal + offset),
+                                              end_date=date.fromordinal(end_ordinal + offset),
+                                              holiday_rules=holiday_rules, quiet=True,
+                                              weekmask=self.day_utils_obj.weekmask).iter_holidays()
+                    holiday_ordinals = chain(holiday_ordinals, (holiday.toordinal() - offset for holiday in holidays))
+                public_holidays = self.day_utils_obj.count_public_holidays_ordinal(
+                    start_ordinal, end_ordinal, holiday_ordinals, epoch)
+        except Exception:
+            self.counters["errors"] += 1
+            return 0
+
+        self.counters["holidays_subtracted"] += public_holidays
+        return total_days - total_weekend_days - public_holidays
+
+    def business_days_between_many(self, starts, ends, public_holiday_list=None, holiday_rules=None, calendar=None,
+                                   return_mask=False):
+        """
+             This methods calculates the number of business days for arrays of date pairs in one vectorized pass.
+             Rows are neither logged nor validated one by one; invalid rows (start >= end) produce 0.
+             :param starts: @type numpy array of datetime64[D] or int ordinals -> start dates.
+             :param ends: @type numpy array of datetime64[D] or int ordinals -> end dates.
+             :param public_holiday_list: @type list of datetimes -> static public holidays.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+             :param return_mask: @type bool -> also return the boolean mask of valid rows.
+
+             :return: @types numpy array of int, or (counts, mask) when return_mask is True
+             """
+        # NumPy is only needed by the batch API, so it is imported on first use.
+        from src.batch import business_days_between_many
+
+        self.check_calendar(calendar)
+        return business_days_between_many(starts, ends, calendar=calendar, public_holiday_list=public_holiday_list,
+                                          holiday_rules=holiday_rules, return_mask=return_mask,
+                                          weekmask=self.day_utils_obj.weekmask)
+
+    def business_day_distance_matrix(self, dates, calendar, condensed=False, dtype="int64"):
+        """
+             This methods calculates the number of business days between every pair of N dates. Each date's
+             cumulative business-day position is computed once and the N x N counts are filled in as array
+             differences, instead of N^2 calls to business_days_between_two_dates.
+             :param dates: @type numpy array of datetime64[D] or int ordinals -> the N dates.
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+             :param condensed: @type bool -> return the upper triangle, row by row, instead of the full matrix.
+             :param dtype: @type numpy dtype -> of the result, "int32" halves the memory of a large matrix.
+
+             :return: @types numpy array -> [i, j] is business_days_between_two_dates(dates[i], dates[j]).
+             """
+        from src.batch import business_day_distance_matrix
+
+        self.check_calendar(calendar)
+        return business_day_distance_matrix(dates, calendar, condensed=condensed, dtype=dtype)
+
+    def rolling_business_days(self, dates, window, calendar):
+        """
+             This methods calculates, for every date of a series, the number of business days in the trailing
+             window of `window` calendar days ending on that date (the date included), e.g. "business days in the
+             last 30 days". The windows are slid in one pass over the calendar's cumulative business-day index.
+             :param dates: @type numpy array of datetime64[D] or int ordinals -> the series dates, in any order.
+             :param window: @type int -> window length in calendar days.
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+
+             :return: @types numpy array of int -> [k] equals business_days_between_two_dates(dates[k] - window,
+                      dates[k] + 1 day).
+             """
+        from src.batch import rolling_business_days
+
+        self.check_calendar(calendar)
+        return rolling_business_days(dates, window, calendar)
+
+    def iter_business_days(self, start_date, end_date, calendar, as_ordinals=False):
+        """
+             This methods lazily yields the business days strictly between start_date and end_date, following the
+             counting semantics: the dates yielded are exactly those counted by business_days_between_two_dates.
+             Weekends are skipped arithmetically and holidays by merging against the calendar's sorted holidays, so
+             a range of any length is iterated in constant memory.
+             :param start_date: @type object -> datetime, start of the range (excluded).
+             :param end_date: @type object -> datetime, end of the range (excluded).
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+             :param as_ordinals: @type bool -> yield date.toordinal() values instead of date objects.
+
+             :return: @types iterator of date (or int)
+             """
+        self.check_calendar(calendar)
+        if not self.quiet:
+            logger.info("Iterating business days between %s and %s.", start_date, end_date)
+        ordinals = calendar.iter_business_ordinals(start_date.toordinal(), end_date.toordinal())
+        return ordinals if as_ordinals else map(date.fromordinal, ordinals)
+
+    def iter_business_day_chunks(self, start_date, end_date, calendar, chunk_size=DEFAULT_ITER_CHUNK_SIZE,
+                                 as_ordinals=False):
+        """
+             Chunked form of iter_business_days for long ranges: yields NumPy arrays of at most chunk_size business
+             days, each computed in one vectorized pass, so the whole range is never materialized.
+             :param start_date: @type object -> datetime, start of the range (excluded).
+             :param end_date: @type object -> datetime, end of the range (excluded).
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+             :param chunk_size: @type int -> maximum number of dates per array.
+             :param as_ordinals: @type bool -> yield int64 ordinals instead of datetime64[D] arrays.
+
+             :return: @types iterator of numpy array
+             """
+        from src.batch import iter_business_day_chunks
+
+        self.check_calendar(calendar)
+        if not self.quiet:
+            logger.info("Iterating business days between %s and %s in chunks of %s.", start_date, end_date,
+                        chunk_size)
+        return iter_business_day_chunks(start_date.toordinal(), end_date.toordinal(), calendar,
+                                        chunk_size=chunk_size, as_ordinals=as_ordinals)
+
+    def get_offset_calendar(self, start_date, business_days, public_holiday_list=None, holiday_rules=None,
+                            calendar=None, span=None):
+        """
+        Returns the calendar used by the offset API, compiling one around `start_date` when none is given.
+        By default the compiled horizon is sized from the working days of the weekmask less one day per holiday
+        rule, per year, and the calendar is memoized for the next query on the same holidays; `add_business_days`
+        widens it when static holidays make that estimate too small. A start date after MAXYEAR - 1, or an offset
+        with more business days than there are weekdays up to the edge of the supported range, fails before
+        anything is compiled.
+
+        :param start_date: datetime object to move from.
+        :param business_days: int -> Number of business days to move, may be negative.
+        :param public_holiday_list: A list of datetime objects representing static public holidays (optional).
+        :param holiday_rules: A list of dictionaries containing rules for dynamic holiday generation (optional).
+        :param calendar: BusinessCalendar -> precompiled holidays (optional).
+        :param span: int -> Years compiled on each side of `start_date`, overriding the estimate (optional).
+
+        :return: BusinessCalendar
+        :raises ValueError: If the result cannot lie within MINYEAR and MAXYEAR - 1.
+        """
+        if calendar is not None:
+            self.check_calendar(calendar, public_holiday_list=public_holiday_list, holiday_rules=holiday_rules)
+            return calendar
+
+        # The calendar indexes January 1st of the year after its horizon, so the last usable year is MAXYEAR - 1.
+        last_day = date(MAXYEAR - 1, 12, 31)
+        if start_date > last_day:
+            raise ValueError(f"Offsets are supported up to {last_day}, got {start_date}")
+        edge = date(MINYEAR, 1, 1) if business_days < 0 else last_day
+        weekdays_per_week = len(self.day_utils_obj.working_days)
+        if abs(business_days) > (abs(edge - start_date).days // NUMBER_OF_DAYS_IN_A_WEEK + 1) * weekdays_per_week:
+            raise ValueError(f"Moving {start_date} by {business_days} business days leaves the supported range "
+                             f"{MINYEAR}-{MAXYEAR - 1}")
+
+        key = None
+        if span is None:
+            business_days_per_year = max(weekdays_per_week * 52 - len(holiday_rules or []), 1)
+            span = abs(business_days) // business_days_per_year + 1
+            try:
+                rules = tuple((holiday_rule, holiday_rule.description) for holiday_rule in compile_rules(holiday_rules))
+                key = (tuple(public_holiday_list or ()), rules)
+                hash(key)
+            except TypeError:
+                key = None
+        start_year, end_year = max(start_date.year - span, MINYEAR), min(start_date.year + span, MAXYEAR - 1)
+        if key is not None:
+            return compile_offset_calendar(*key, start_year, end_year, self.day_utils_obj.weekmask)
+        return BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                start_year=start_year, end_year=end_year, weekmask=self.day_utils_obj.weekmask)
+
+    def add_business_days(self, start_date, business_days, public_holiday_list=None, holiday_rules=None,
+                          calendar=None):
+        """
+             This methods returns the date which is `business_days` business days after start_date ("T+N").
+             Weekends and holidays follow the counting semantics, so business_days_between_two_dates(start_date,
+             result) equals business_days - 1 for a positive offset. Without a calendar the first horizon is taken
+             from the shared offset calendar cache and then doubled until it holds the result; offsets that cannot
+             fit within years 1-9998 fail before anything is compiled.
+             :param start_date: @type object -> datetime, the date to move from.
+             :param business_days: @type int -> number of business days to move, negative moves backwards.
+             :param public_holiday_list: @type list of datetimes -> static public holidays.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+
+             :return: @types date
+             :raises ValueError: If the result falls outside the supported range or the calendar horizon.
+             """
+        if not self.quiet:
+            logger.info("Adding %s business days to %s.", business_days, start_date)
+        span = None
+        while True:
+            offset_calendar = self.get_offset_calendar(start_date=start_date, business_days=business_days,
+                                                       public_holiday_list=public_holiday_list,
+                                                       holiday_rules=holiday_rules, calendar=calendar, span=span)
+            try:
+                return offset_calendar.add_business_days(start_date, business_days)
+            except ValueError:
+                at_limit = (offset_calendar.start_year == MINYEAR if business_days < 0
+                            else offset_calendar.end_year == MAXYEAR - 1)
+                if calendar is not None or at_limit:
+                    raise
+                span = 2 * (start_date.year - offset_calendar.start_year if business_days < 0
+                            else offset_calendar.end_year - start_date.year)
+
+    def subtract_business_days(self, start_date, business_days, public_holiday_list=None, holiday_rules=None,
+                               calendar=None):
+        """
+             This methods returns the date which is `business_days` business days before start_date ("T-N").
+             :param start_date: @type object -> datetime, the date to move from.
+             :param business_days: @type int -> number of business days to move back.
+             :param public_holiday_list: @type list of datetimes -> static public holidays.
+             :param holiday_rules: @type list of dictionary -> ruled based public holidays .
+             :param calendar: @type BusinessCalendar -> precompiled holidays, replaces public_holiday_list and holiday_rules.
+
+             :return: @types date
+             """
+        return self.add_business_days(start_date, -business_days, public_holiday_list=public_holiday_list,
+                                      holiday_rules=holiday_rules, calendar=calendar)
+
+    def add_business_days_ordinal(self, start_ordinal, business_days, calendar, epoch=PROLEPTIC):
+        """
+             Integer counterpart of add_business_days: moves a day number by a number of business days without
+             creating a date object. Unlike the date form it needs a compiled calendar.
+             :param start_ordinal: @type int -> day number to move from.
+             :param business_days: @type int -> number of business days to move, negative moves backwards.
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+             :param epoch: @type str -> PROLEPTIC (date.toordinal()) or UNIX_EPOCH (days since 1970-01-01).
+
+             :return: @types int -> day number of the result, in the same epoch.
+             """
+        self.check_calendar(calendar)
+        offset = epoch_offset(epoch)
+        return calendar.add_business_days_ordinal(start_ordinal + offset, business_days) - offset
+
+    def add_business_days_many(self, dates, business_days, calendar):
+        """
+             This methods moves arrays of dates by arrays of business-day offsets in one vectorized pass.
+             :param dates: @type numpy array of datetime64[D] or int ordinals -> dates to move from.
+             :param business_days: @type numpy array of int -> offsets, negative moves backwards.
+             :param calendar: @type BusinessCalendar -> precompiled holidays.
+
+             :return: @types numpy array of datetime64[D] (or ordinals when ordinals were given)
+             """
+        from src.batch import add_business_days_many
+
+        self.check_calendar(calendar)
+        return add_business_days_many(dates, business_days, calendar=calendar)
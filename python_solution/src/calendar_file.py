@@ -0,0 +1,174 @@
+"""
+Compact binary calendar files.
+
+A compiled BusinessCalendar is stored as a fixed little-endian header followed by two packed int32 arrays: the sorted
+holiday ordinals and the business-day position (slot) of each holiday. `MappedBusinessCalendar` maps the file
+read-only and runs the usual bisect queries directly against the mapped buffer, so loading costs one `open` and
+processes on the same host share the page cache instead of each holding its own tuples.
+
+Layout (version 1)::
+
+    magic        4s   b"BDCL"
+    version      H
+    weekmask     B    bit i set when weekday i (Monday = 0) is a working day
+    (padding)    x
+    start_year   i
+    end_year     i
+    count        I    number of holidays
+    rule_hash    32s  rule_set_hash() of the source holidays and rules
+    ordinals     count * int32
+    slots        count * int32
+"""
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from src.business_calendar import BusinessCalendar, DEFAULT_END_YEAR, DEFAULT_START_YEAR, rule_set_hash
+from src.date_utils import DEFAULT_WEEKMASK, NUMBER_OF_DAYS_IN_A_WEEK, normalize_weekmask
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BDCL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHBxiiI32s")
+INT32 = struct.Struct("<i")
+
+
+def weekmask_to_bits(weekmask):
+    """
+    :param weekmask: str -> canonical weekmask, Monday first.
+    :return: int -> bit i set when weekday i is a working day.
+    """
+    return sum(1 << weekday for weekday, working in enumerate(weekmask) if working == "1")
+
+
+def bits_to_weekmask(bits):
+    """
+    :param bits: int -> weekmask bits as written by `weekmask_to_bits`.
+    :return: str -> canonical weekmask, Monday first.
+    """
+    return "".join("1" if bits >> weekday & 1 else "0" for weekday in range(NUMBER_OF_DAYS_IN_A_WEEK))
+
+
+def write_calendar_file(calendar, path):
+    """
+    Writes a compiled calendar to `path` atomically: the file is written next to the target and renamed over it,
+    so readers never map a partially written file.
+
+    :param calendar: BusinessCalendar (or MappedBusinessCalendar) to store.
+    :param path: Destination path.
+    """
+    count = len(calendar.holiday_ordinals)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, weekmask_to_bits(calendar.weekmask), calendar.start_year,
+                         calendar.end_year, count, calendar.rule_hash)
+    array_format = struct.Struct(f"<{count}i")
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as calendar_file:
+        calendar_file.write(header)
+        calendar_file.write(array_format.pack(*calendar.holiday_ordinals))
+        calendar_file.write(array_format.pack(*calendar.holiday_slots))
+    os.replace(temporary_path, path)
+    logger.info("Wrote calendar %d-%d with %d holidays to %s.", calendar.start_year, calendar.end_year, count, path)
+
+
+def read_calendar_header(path):
+    """
+    Reads and validates the header of a calendar file without mapping the arrays.
+
+    :param path: Path of the calendar file.
+    :return: dict with weekmask, start_year, end_year, count and rule_hash.
+    :raises ValueError: If the file is not a calendar file of a supported version.
+    """
+    with open(path, "rb") as calendar_file:
+        header = calendar_file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a calendar file")
+    magic, version, weekmask_bits, start_year, end_year, count, rule_hash = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a calendar file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported calendar file version {version}")
+    return {"weekmask": bits_to_weekmask(weekmask_bits), "start_year": start_year, "end_year": end_year,
+            "count": count, "rule_hash": rule_hash}
+
+
+class MappedBusinessCalendar(BusinessCalendar):
+    """
+    A BusinessCalendar backed by a memory-mapped calendar file.
+
+    `holiday_ordinals` and `holiday_slots` are int32 memoryviews over the mapping; every query method of
+    BusinessCalendar, and the vectorized functions in `src.batch`, work on them unchanged. Call `close()` (or use the
+    calendar as a context manager) to release the mapping.
+    """
+
+    def __init__(self, path):
+        """
+        Maps a calendar file written by `write_calendar_file`.
+
+        :param path: Path of the calendar file.
+        :raises ValueError: If the file is not a valid calendar file.
+        """
+        header = read_calendar_header(path)
+        array_size = header["count"] * INT32.size
+        if os.path.getsize(path) != HEADER.size + 2 * array_size:
+            raise ValueError(f"{path} is truncated or has trailing data")
+
+        self.path = path
+        self.set_horizon(header["start_year"], header["end_year"])
+        self.rule_hash = header["rule_hash"]
+        self.set_weekmask(header["weekmask"])
+
+        with open(path, "rb") as calendar_file:
+            self.mapping = mmap.mmap(calendar_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mapping)
+        ordinals = self.buffer[HEADER.size:HEADER.size + array_size]
+        slots = self.buffer[HEADER.size + array_size:]
+        if sys.byteorder == "little":
+            self.holiday_ordinals, self.holiday_slots = ordinals.cast("i"), slots.cast("i")
+        else:
+            # Native int views would read the little-endian file wrongly; fall back to unpacked copies.
+            array_format = struct.Struct(f"<{header['count']}i")
+            self.holiday_ordinals, self.holiday_slots = array_format.unpack(ordinals), array_format.unpack(slots)
+            ordinals.release()
+            slots.release()
+
+    def close(self):
+        """
+        Releases the views and unmaps the file. The calendar cannot be queried afterwards.
+        """
+        for view in (self.holiday_ordinals, self.holiday_slots):
+            if isinstance(view, memoryview):
+                view.release()
+        self.buffer.release()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_or_build_calendar(path, public_holiday_list=None, holiday_rules=None, start_year=DEFAULT_START_YEAR,
+                           end_year=DEFAULT_END_YEAR, weekmask=DEFAULT_WEEKMASK):
+    """
+    Maps the calendar stored at `path` when it was compiled from the same holidays, rules, horizon and weekmask;
+    otherwise compiles the calendar, writes it to `path` and maps the new file.
+
+    :return: MappedBusinessCalendar
+    """
+    expected = {"weekmask": normalize_weekmask(weekmask), "start_year": start_year, "end_year": end_year,
+                "rule_hash": rule_set_hash(public_holiday_list, holiday_rules)}
+    try:
+        header = read_calendar_header(path)
+        if all(header[key] == value for key, value in expected.items()):
+            return MappedBusinessCalendar(path)
+        logger.info("Calendar file %s is stale, rebuilding.", path)
+    except (OSError, ValueError) as e:
+        logger.info("Calendar file %s cannot be used (%s), rebuilding.", path, e)
+
+    write_calendar_file(BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                         start_year=start_year, end_year=end_year, weekmask=weekmask), path)
+    return MappedBusinessCalendar(path)
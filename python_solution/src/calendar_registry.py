@@ -0,0 +1,169 @@
+import hashlib
+import heapq
+import logging
+from bisect import bisect_left
+
+from src.business_calendar import BusinessCalendar, DEFAULT_END_YEAR, DEFAULT_START_YEAR
+from src.date_utils import DEFAULT_WEEKMASK, NUMBER_OF_DAYS_IN_A_WEEK
+
+logger = logging.getLogger(__name__)
+
+UNION = "union"
+INTERSECTION = "intersection"
+
+
+def contains_ordinal(sorted_ordinals, ordinal):
+    """
+    :param sorted_ordinals: Sorted sequence of unique ordinals.
+    :param ordinal: int -> Ordinal to look up.
+    :return: bool -> True if the ordinal is in the sequence.
+    """
+    index = bisect_left(sorted_ordinals, ordinal)
+    return index < len(sorted_ordinals) and sorted_ordinals[index] == ordinal
+
+
+def combine_weekmasks(weekmasks, working_in_all):
+    """
+    :param weekmasks: list of canonical weekmasks.
+    :param working_in_all: bool -> True to keep the days working in every mask, False for the days working in any.
+    :return: str -> The combined weekmask.
+    """
+    combine = all if working_in_all else any
+    return "".join("1" if combine(weekmask[weekday] == "1" for weekmask in weekmasks) else "0"
+                   for weekday in range(NUMBER_OF_DAYS_IN_A_WEEK))
+
+
+def is_closed(calendar, ordinal):
+    """
+    :return: bool -> True if the ordinal is not a business day of the calendar (weekend or holiday).
+    """
+    return not calendar.is_weekday_ordinal(ordinal) or contains_ordinal(calendar.holiday_ordinals, ordinal)
+
+
+def join_calendars(calendars, mode):
+    """
+    Derives one calendar from several by merging their sorted holiday indexes.
+
+    - UNION: the union of the holidays. A day is a business day only if it is one in every member, e.g. settlement
+      days common to London and Sydney. Working days are those working in every weekmask.
+    - INTERSECTION: the intersection of the holidays. A day is a business day if it is one in at least one member.
+      Working days are those working in any weekmask, and a day is a holiday if every member is closed on it.
+
+    The horizon is the overlap of the members' horizons.
+
+    :param calendars: list of BusinessCalendar objects.
+    :param mode: UNION or INTERSECTION.
+    :return: BusinessCalendar
+    :raises ValueError: If no calendar is given, the mode is unknown or the horizons do not overlap.
+    """
+    if not calendars:
+        raise ValueError("At least one calendar is required")
+    if mode not in (UNION, INTERSECTION):
+        raise ValueError(f"mode must be {UNION!r} or {INTERSECTION!r}")
+
+    start_year = max(calendar.start_year for calendar in calendars)
+    end_year = min(calendar.end_year for calendar in calendars)
+    if start_year > end_year:
+        raise ValueError("Calendar horizons do not overlap")
+
+    weekmask = combine_weekmasks([calendar.weekmask for calendar in calendars], working_in_all=mode == UNION)
+    merged = heapq.merge(*(calendar.holiday_ordinals for calendar in calendars))
+    if mode == UNION:
+        holiday_ordinals = merged
+    else:
+        holiday_ordinals = (ordinal for ordinal in merged
+                            if all(is_closed(calendar, ordinal) for calendar in calendars))
+
+    rule_hash = hashlib.sha256(mode.encode() + b"".join(sorted(calendar.rule_hash for calendar in calendars)))
+    return BusinessCalendar.from_ordinals(holiday_ordinals, start_year=start_year, end_year=end_year,
+                                         weekmask=weekmask, rule_hash=rule_hash.digest())
+
+
+class CalendarRegistry:
+    """
+    A registry of named calendars and of the calendars derived from them.
+
+    Each named calendar is compiled once from its own holidays and rules. Joint calendars (see `join_calendars`) are
+    computed on first request and cached, so a query against "London and Sydney" costs the same as a query against
+    one market. Re-registering a name drops every cached joint calendar that used it.
+
+    Attributes:
+        calendars (dict): Compiled calendars by name.
+        derived (dict): Cached (member versions, joint calendar) pairs keyed by (mode, frozenset of member names).
+    """
+
+    def __init__(self):
+        self.calendars = {}
+        self.derived = {}
+
+    def register(self, name, public_holiday_list=None, holiday_rules=None, start_year=DEFAULT_START_YEAR,
+                 end_year=DEFAULT_END_YEAR, weekmask=DEFAULT_WEEKMASK):
+        """
+        Compiles and registers a calendar under `name`, replacing any calendar of that name.
+
+        :return: BusinessCalendar -> The compiled calendar.
+        """
+        return self.add(name, BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                               start_year=start_year, end_year=end_year, weekmask=weekmask))
+
+    def add(self, name, calendar):
+        """
+        Registers an already compiled calendar, e.g. a MappedBusinessCalendar, under `name`.
+
+        :return: BusinessCalendar -> The registered calendar.
+        """
+        self.calendars[name] = calendar
+        for key in [key for key in self.derived if name in key[1]]:
+            del self.derived[key]
+        return calendar
+
+    def get(self, name):
+        """
+        :param name: str -> Name of a registered calendar.
+        :return: BusinessCalendar
+        :raises KeyError: If no calendar is registered under `name`.
+        """
+        try:
+            return self.calendars[name]
+        except KeyError:
+            raise KeyError(f"Unknown calendar {name!r}") from None
+
+    def names(self):
+        """
+        :return: list of the registered names, sorted.
+        """
+        return sorted(self.calendars)
+
+    def joint(self, names, mode):
+        """
+        Returns the cached joint calendar of `names`, deriving it on first use. The order of the names is irrelevant.
+        The cache entry remembers the `version` of each member, so it is derived again once a member changes, e.g.
+        after `add_holiday` on a MutableBusinessCalendar.
+
+        :param names: iterable of registered names.
+        :param mode: UNION or INTERSECTION.
+        :return: BusinessCalendar
+        """
+        key = (mode, frozenset(names))
+        members = [self.get(name) for name in sorted(key[1])]
+        versions = tuple(member.version for member in members)
+        cached = self.derived.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        calendar = join_calendars(members, mode)
+        self.derived[key] = (versions, calendar)
+        logger.info("Derived %s calendar of %s with %d holidays.", mode, ", ".join(sorted(key[1])),
+                    len(calendar.holiday_ordinals))
+        return calendar
+
+    def union(self, *names):
+        """
+        Calendar whose business days are business days in every named calendar (union of the holidays).
+        """
+        return self.joint(names, UNION)
+
+    def intersection(self, *names):
+        """
+        Calendar whose business days are business days in at least one named calendar (intersection of the holidays).
+        """
+        return self.joint(names, INTERSECTION)
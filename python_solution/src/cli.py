@@ -0,0 +1,247 @@
+"""
+Streaming command line entry point.
+
+Reads (start_date, end_date) pairs from CSV or JSON Lines on stdin or a file and writes the counts to stdout in
+fixed-size chunks, so arbitrarily large extracts are processed in constant memory:
+
+    python -m src.cli weekdays pairs.csv
+    cat pairs.jsonl | python -m src.cli business --format jsonl --holiday-rules rules.json
+    python -m src.cli business pairs.csv --workers 8 --chunk-size 50000
+"""
+import argparse
+import csv
+import datetime
+import itertools
+import json
+import logging
+import sys
+
+from src.business_calendar import BusinessCalendar, DEFAULT_END_YEAR, DEFAULT_START_YEAR
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils, DEFAULT_WEEKMASK
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10000
+COMMANDS = ("weekdays", "business")
+FORMATS = ("csv", "jsonl")
+
+
+def load_json_file(path):
+    """
+    Loads a JSON document from a file.
+
+    :param path: Path of the JSON file.
+    :return: The decoded document.
+    """
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def load_public_holidays(path):
+    """
+    Loads static public holidays from a JSON list of ISO dates.
+
+    :param path: Path of the JSON file, e.g. ["2013-12-25", "2013-12-26"].
+    :return: list of datetime.date objects.
+    """
+    return [datetime.date.fromisoformat(holiday) for holiday in load_json_file(path)]
+
+
+def read_csv_rows(stream):
+    """
+    Lazily yields (start, end, line number) rows from CSV with a `start_date,end_date` header.
+
+    :param stream: Text stream to read from.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield row["start_date"], row["end_date"], reader.line_num
+
+
+def read_jsonl_rows(stream):
+    """
+    Lazily yields (start, end, line number) rows from JSON Lines objects with `start_date` and `end_date` keys.
+    Blank lines are skipped.
+
+    :param stream: Text stream to read from.
+    """
+    for line_number, line in enumerate(stream, 1):
+        if line.strip():
+            row = json.loads(line)
+            yield row["start_date"], row["end_date"], line_number
+
+
+def iter_chunks(rows, chunk_size):
+    """
+    Groups an iterator into lists of at most `chunk_size` items without reading ahead further.
+
+    :param rows: Iterator of rows.
+    :param chunk_size: int -> Maximum number of rows per chunk.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def count_chunk(command, chunk, business_day_counter, calendar):
+    """
+    Computes the counts of one chunk of rows. A row with a missing or malformed date is logged with its line
+    number and left without a count, so the rest of the input is still counted.
+
+    :param command: "weekdays" or "business".
+    :param chunk: list of (start, end, line number) rows with ISO date strings.
+    :param business_day_counter: BusinessDayCounter in quiet mode.
+    :param calendar: BusinessCalendar used by the business command.
+    :return: list of int counts, in input order, with None for rows that could not be counted (invalid dates,
+             or dates outside the calendar horizon).
+    """
+    counts = []
+    counters = business_day_counter.counters
+    for start, end, line_number in chunk:
+        try:
+            start_date, end_date = datetime.date.fromisoformat(start), datetime.date.fromisoformat(end)
+        except (TypeError, ValueError) as e:
+            logger.warning("Line %d: invalid date pair %r, %r: %s", line_number, start, end, e)
+            counts.append(None)
+            continue
+        if command == "weekdays":
+            counts.append(business_day_counter.weekdays_between_two_dates(start_date, end_date))
+        else:
+            errors = counters["errors"]
+            count = business_day_counter.business_days_between_two_dates(start_date, end_date, calendar=calendar)
+            counts.append(None if counters["errors"] != errors else count)
+    return counts
+
+
+def write_chunk(output_format, command, chunk, counts, stream):
+    """
+    Writes one chunk of results and flushes it, so the output is produced incrementally. Rows without a count
+    are written with an empty CSV field or a JSON null.
+
+    :param output_format: "csv" or "jsonl".
+    :param command: "weekdays" or "business", used as the result column name.
+    :param chunk: list of (start, end, line number) rows with ISO date strings.
+    :param counts: list of int counts for the chunk, None for rows that could not be counted.
+    :param stream: Text stream to write to.
+    :return: int -> Number of rows written without a count.
+    """
+    if output_format == "csv":
+        csv.writer(stream, lineterminator="\n").writerows(
+            (start, end, count) for (start, end, line_number), count in zip(chunk, counts))
+    else:
+        stream.writelines(json.dumps({"start_date": start, "end_date": end, command: count}) + "\n"
+                          for (start, end, line_number), count in zip(chunk, counts))
+    stream.flush()
+    return counts.count(None)
+
+
+def run(command, input_stream, output_stream, input_format="csv", chunk_size=DEFAULT_CHUNK_SIZE,
+        public_holiday_list=None, holiday_rules=None, weekmask=DEFAULT_WEEKMASK,
+        start_year=DEFAULT_START_YEAR, end_year=DEFAULT_END_YEAR, stats=None):
+    """
+    Streams date pairs from `input_stream` to `output_stream`. The calendar is compiled once up front and each
+    chunk is counted and written before the next one is read.
+
+    :param stats: dict -> when given, receives `rows` processed and `failed` rows written without a count.
+    :return: int -> Number of rows processed.
+    """
+    business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask=weekmask), quiet=True)
+    calendar = None
+    if command == "business":
+        calendar = BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                    start_year=start_year, end_year=end_year, weekmask=weekmask)
+
+    rows = read_csv_rows(input_stream) if input_format == "csv" else read_jsonl_rows(input_stream)
+    if input_format == "csv":
+        output_stream.write(f"start_date,end_date,{command}\n")
+
+    processed = failed = 0
+    for chunk in iter_chunks(rows, chunk_size):
+        failed += write_chunk(input_format, command, chunk,
+                              count_chunk(command, chunk, business_day_counter, calendar), output_stream)
+        processed += len(chunk)
+    if stats is not None:
+        stats.update(rows=processed, failed=failed)
+    return processed
+
+
+def build_parser():
+    """
+    :return: argparse.ArgumentParser for the command line.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.cli",
+                                     description="Count weekdays or business days for streamed date pairs.")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("input", nargs="?", default="-", help="CSV or JSONL file, '-' for stdin (default).")
+    parser.add_argument("--format", choices=FORMATS, help="Input/output format, guessed from the file extension.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes; above 1 chunks are counted in a process pool (default 1).")
+    parser.add_argument("--holiday-rules", help="JSON file with a list of holiday rule objects.")
+    parser.add_argument("--public-holidays", help="JSON file with a list of ISO dates.")
+    parser.add_argument("--weekmask", default=DEFAULT_WEEKMASK, help="Working days, Monday first (default 1111100).")
+    parser.add_argument("--start-year", type=int, default=DEFAULT_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=DEFAULT_END_YEAR)
+    return parser
+
+
+def main(argv=None):
+    """
+    Parses the command line and streams the input to stdout.
+
+    :param argv: list of arguments, defaults to sys.argv.
+    :return: int -> Process exit code: 1 when an input file cannot be read or decoded, on invalid input, or when a
+             row could not be counted.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+
+    input_format = args.format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv")
+    logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
+    logging.getLogger().setLevel(logging.WARNING)
+    input_stream = None
+    try:
+        holiday_rules = load_json_file(args.holiday_rules) if args.holiday_rules else None
+        public_holiday_list = load_public_holidays(args.public_holidays) if args.public_holidays else None
+        input_stream = sys.stdin if args.input == "-" else open(args.input, newline="")
+        options = dict(input_format=input_format, chunk_size=args.chunk_size,
+                       public_holiday_list=public_holiday_list, holiday_rules=holiday_rules, weekmask=args.weekmask,
+                       start_year=args.start_year, end_year=args.end_year)
+        if args.workers > 1:
+            from src.parallel import run_parallel
+
+            worker_stats = run_parallel(args.command, input_stream, sys.stdout, workers=args.workers, **options)
+            for pid, stats in sorted(worker_stats.items()):
+                print(f"worker {pid}: {stats['rows']} rows, {stats['chunks']} chunks, "
+                      f"{stats['rows_per_second']:.0f} rows/s", file=sys.stderr)
+            failed = sum(stats["failed"] for stats in worker_stats.values())
+        else:
+            stats = {}
+            run(args.command, input_stream, sys.stdout, stats=stats, **options)
+            failed = stats["failed"]
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error("Cannot read input: %s", e)
+        return 1
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error("Invalid input: %s", e)
+        return 1
+    finally:
+        if input_stream is not None and input_stream is not sys.stdin:
+            input_stream.close()
+    if failed:
+        logger.error("%d rows could not be counted and were written without a result; check that their dates are "
+                     "valid and lie within the calendar horizon %d-%d.", failed, args.start_year, args.end_year)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
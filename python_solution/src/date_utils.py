@@ -1,19 +1,143 @@
 import logging
+from functools import lru_cache
 
+from src.profiling import ACTIVE_PROFILER, CALCULATE_PUBLIC_HOLIDAYS, WEEKEND_MATH
 from src.validator import validate_dates
 from datetime import date
 from datetime import timedelta
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 NUMBER_OF_DAYS_IN_A_WEEK = 7
 WEEK_DAYS_RANGE = {0, 1, 2, 3, 4}  # Monday, Tuesday... Friday
 WEEKEND_DAYS_RANGE = {5, 6}
+DEFAULT_WEEKMASK = "1111100"  # Monday first, 1 marks a working day
+
+# Day numbering of the integer entry points: proleptic Gregorian ordinals (date.toordinal(), 0001-01-01 is 1) or
+# days since the Unix epoch (1970-01-01 is 0).
+PROLEPTIC = "proleptic"
+UNIX_EPOCH = "unix"
+UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+EPOCH_OFFSETS = {PROLEPTIC: 0, UNIX_EPOCH: UNIX_EPOCH_ORDINAL}
+
+
+def normalize_weekmask(weekmask):
+    """
+    Normalizes a weekmask to its canonical seven character form, Monday first, where "1" marks a working day.
+
+    :param weekmask: str like "1111100" or a sequence of seven 0/1 (or bool) values.
+    :return: str -> The canonical weekmask.
+    :raises ValueError: If the mask does not describe seven days or has no working day.
+    """
+    if not isinstance(weekmask, str):
+        weekmask = "".join("1" if working else "0" for working in weekmask)
+
+    if len(weekmask) != NUMBER_OF_DAYS_IN_A_WEEK or set(weekmask) - {"0", "1"}:
+        raise ValueError("Weekmask must describe seven days with 0/1 values, Monday first")
+    if "1" not in weekmask:
+        raise ValueError("Weekmask must have at least one working day")
+    return weekmask
+
+
+def epoch_offset(epoch):
+    """
+    :param epoch: str -> PROLEPTIC or UNIX_EPOCH.
+    :return: int -> Value to add to a day number of the epoch to get a proleptic Gregorian ordinal.
+    :raises ValueError: If the epoch is unknown.
+    """
+    try:
+        return EPOCH_OFFSETS[epoch]
+    except KeyError:
+        raise ValueError(f"epoch must be one of {', '.join(EPOCH_OFFSETS)}") from None
+
+
+def weekday_of_ordinal(ordinal, epoch=PROLEPTIC):
+    """
+    Integer counterpart of `date.weekday()`.
+
+    :param ordinal: int -> Day number in the given epoch.
+    :param epoch: str -> PROLEPTIC or UNIX_EPOCH.
+    :return: int -> Weekday, Monday = 0.
+    """
+    return (ordinal + epoch_offset(epoch) + 6) % NUMBER_OF_DAYS_IN_A_WEEK
+
+
+def working_days_of(weekmask):
+    """
+    :param weekmask: str -> A canonical weekmask.
+    :return: frozenset -> Weekday indexes (0 = Monday) of the working days.
+    """
+    return frozenset(index for index, flag in enumerate(weekmask) if flag == "1")
+
+
+@lru_cache(maxsize=None)
+def build_weekend_days_table(weekmask):
+    """
+    Precomputes, for one weekmask, the number of non-working days among the `remainder` days following a start
+    date with weekday `start_date_index`, for every (start_date_index, remainder) pair. Tables are built once
+    per mask and shared.
+
+    :param weekmask: str -> A canonical weekmask.
+    :return: tuple -> 7x7 nested tuple indexed by [start_date_index][remainder].
+    """
+    return tuple(
+        tuple(sum(1 for i in range(1, remainder + 1)
+                  if weekmask[(start_date_index + i) % NUMBER_OF_DAYS_IN_A_WEEK] == "0")
+              for remainder in range(NUMBER_OF_DAYS_IN_A_WEEK))
+        for start_date_index in range(NUMBER_OF_DAYS_IN_A_WEEK)
+    )
+
+
+# WEEKEND_DAYS_TABLE[start_date_index][remainder] for the default Saturday/Sunday weekend.
+WEEKEND_DAYS_TABLE = build_weekend_days_table(DEFAULT_WEEKMASK)
+
+
+@lru_cache(maxsize=None)
+def build_substitute_days_table(weekmask):
+    """
+    Precomputes, for one weekmask, the number of days from each weekday to the next working day (0 on a working
+    day), used to move a holiday that falls on a non-working day.
+
+    :param weekmask: str -> A canonical weekmask.
+    :return: tuple -> Seven shifts indexed by weekday (0 = Monday).
+    """
+    return tuple(next(shift for shift in range(NUMBER_OF_DAYS_IN_A_WEEK)
+                      if weekmask[(weekday + shift) % NUMBER_OF_DAYS_IN_A_WEEK] == "1")
+                 for weekday in range(NUMBER_OF_DAYS_IN_A_WEEK))
+
+# 53 copies of a 7-bit week pattern cover the 366 days of any year.
+WEEKS_PER_YEAR_BITMAP = 53
+WEEK_PATTERN_REPEAT = sum(1 << (NUMBER_OF_DAYS_IN_A_WEEK * week) for week in range(WEEKS_PER_YEAR_BITMAP))
+
+
+@lru_cache(maxsize=4096)
+def build_weekday_year_bitmap(weekmask, year):
+    """
+    Builds the working-day bitmap of one year: bit i is set when the i-th day of the year (0 = January 1st) is a
+    working day of the weekmask. The 7-bit pattern of the week starting on January 1st is repeated with a single
+    multiplication and cut to the length of the year.
+
+    :param weekmask: str -> A canonical weekmask.
+    :param year: int -> The year.
+    :return: int -> Bitmap of at most 366 bits.
+    """
+    first_day = date(year, 1, 1)
+    days_in_year = date(year + 1, 1, 1).toordinal() - first_day.toordinal()
+    first_weekday = first_day.weekday()
+    week_pattern = sum(1 << offset for offset in range(NUMBER_OF_DAYS_IN_A_WEEK)
+                       if weekmask[(first_weekday + offset) % NUMBER_OF_DAYS_IN_A_WEEK] == "1")
+    return week_pattern * WEEK_PATTERN_REPEAT & ((1 << days_in_year) - 1)
 
 class DayUtils:
-    def __init__(self):
-        pass
+    def __init__(self, weekmask=DEFAULT_WEEKMASK):
+        """
+        :param weekmask: str or sequence -> Working days of the week, Monday first (e.g. "1111100" for a
+                         Saturday/Sunday weekend, "1111001" for Friday/Saturday, "1111110" for a six-day week).
+        """
+        self.weekmask = normalize_weekmask(weekmask)
+        self.working_days = working_days_of(self.weekmask)
+        self.weekend_days_per_week = NUMBER_OF_DAYS_IN_A_WEEK - len(self.working_days)
+        self.weekend_days_table = build_weekend_days_table(self.weekmask)
 
     @staticmethod
     @validate_dates
@@ -72,12 +196,16 @@ class DayUtils:
 
     def total_weekend_days_count(self, start_date, total_days):
         """
-        Calculates the total number of weekend days (Saturdays and Sundays) within a given date range.
+        Calculates the total number of weekend (non-working) days within a given date range, according to the
+        weekmask.
 
         :param start_date: datetime.date -> The start date of the range
         :param total_days: int -> The total number of days between the two dates
-        :return: int -> The total number of weekend days (Saturdays and Sundays) in the range
+        :return: int -> The total number of weekend days in the range
         """
+        profiler = ACTIVE_PROFILER.get()
+        if profiler is not None:
+            token = profiler.start()
         logger.info("Calculating weekend days between %s and total days count: %d", start_date, total_days)
 
         remaining_weekend_days = 0
@@ -91,41 +219,127 @@ class DayUtils:
         if remainder > 0:
             remaining_weekend_days += self.remaining_weekend_days_count(start_date_index, remainder, remaining_weekend_days)
 
-        total_weekend_days = quotient * 2 + remaining_weekend_days
+        total_weekend_days = quotient * self.weekend_days_per_week + remaining_weekend_days
         logger.info("Total weekend days: %d", total_weekend_days)
+        if profiler is not None:
+            profiler.stop(WEEKEND_MATH, token)
         return total_weekend_days
 
-    @staticmethod
-    def remaining_weekend_days_count(start_date_index, remainder, remaining_weekend_days):
+    def remaining_weekend_days_count(self, start_date_index, remainder, remaining_weekend_days):
         """
-        Calculates the number of weekend days (Saturdays and Sundays) in the remaining days
-        after full weeks have been considered.
+        Calculates the number of weekend days in the remaining days after full weeks have been considered.
+        The count is a constant-time lookup in the weekmask's precomputed table.
 
         :param start_date_index: int -> The weekday index of the start date (0 = Monday, 6 = Sunday)
         :param remainder: int -> The number of days remaining after full weeks
         :param remaining_weekend_days: int -> reference to keep value
 
-        :return: int -> The count of weekend days (Saturdays and Sundays)
+        :return: int -> The count of weekend days
         """
         logger.info("Calculating remaining weekend days from start index: %d for remainder: %d days", start_date_index, remainder)
 
-        for i in range(1, remainder + 1):
-            current_day = (start_date_index + i) % 7 # 6 + 0 =6 still in sunday
-            if current_day in {5, 6}:  # Saturday (5) or Sunday (6)
-                remaining_weekend_days += 1
-                logger.info("Remaining weekend day detected on day %d (Index: %d)", i + 1, current_day)
+        remaining_weekend_days += self.weekend_days_table[start_date_index][remainder]
 
         logger.info("Total remaining weekend days: %d", remaining_weekend_days)
         return remaining_weekend_days
 
 
+    def weekday_year_bitmap(self, year):
+        """
+        Working-day bitmap of a year for this weekmask, see `build_weekday_year_bitmap`.
+
+        :param year: int -> The year.
+        :return: int -> Bitmap with bit i set when day i of the year is a working day.
+        """
+        return build_weekday_year_bitmap(self.weekmask, year)
+
+    def count_weekend_days(self, start_date, total_days):
+        """
+        Quiet counterpart of `total_weekend_days_count` for the fast path: same result, computed with one divmod
+        and a table lookup, without building any log record.
+
+        :param start_date: datetime.date -> The start date of the range
+        :param total_days: int -> The total number of days between the two dates
+        :return: int -> The total number of weekend days in the range
+        """
+        profiler = ACTIVE_PROFILER.get()
+        if profiler is not None:
+            token = profiler.start()
+        quotient, remainder = divmod(total_days, NUMBER_OF_DAYS_IN_A_WEEK)
+        weekend_days = quotient * self.weekend_days_per_week + self.weekend_days_table[start_date.weekday()][remainder]
+        if profiler is not None:
+            profiler.stop(WEEKEND_MATH, token)
+        return weekend_days
+
     @staticmethod
-    def calculate_public_holidays(start_date, end_date, public_holiday_list):
+    def days_count_between_ordinals(start_ordinal, end_ordinal):
+        """
+        Integer counterpart of `days_count_between_dates`, without validation: the number of days strictly between
+        two day numbers of the same epoch.
+
+        :param start_ordinal: int -> Day number of the start date.
+        :param end_ordinal: int -> Day number of the end date.
+        :return: int -> Days between the two, 0 for empty or reversed ranges.
+        """
+        total_days = end_ordinal - start_ordinal - 1
+        return total_days if total_days > 0 else 0
+
+    def count_weekend_days_ordinal(self, start_ordinal, total_days, epoch=PROLEPTIC):
+        """
+        Integer counterpart of `count_weekend_days`.
+
+        :param start_ordinal: int -> Day number of the start date.
+        :param total_days: int -> The total number of days between the two dates
+        :param epoch: str -> PROLEPTIC or UNIX_EPOCH.
+        :return: int -> The total number of weekend days in the range
+        """
+        quotient, remainder = divmod(total_days, NUMBER_OF_DAYS_IN_A_WEEK)
+        return (quotient * self.weekend_days_per_week
+                + self.weekend_days_table[weekday_of_ordinal(start_ordinal, epoch)][remainder])
+
+    def count_public_holidays_ordinal(self, start_ordinal, end_ordinal, holiday_ordinals, epoch=PROLEPTIC):
+        """
+        Integer counterpart of `count_public_holidays`.
+
+        :param start_ordinal: int -> Day number of the start date.
+        :param end_ordinal: int -> Day number of the end date.
+        :param holiday_ordinals: Iterable of day numbers of possible public holidays, in the same epoch.
+        :param epoch: str -> PROLEPTIC or UNIX_EPOCH.
+        :return: int -> Number of distinct public holidays on working days strictly between the two.
+        """
+        shift = epoch_offset(epoch) + 6
+        return len({holiday for holiday in holiday_ordinals
+                    if start_ordinal < holiday < end_ordinal
+                    and (holiday + shift) % NUMBER_OF_DAYS_IN_A_WEEK in self.working_days})
+
+    def count_public_holidays(self, start_date, end_date, public_holiday_list):
+        """
+        Quiet counterpart of `calculate_public_holidays`: counts the holidays on working days strictly between
+        the two dates without logging. A day listed several times, e.g. by two rules that move to the same
+        Monday, is counted once, as in `BusinessCalendar`.
+
+        :param start_date: The start date of the range.
+        :param end_date: The end date of the range.
+        :param public_holiday_list: Iterable of possible public holidays.
+        :return: Number of distinct public holidays within the range.
+        :rtype: int
+        """
+        profiler = ACTIVE_PROFILER.get()
+        if profiler is not None:
+            token = profiler.start()
+        public_holidays = len({holiday.toordinal() for holiday in public_holiday_list
+                               if holiday.weekday() in self.working_days and start_date < holiday < end_date})
+        if profiler is not None:
+            profiler.stop(CALCULATE_PUBLIC_HOLIDAYS, token)
+        return public_holidays
+
+    def calculate_public_holidays(self, start_date, end_date, public_holiday_list):
         """
         Calculate the total number of public holidays within the given date range.
 
         This method takes a list of pre-generated public holidays and filters them
-        to identify which holidays fall between the specified start and end dates.
+        to identify which holidays fall on working days of the weekmask between the
+        specified start and end dates.
 
         :param start_date: The start date of the range.
         :param end_date: The end date of the range.
@@ -133,14 +347,9 @@ class DayUtils:
         :return: Number of public holidays within the range.
         :rtype: int
         """
-        logging.info(f"Filtering public holidays from the generated list.")
-        public_holiday_days_total_count = 0
-
-        for holiday in public_holiday_list:
-            if (holiday.weekday() in WEEK_DAYS_RANGE) and (start_date < holiday < end_date):
-                public_holiday_days_total_count += 1
-
-        return public_holiday_days_total_count
+        logger.info("Filtering public holidays from the generated list.")
+        return self.count_public_holidays(start_date=start_date, end_date=end_date,
+                                          public_holiday_list=public_holiday_list)
 
 
     @staticmethod
@@ -1,71 +1,375 @@
 from abc import abstractmethod, ABC
-from datetime import timedelta
-from src.date_utils import DayUtils
+from datetime import date, timedelta
+from functools import lru_cache
+from src.date_utils import DEFAULT_WEEKMASK, DayUtils, build_substitute_days_table, normalize_weekmask
+from src.profiling import ACTIVE_PROFILER, GET_OBJECTS
 import logging
+import threading
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXPANSION_CACHE_SIZE = 4096
+# Distinct rule lists whose compiled form is kept by `compile_rules`.
+COMPILED_RULE_SETS_CACHE_SIZE = 256
+RULE_FIELDS = ("holiday_type", "month", "day", "occurrence", "description")
+
+
+class HolidayRule(object):
+    """
+    An immutable, validated holiday rule.
+
+    Rules are compiled once from their dictionary form by `compile_rule`, so holiday objects read plain attributes
+    instead of re-validating and unpacking a dictionary on every query. Equality and the hash only use the fields
+    that drive the expansion (holiday type, month, day and occurrence); the hash is computed once. Rules can
+    therefore be used directly as cache keys, and a tuple of rules identifies a rule set.
+
+    Attributes:
+        holiday_type (str): "public_holiday", "moveable_holiday" or "certain_occurrence_holiday".
+        month (int): Month of the holiday.
+        day (int): Day of the month, or weekday (0 = Monday) for certain occurrence holidays.
+        occurrence (int): Which occurrence of the weekday in the month, None for the other types.
+        description (str): Free text, ignored by equality and hashing.
+        key (tuple): (holiday_type, month, day, occurrence).
+    """
+    __slots__ = RULE_FIELDS + ("key", "hash_value")
+
+    def __init__(self, holiday_type, month, day, occurrence=None, description=None):
+        for name, value in zip(RULE_FIELDS, (holiday_type, month, day, occurrence, description)):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "key", (holiday_type, month, day, occurrence))
+        object.__setattr__(self, "hash_value", hash(self.key))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("HolidayRule is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("HolidayRule is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, HolidayRule):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __repr__(self):
+        return (f"HolidayRule(holiday_type={self.holiday_type!r}, month={self.month!r}, day={self.day!r}, "
+                f"occurrence={self.occurrence!r}, description={self.description!r})")
+
+    def as_dict(self):
+        """
+        Returns the dictionary form of the rule, without the fields that are not set.
+
+        Returns:
+            dict: The rule as accepted by `compile_rule`.
+        """
+        return {name: getattr(self, name) for name in RULE_FIELDS if getattr(self, name) is not None}
+
+
+def compile_rule(holiday_rule, holiday_type=None):
+    """
+    Validates a holiday rule dictionary once and turns it into a HolidayRule. Compiled rules are returned as they
+    are.
+
+    Args:
+        holiday_rule (dict or HolidayRule): The rule to compile.
+        holiday_type (str): Type to use when the dictionary has no "holiday_type" key (optional).
+
+    Returns:
+        HolidayRule: The compiled rule.
+
+    Raises:
+        ValueError: If the holiday type is missing or unsupported, or the rule values are invalid.
+    """
+    if isinstance(holiday_rule, HolidayRule):
+        return holiday_rule
+
+    holiday_type = holiday_rule.get("holiday_type") or holiday_type
+    if not holiday_type:
+        logger.error("Holiday type required!.")
+        raise ValueError("Holiday type required!")
+    holiday_class = HOLIDAY_CLASSES.get(holiday_type)
+    if holiday_class is None:
+        logger.error("Holiday type '%s' not supported.", holiday_type)
+        raise ValueError(f"Holiday type '{holiday_type}' not supported")
+
+    holiday_class.check_holiday(**holiday_rule)
+    return HolidayRule(holiday_type=holiday_type, month=holiday_rule.get("month"), day=holiday_rule.get("day"),
+                       occurrence=holiday_rule.get("occurrence") if holiday_class.uses_occurrence else None,
+                       description=holiday_rule.get("description"))
+
+
+def compile_rules(holiday_rules):
+    """
+    Compiles a list of holiday rules, dropping rules that expand to the same dates as an earlier one.
+
+    The compiled tuple is memoized on the content of the rules, so passing the same rule dictionaries on every
+    query validates them only once. Rules with unhashable values are compiled without the memo.
+
+    Args:
+        holiday_rules (iterable): Rule dictionaries and/or HolidayRule objects.
+
+    Returns:
+        tuple: The compiled rules in their original order; hashable, so it identifies the rule set.
+
+    Raises:
+        ValueError: If a rule is invalid or of an unsupported type.
+    """
+    holiday_rules = tuple(holiday_rules or ())
+    # A HolidayRule ignores its description in equality, so it is paired with it to keep renamed rules apart.
+    key = tuple((holiday_rule, holiday_rule.description) if isinstance(holiday_rule, HolidayRule)
+                else tuple(holiday_rule.items()) for holiday_rule in holiday_rules)
+    try:
+        hash(key)
+    except TypeError:
+        return compile_rule_list(holiday_rules)
+    return compile_rule_set(key)
+
+
+def compile_rule_list(holiday_rules):
+    """
+    Uncached body of `compile_rules`.
+
+    Args:
+        holiday_rules (iterable): Rule dictionaries and/or HolidayRule objects.
+
+    Returns:
+        tuple: The compiled rules, without duplicates.
+    """
+    return tuple(dict.fromkeys(compile_rule(holiday_rule) for holiday_rule in holiday_rules))
+
+
+@lru_cache(maxsize=COMPILED_RULE_SETS_CACHE_SIZE)
+def compile_rule_set(key):
+    """
+    Memoized form of `compile_rule_list`, keyed by the hashable content of the rules built by `compile_rules`.
+
+    Args:
+        key (tuple): One (HolidayRule, description) pair or tuple of dictionary items per rule.
+
+    Returns:
+        tuple: The compiled rules, without duplicates.
+    """
+    return compile_rule_list(rule[0] if rule and isinstance(rule[0], HolidayRule) else dict(rule) for rule in key)
+
+
+def rule_set_key(holiday_rules):
+    """
+    Cheap hashable identity of a rule set, for result caches: the (holiday_type, month, day, occurrence) key of each
+    rule, in order. Rules are neither validated nor compiled, so the key costs far less than `compile_rules`;
+    descriptions are ignored as in HolidayRule equality.
+
+    Args:
+        holiday_rules (iterable): Rule dictionaries or HolidayRule objects, or None.
+
+    Returns:
+        tuple: One key tuple per rule.
+    """
+    return tuple(holiday_rule.key if isinstance(holiday_rule, HolidayRule)
+                 else (holiday_rule.get("holiday_type"), holiday_rule.get("month"), holiday_rule.get("day"),
+                       holiday_rule.get("occurrence"))
+                 for holiday_rule in holiday_rules or ())
+
+
+class HolidayExpansionCache(object):
+    """
+    A bounded cache of holiday rule expansions keyed by (rule, year), with approximate LRU eviction.
+
+    Keys are compiled HolidayRule objects, whose equality only covers the fields that drive the expansion (holiday
+    type, month, day and occurrence), so two rules that only differ in their description share the same entries.
+    Moveable holidays also key on the weekmask, which decides their substitute day.
+
+    The cache is shared by every factory and thread, so hits take no lock: they are a plain dict read plus, the
+    first time an entry is reused since it was last considered for eviction, adding its key to the `referenced`
+    set. Inserts and evictions are serialized by a lock and evict in insertion order, giving referenced entries a
+    second chance (the CLOCK approximation of LRU). The expansion itself runs outside the lock: threads that miss
+    the same key at the same time each expand it and count a miss, but only the first one stores its tuple and the
+    others return that stored tuple, so every caller sees the same entry. The hit counter is not synchronized, so it
+    may undercount when threads race.
+
+    Attributes:
+        maxsize (int): Maximum number of (rule, year) entries kept before one is evicted.
+        referenced (set): Keys reused since they were last considered for eviction.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to expand the rule.
+        evictions (int): Number of entries dropped because the cache was full.
+
+    Methods:
+        get_or_expand(): Returns the cached expansion of a rule for a year, expanding it on a miss.
+        stats(): Returns a snapshot of the counters.
+        clear(): Drops every entry and resets the counters.
+    """
+
+    def __init__(self, maxsize=DEFAULT_EXPANSION_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.entries = {}
+        self.referenced = set()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_expand(self, holiday_rule, year, expand):
+        """
+        Returns the holiday dates of a rule for one year, calling `expand(year)` only on a cache miss.
+
+        Args:
+            holiday_rule (HolidayRule): The compiled rule.
+            year (int): The year to expand.
+            expand (callable): Function returning the holiday dates of the rule for the given year.
+
+        Returns:
+            tuple: The holiday dates of the rule in that year.
+        """
+        key = (holiday_rule, year)
+        dates = self.entries.get(key)
+        if dates is not None:
+            self.hits += 1
+            if key not in self.referenced:
+                self.referenced.add(key)
+            return dates
+
+        dates = tuple(expand(year))
+        with self.lock:
+            self.misses += 1
+            if key in self.entries:
+                return self.entries[key]
+            self.entries[key] = dates
+            while len(self.entries) > self.maxsize:
+                oldest = next(iter(self.entries))
+                if oldest in self.referenced:
+                    self.referenced.discard(oldest)
+                    self.entries[oldest] = self.entries.pop(oldest)
+                else:
+                    del self.entries[oldest]
+                    self.evictions += 1
+            if len(self.referenced) > self.maxsize:
+                # Flags set by hits that raced with the eviction of their entry.
+                self.referenced.intersection_update(self.entries)
+        return dates
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, current size and maxsize.
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self.entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        """
+        Drops every cached expansion and resets the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.referenced.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+HOLIDAY_EXPANSION_CACHE = HolidayExpansionCache()
+
 class HolidayFactory(object):
     """
     A factory class responsible for creating holiday objects based on different holiday rules and a given date range.
 
     Attributes:
-        holiday_rules (list): A list of holiday rule dictionaries.
-        created_objects (list): A list of created holiday objects.
+        holiday_rules (tuple): The compiled holiday rules (see `compile_rules`).
+        created_objects (tuple): The holiday objects of the rules, created by the first `get_objects()` call.
         start_date (datetime): The start date for the holiday generation.
         end_date (datetime): The end date for the holiday generation.
+        cache (HolidayExpansionCache): Shared per-(rule, year) expansion cache handed to every holiday object.
+        quiet (bool): Handed to every holiday object; a quiet object creates no log records.
+        weekmask (str): Working days of the week, handed to every holiday object.
 
     Methods:
-        get_objects(): Creates and returns a list of holiday objects based on the provided rules.
+        get_objects(): Creates and returns the holiday objects of the rules.
+
+    A factory is read-only once `get_objects()` has run, so it can be reused and shared between threads.
     """
 
-    def __init__(self, holiday_rules, start_date, end_date):
-        self.holiday_rules = holiday_rules
-        self.created_objects = []
+    def __init__(self, holiday_rules, start_date, end_date, cache=HOLIDAY_EXPANSION_CACHE, quiet=False,
+                 weekmask=DEFAULT_WEEKMASK):
+        """
+        Args:
+            holiday_rules (iterable): Rule dictionaries or HolidayRule objects; dictionaries are compiled here, once.
+            start_date (datetime): The start date for the holiday generation.
+            end_date (datetime): The end date for the holiday generation.
+            cache (HolidayExpansionCache): Shared per-(rule, year) expansion cache.
+            quiet (bool): Skip the per-holiday log records, for callers on a hot path.
+            weekmask (str): Working days of the week, Monday first; moveable holidays move to the next working day.
+
+        Raises:
+            ValueError: If a rule is invalid or of an unsupported type.
+        """
+        self.holiday_rules = compile_rules(holiday_rules)
+        self.created_objects = None
         self.start_date = start_date
         self.end_date = end_date
+        self.cache = cache
+        self.quiet = quiet
+        self.weekmask = normalize_weekmask(weekmask)
 
     def get_objects(self):
         """
-        Creates holiday objects based on the provided holiday rules and returns them.
+        Creates holiday objects based on the provided holiday rules on the first call and returns them; later calls
+        return the same tuple. Threads racing on the first call each build an identical tuple and one of them is
+        kept, so no lock is needed.
 
         Returns:
-            list: A list of created holiday objects based on the rules (e.g., MoveableHoliday, PublicHoliday, CertainOccurrenceHoliday).
-
-        Raises:
-            Exception: If the holiday type in the rule is unsupported or missing.
+            tuple: The created holiday objects based on the rules (e.g., MoveableHoliday, PublicHoliday, CertainOccurrenceHoliday).
         """
-        for holiday_rule in self.holiday_rules:
-
-            holiday_type = holiday_rule.get("holiday_type")
-
-            if holiday_type:
+        created_objects = self.created_objects
+        if created_objects is None:
+            profiler = ACTIVE_PROFILER.get()
+            if profiler is not None:
+                token = profiler.start()
+            created_objects = tuple(HOLIDAY_CLASSES[holiday_rule.holiday_type](
+                holiday_rule=holiday_rule, start_date=self.start_date, end_date=self.end_date, cache=self.cache,
+                quiet=self.quiet, weekmask=self.weekmask)
+                for holiday_rule in self.holiday_rules)
+            self.created_objects = created_objects
+            if profiler is not None:
+                profiler.stop(GET_OBJECTS, token)
+        return created_objects
+
+    def iter_holidays(self):
+        """
+        Lazily yields the holiday dates of every rule that can fall between start_date and end_date.
 
-                if holiday_type == "moveable_holiday":
-                    self.created_objects.append(MoveableHoliday(holiday_rule=holiday_rule,
-                                                                start_date=self.start_date,
-                                                                end_date=self.end_date))
+        Yields:
+            date: Holiday dates generated by the rules, rule by rule.
+        """
+        for holiday_object in self.get_objects():
+            yield from holiday_object.iter_holidays()
 
-                elif holiday_type == "public_holiday":
-                    self.created_objects.append(PublicHoliday(holiday_rule=holiday_rule,
-                                                                start_date=self.start_date,
-                                                                end_date=self.end_date))
 
-                elif holiday_type == "certain_occurrence_holiday":
-                    self.created_objects.append(CertainOccurrenceHoliday(holiday_rule=holiday_rule,
-                                                                         start_date=self.start_date,
-                                                                         end_date=self.end_date))
+def check_month_and_day(month, day):
+    """
+    Validates the month and day of a fixed-date rule. February 29th is rejected because it does not exist every year.
 
-                else:
-                    logger.error(f"Holiday type '{holiday_type}' not supported.")
-                    raise Exception(f"Holiday type '{holiday_type}' not supported")
+    Args:
+        month (int): Month of the holiday.
+        day (int): Day of the month.
 
-            else:
-                logger.error(f"Holiday type required!.")
-                raise Exception(f"Holiday type required!")
+    Returns:
+        bool: True if the values are valid.
 
-        return self.created_objects
+    Raises:
+        ValueError: If either value is missing or the date does not exist.
+    """
+    if not isinstance(month, int) or not isinstance(day, int) or not month or not day:
+        raise ValueError("Month and day arguments are required. !!")
+    try:
+        date(2001, month, day)
+    except ValueError:
+        raise ValueError("Month and day must be in valid range !!.") from None
+    return True
 
 
 class HolidayFactoryInterface(ABC):
@@ -74,7 +378,12 @@ class HolidayFactoryInterface(ABC):
     Derived classes must implement the following methods:
         - get_holiday(): Retrieves the holiday dates.
         - generate_dates(): Generates holiday dates based on specific rules.
-        - check_holiday(): Validates the holiday rule parameters.
+        - check_holiday(): Validates the holiday rule parameters, once, when the rule is compiled.
+        - expand_year(): Computes the holiday dates of the rule for a single year.
+        - possible_window(): Earliest and latest date the rule can produce in a year.
+
+    Holidays are also available lazily through iter_holidays(), which skips years whose possible window cannot
+    intersect the requested range.
     """
     @abstractmethod
     def get_holiday(self):
@@ -90,13 +399,56 @@ class HolidayFactoryInterface(ABC):
         """
         raise NotImplementedError()
 
+    @staticmethod
     @abstractmethod
-    def check_holiday(self):
+    def check_holiday(*args, **kwargs):
         """
           Validates the holiday rule parameters.
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def expand_year(self, year):
+        """
+          Computes the holiday dates of the rule for a single year.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def possible_window(self, year):
+        """
+          Returns the earliest and latest date the rule can produce in a year, without expanding it.
+        """
+        raise NotImplementedError()
+
+    @property
+    def expansion_key(self):
+        """
+          Key of the rule's entries in the expansion cache: the compiled rule.
+          """
+        return self.holiday_rule
+
+    def iter_holidays(self):
+        """
+          Lazily yields the holiday dates of the rule between start_date and end_date.
+
+          Interior years always fall inside the range. The first and last year are only expanded when the rule's
+          possible window intersects the range strictly between start_date and end_date, so a short query
+          crossing New Year does not expand every rule for both years.
+
+          Yields:
+              date: Holiday dates, year by year.
+          """
+        first_year, last_year = self.start_date.year, self.end_date.year
+        start_ordinal, end_ordinal = self.start_date.toordinal(), self.end_date.toordinal()
+
+        for year in range(first_year, last_year + 1):
+            if year == first_year or year == last_year:
+                earliest, latest = self.possible_window(year)
+                if latest.toordinal() <= start_ordinal or earliest.toordinal() >= end_ordinal:
+                    continue
+            yield from self.cache.get_or_expand(self.expansion_key, year, self.expand_year)
+
 class PublicHoliday(HolidayFactoryInterface):
     """
      A class representing a public holiday, implementing the HolidayFactoryInterface.
@@ -107,18 +459,28 @@ class PublicHoliday(HolidayFactoryInterface):
          generate_dates(): Generates a list of holiday dates based on the month and day.
          check_holiday(): Validates the month and day values for correctness.
      """
-    def __init__(self, holiday_rule, start_date, end_date):
+    holiday_type = "public_holiday"
+    uses_occurrence = False
+
+    def __init__(self, holiday_rule, start_date, end_date, cache=HOLIDAY_EXPANSION_CACHE, quiet=False,
+                 weekmask=DEFAULT_WEEKMASK):
         """
           Initializes the PublicHoliday object with a holiday rule, start date, and end date.
 
           Args:
-              holiday_rule (dict): A dictionary containing holiday rule details.
+              holiday_rule (dict or HolidayRule): The holiday rule, compiled here if it is a dictionary.
               start_date (datetime): The start date for generating holidays.
               end_date (datetime): The end date for generating holidays.
+              cache (HolidayExpansionCache): Cache of per-year expansions.
+              quiet (bool): Skip the log records of the expansion.
+              weekmask (str): Working days of the week, Monday first (see `DayUtils`).
           """
-        self.holiday_rule = holiday_rule
+        self.holiday_rule = compile_rule(holiday_rule, holiday_type=self.holiday_type)
         self.start_date = start_date
         self.end_date = end_date
+        self.cache = cache
+        self.quiet = quiet
+        self.weekmask = normalize_weekmask(weekmask)
 
     def get_holiday(self):
         """
@@ -127,31 +489,50 @@ class PublicHoliday(HolidayFactoryInterface):
            Returns:
                list: A list of generated public holiday dates.
            """
-        return self.generate_dates(**self.holiday_rule)
+        return self.generate_dates()
 
-    def generate_dates(self, *args, **kwargs):
+    def generate_dates(self):
         """
                Generates public holiday dates within the specified date range, adjusted for the period.
 
+               Returns:
+                   list: A list of generated holiday dates. The rule was validated when it was compiled.
+               """
+        return [holiday for year in range(self.start_date.year, self.end_date.year + 1)
+                for holiday in self.cache.get_or_expand(self.expansion_key, year, self.expand_year)]
+
+    def expand_year(self, year):
+        """
+               Generates the public holiday date of a single year.
+
                Args:
-                   *args: Additional arguments.
-                   **kwargs: Keyword arguments containing month and day values.
+                   year (int): The year to expand.
 
                Returns:
-                   list: A list of generated holiday dates, or an empty list if the parameters are invalid.
+                   list: A list holding the holiday date of that year.
                """
-        period = self.end_date.year - self.start_date.year
-        is_valid = self.check_holiday(*args, **kwargs)
-        if is_valid:
-            month, day = kwargs.get('month'), kwargs.get('day')
-            generated_holidays = DayUtils.generates_dates_frequency_for_certain_period(start_date=self.start_date,
-                                                                                       period=period,
-                                                                                       month=month,
-                                                                                       day=day)
-            return generated_holidays
+        month, day = self.holiday_rule.month, self.holiday_rule.day
+        return DayUtils.generates_dates_frequency_for_certain_period(start_date=date(year, 1, 1),
+                                                                     period=0,
+                                                                     month=month,
+                                                                     day=day)
 
+    def possible_window(self, year):
+        """
+               A public holiday always falls on its fixed month and day.
+
+               Args:
+                   year (int): The year to check.
+
+               Returns:
+                   tuple: (earliest, latest) dates, both the holiday itself.
+               """
+        holiday = date(year, self.holiday_rule.month, self.holiday_rule.day)
+        return holiday, holiday
 
-    def check_holiday(self, *args, **kwargs):
+
+    @staticmethod
+    def check_holiday(*args, **kwargs):
         """
         Validates the month and day values for correctness.
 
@@ -163,83 +544,117 @@ class PublicHoliday(HolidayFactoryInterface):
             bool: True if the parameters are valid, otherwise raises an exception.
 
         Raises:
-            Exception: If the month or day values are invalid.
+            ValueError: If the month or day values are invalid.
         """
-        month, day = kwargs.get('month'), kwargs.get('day')
-
-        if not month or not day:
-            raise Exception("Month and day arguments are required. !!")
-
-        if month < 1 or month > 12 or day < 1 or month > 31:
-            raise Exception("Month and day must be in valid range !!.")
-
-        return True
+        return check_month_and_day(kwargs.get('month'), kwargs.get('day'))
 
 class MoveableHoliday(HolidayFactoryInterface):
     """
     A class representing a moveable holiday, implementing the HolidayFactoryInterface.
-    Generates dates for a specific moveable holiday and adjusts them if they fall on a weekend.
+    Generates dates for a specific moveable holiday and adjusts them if they fall on a non-working day.
 
     Methods:
-        move_date(): Adjusts a holiday date if it falls on a weekend (Saturday or Sunday).
+        move_date(): Moves a holiday that falls on a non-working day of the weekmask to the next working day.
         generate_dates(): Generates a list of moveable holiday dates.
         get_holiday(): Returns the adjusted holiday dates.
         check_holiday(): Validates the month and day values for correctness.
     """
-    def __init__(self, holiday_rule, start_date, end_date):
+    holiday_type = "moveable_holiday"
+    uses_occurrence = False
+
+    def __init__(self, holiday_rule, start_date, end_date, cache=HOLIDAY_EXPANSION_CACHE, quiet=False,
+                 weekmask=DEFAULT_WEEKMASK):
         """
            Initializes the MoveableHoliday object with a holiday rule, start date, and end date.
 
            Args:
-               holiday_rule (dict): A dictionary containing holiday rule details.
+               holiday_rule (dict or HolidayRule): The holiday rule, compiled here if it is a dictionary.
                start_date (datetime): The start date for generating holidays.
                end_date (datetime): The end date for generating holidays.
+               cache (HolidayExpansionCache): Cache of per-year expansions.
+               quiet (bool): Skip the log records of the expansion.
+               weekmask (str): Working days of the week, Monday first (see `DayUtils`).
            """
-        self.holiday_rule = holiday_rule
+        self.holiday_rule = compile_rule(holiday_rule, holiday_type=self.holiday_type)
         self.start_date = start_date
         self.end_date = end_date
+        self.cache = cache
+        self.quiet = quiet
+        self.weekmask = normalize_weekmask(weekmask)
+        self.substitute_days = build_substitute_days_table(self.weekmask)
+
+    @property
+    def expansion_key(self):
+        """
+          The substitute day depends on the weekmask, so it is part of the cache key.
+          """
+        return self.holiday_rule, self.weekmask
 
     @staticmethod
-    def move_date(date):
+    def move_date(date, weekmask=DEFAULT_WEEKMASK, quiet=False):
         """
-          Adjusts a holiday date if it falls on a weekend (Saturday or Sunday).
-          If the holiday falls on:
+          Adjusts a holiday date if it falls on a non-working day of the weekmask: it moves to the next working
+          day. With the default weekmask:
           - Saturday, move it to Monday.
           - Sunday, move it to Monday.
+          The substitute day is not moved again when another holiday falls on it; coinciding holidays are counted
+          once.
 
           :param date: A date object representing the holiday to be adjusted.
-          :return: Adjusted date (if holiday falls on weekend).
+          :param weekmask: str -> A canonical weekmask, Monday first.
+          :param quiet: Skip the log record of the move.
+          :return: Adjusted date (if holiday falls on a non-working day).
           """
-        original_date = date
-        if date.weekday() == 5:  # Saturday
-            date += timedelta(days=2)  # Move to Monday
-            logging.info(f"Holiday {original_date} is a Saturday. Moved to Monday: {date}")
-        elif date.weekday() == 6:  # Sunday
-            date += timedelta(days=1)  # Move to Monday
-            logging.info(f"Holiday {original_date} is a Sunday. Moved to Monday: {date}")
+        shift = build_substitute_days_table(weekmask)[date.weekday()]
+        if shift:
+            original_date = date
+            date += timedelta(days=shift)
+            if not quiet:
+                logger.info("Holiday %s is a %s. Moved to %s: %s", original_date, original_date.strftime("%A"),
+                            date.strftime("%A"), date)
         return date
 
-    def generate_dates(self, *args, **kwargs):
+    def generate_dates(self):
         """
          Generates moveable holiday dates within the specified date range and adjusts for weekends.
 
+         Returns:
+             list: A list of adjusted moveable holiday dates.
+         """
+        return [holiday for year in range(self.start_date.year, self.end_date.year + 1)
+                for holiday in self.cache.get_or_expand(self.expansion_key, year, self.expand_year)]
+
+    def expand_year(self, year):
+        """
+         Generates the moveable holiday date of a single year, adjusted for weekends.
+
          Args:
-             *args: Additional arguments.
-             **kwargs: Keyword arguments containing month and day values.
+             year (int): The year to expand.
 
          Returns:
-             list: A list of adjusted moveable holiday dates.
+             list: A list holding the adjusted holiday date of that year.
          """
-        period = self.end_date.year - self.start_date.year
-        is_valid = self.check_holiday(*args, **kwargs)
-        if is_valid:
-            month, day = kwargs.get('month'), kwargs.get('day')
-            generated_holidays = DayUtils.generates_dates_frequency_for_certain_period(start_date=self.start_date,
-                                                                                       period=period,
-                                                                                       month=month,
-                                                                                       day=day)
-            moved_dates = [self.move_date(moveable_holiday) for moveable_holiday in generated_holidays]
-            return moved_dates
+        month, day = self.holiday_rule.month, self.holiday_rule.day
+        generated_holidays = DayUtils.generates_dates_frequency_for_certain_period(start_date=date(year, 1, 1),
+                                                                                   period=0,
+                                                                                   month=month,
+                                                                                   day=day)
+        return [self.move_date(moveable_holiday, weekmask=self.weekmask, quiet=self.quiet)
+                for moveable_holiday in generated_holidays]
+
+    def possible_window(self, year):
+        """
+         A moveable holiday falls on its month and day or is moved up to the longest run of non-working days of
+         the weekmask later.
+
+         Args:
+             year (int): The year to check.
+
+         Returns:
+             tuple: (earliest, latest) dates the holiday can fall on.
+         """
+        holiday = date(year, self.holiday_rule.month, self.holiday_rule.day)
+        return holiday, holiday + timedelta(days=max(self.substitute_days))
 
     def get_holiday(self):
         """
@@ -248,10 +663,11 @@ class MoveableHoliday(HolidayFactoryInterface):
            Returns:
                list: A list of adjusted moveable holiday dates.
            """
-        return self.generate_dates(**self.holiday_rule)
+        return self.generate_dates()
 
 
-    def check_holiday(self, *args, **kwargs):
+    @staticmethod
+    def check_holiday(*args, **kwargs):
         """
            Validates the month and day values for correctness.
 
@@ -263,17 +679,9 @@ class MoveableHoliday(HolidayFactoryInterface):
                bool: True if the parameters are valid, otherwise raises an exception.
 
            Raises:
-               Exception: If the month or day values are invalid.
+               ValueError: If the month or day values are invalid.
            """
-        month, day = kwargs.get('month'), kwargs.get('day')
-
-        if not month or not day:
-            raise Exception("Month and day arguments are required. !!")
-
-        if month<1 or month>12 or day<1 or month>31:
-            raise Exception("Month and day must be valid range !!.")
-
-        return True
+        return check_month_and_day(kwargs.get('month'), kwargs.get('day'))
 
 class CertainOccurrenceHoliday(HolidayFactoryInterface):
     """
@@ -285,18 +693,28 @@ class CertainOccurrenceHoliday(HolidayFactoryInterface):
           generate_dates(): Generates a list of dates for the specific occurrence of the holiday.
           check_holiday(): Validates the weekday and month values for correctness.
       """
-    def __init__(self, holiday_rule, start_date, end_date):
+    holiday_type = "certain_occurrence_holiday"
+    uses_occurrence = True
+
+    def __init__(self, holiday_rule, start_date, end_date, cache=HOLIDAY_EXPANSION_CACHE, quiet=False,
+                 weekmask=DEFAULT_WEEKMASK):
         """
             Initializes the CertainOccurrenceHoliday object with a holiday rule, start date, and end date.
 
             Args:
-                holiday_rule (dict): A dictionary containing holiday rule details.
+                holiday_rule (dict or HolidayRule): The holiday rule, compiled here if it is a dictionary.
                 start_date (datetime): The start date for generating holidays.
                 end_date (datetime): The end date for generating holidays.
+                cache (HolidayExpansionCache): Cache of per-year expansions.
+                quiet (bool): Skip the log records of the expansion.
+                weekmask (str): Working days of the week, Monday first (see `DayUtils`).
             """
-        self.holiday_rule = holiday_rule
+        self.holiday_rule = compile_rule(holiday_rule, holiday_type=self.holiday_type)
         self.start_date = start_date
         self.end_date = end_date
+        self.cache = cache
+        self.quiet = quiet
+        self.weekmask = normalize_weekmask(weekmask)
 
     def get_holiday(self):
         """
@@ -306,32 +724,51 @@ class CertainOccurrenceHoliday(HolidayFactoryInterface):
                 list: A list of dates for the specific occurrence of the holiday.
             """
         # Example: Getting the second Monday in October
-        return self.generate_dates(**self.holiday_rule)
+        return self.generate_dates()
 
-    def generate_dates(self, *args, **kwargs):
+    def generate_dates(self):
         """
            Generates dates for a certain occurrence of a holiday based on weekday and month.
 
+           Returns:
+               list: A list of dates for the specific occurrence of the holiday.
+           """
+        return [holiday for year in range(self.start_date.year, self.end_date.year + 1)
+                for holiday in self.cache.get_or_expand(self.expansion_key, year, self.expand_year)]
+
+    def expand_year(self, year):
+        """
+           Generates the date of the certain occurrence holiday in a single year.
+
            Args:
-               *args: Additional arguments.
-               **kwargs: Keyword arguments containing weekday and month details.
+               year (int): The year to expand.
 
            Returns:
-               list: A list of dates for the specific occurrence of the holiday.
+               list: A list holding the holiday date of that year.
            """
-        period = self.end_date.year - self.start_date.year
-        is_valid = self.check_holiday(*args, **kwargs)
-        if is_valid:
-            month, weekday, occurrence = kwargs.get('month'), kwargs.get('day'), kwargs.get('occurrence')
-            generated_holidays = DayUtils.generates_occurrence_dates_frequency_for_certain_period(
-                start_date=self.start_date,
-                period=period,
-                month=month,
-                day=weekday,
-                occurrence=occurrence)
-            return generated_holidays
-
-    def check_holiday(self, *args, **kwargs):
+        month, weekday, occurrence = self.holiday_rule.month, self.holiday_rule.day, self.holiday_rule.occurrence
+        return DayUtils.generates_occurrence_dates_frequency_for_certain_period(
+            start_date=date(year, 1, 1),
+            period=0,
+            month=month,
+            day=weekday,
+            occurrence=occurrence)
+
+    def possible_window(self, year):
+        """
+           The nth occurrence of a weekday always falls within the nth seven-day block of the month.
+
+           Args:
+               year (int): The year to check.
+
+           Returns:
+               tuple: (earliest, latest) dates the holiday can fall on.
+           """
+        earliest = date(year, self.holiday_rule.month, 1) + timedelta(days=(self.holiday_rule.occurrence - 1) * 7)
+        return earliest, earliest + timedelta(days=6)
+
+    @staticmethod
+    def check_holiday(*args, **kwargs):
         """
            Validates the weekday and month values for correctness.
 
@@ -343,14 +780,18 @@ class CertainOccurrenceHoliday(HolidayFactoryInterface):
                bool: True if the parameters are valid, otherwise raises an exception.
 
            Raises:
-               Exception: If the weekday or month values are invalid.
+               ValueError: If the weekday, month or occurrence values are invalid.
            """
         month, day, occurrence = kwargs.get('month'), kwargs.get('day'), kwargs.get('occurrence')
 
-        if not month and occurrence and day:
-            raise Exception("Month and Occurrence and day required !!")
+        if not all(isinstance(value, int) for value in (month, day, occurrence)):
+            raise ValueError("Month and Occurrence and day required !!")
 
-        if not 0 < month < 12 and not 0 <= day < 7 :
-            raise Exception("Month and day must be valid range !!.")
+        if not 1 <= month <= 12 or not 0 <= day < 7 or not 1 <= occurrence <= 5:
+            raise ValueError("Month and day must be valid range !!.")
 
         return True
+
+
+HOLIDAY_CLASSES = {holiday_class.holiday_type: holiday_class
+                   for holiday_class in (PublicHoliday, MoveableHoliday, CertainOccurrenceHoliday)}
@@ -0,0 +1,264 @@
+import logging
+import threading
+
+from src.business_calendar import BusinessCalendar
+
+logger = logging.getLogger(__name__)
+
+
+class FenwickTree:
+    """
+    A binary indexed tree of counts over positions 0..size-1: point updates and prefix sums in O(log n).
+    """
+
+    def __init__(self, size, positions=()):
+        """
+        Builds the tree in O(n) with a count of 1 at each of `positions`.
+
+        :param size: int -> Number of positions.
+        :param positions: iterable of int -> Positions starting with a count of 1, each in [0, size).
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+        for position in positions:
+            self.tree[position + 1] += 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                self.tree[parent] += self.tree[index]
+
+    def add(self, position, delta):
+        """
+        Adds `delta` to the count at `position`.
+        """
+        index = position + 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, end):
+        """
+        :param end: int -> Exclusive end position, clamped to [0, size].
+        :return: int -> Sum of the counts at positions [0, end).
+        """
+        index = min(max(end, 0), self.size)
+        total = 0
+        while index:
+            total += self.tree[index]
+            index &= index - 1
+        return total
+
+
+class MutableBusinessCalendar(BusinessCalendar):
+    """
+    A BusinessCalendar whose holidays can be added and removed while it is in use.
+
+    Holidays are counted by a Fenwick tree over the days of the horizon, so `add_holiday`, `remove_holiday` and the
+    holiday and business-day counts are all O(log n), with no rebuild. Every effective mutation increments `version`,
+    which result caches use to invalidate precisely. `holiday_ordinals` and `holiday_slots` are rebuilt lazily, once
+    per version, for the consumers that need the sorted arrays (batch functions, calendar files, joint calendars).
+
+    Holidays outside the horizon are ignored, and holidays on non-working days are not stored, as in
+    BusinessCalendar.
+
+    Mutations are serialized by a lock. The lazily built year bitmaps, per-year totals and holiday snapshot are built
+    under the same lock, so a mutation never lands between reading the holidays and storing the result, and a cached
+    entry is never left behind by a later mutation. A query running during a mutation may still see it half applied:
+    share `freeze()` snapshots with reader threads when they need consistent answers.
+    """
+
+    def set_holidays(self, holiday_ordinals):
+        """
+        Indexes the initial holidays in the Fenwick tree.
+
+        :param holiday_ordinals: iterable of int -> Proleptic Gregorian ordinals, in any order, duplicates allowed.
+        """
+        self.first_ordinal = self.year_first_ordinals[0]
+        self.holiday_set = {ordinal for ordinal in holiday_ordinals
+                            if self.is_weekday_ordinal(ordinal) and self.in_horizon(ordinal)}
+        self.holiday_counts = FenwickTree(self.year_first_ordinals[-1] - self.first_ordinal,
+                                          (ordinal - self.first_ordinal for ordinal in self.holiday_set))
+        self.snapshot = None
+        self.numpy_holidays = None
+        self.year_bitmaps = {}
+        self.version = 0
+        self.lock = threading.RLock()
+
+    def in_horizon(self, ordinal):
+        """
+        :return: bool -> True if the ordinal lies between January 1st of start_year and December 31st of end_year.
+        """
+        return self.year_first_ordinals[0] <= ordinal < self.year_first_ordinals[-1]
+
+    @property
+    def holiday_ordinals(self):
+        """
+        Sorted tuple of the current holidays, rebuilt on first access after a mutation.
+        """
+        return self.get_snapshot()[0]
+
+    @property
+    def holiday_slots(self):
+        """
+        Business-day slot of each current holiday, rebuilt on first access after a mutation.
+        """
+        return self.get_snapshot()[1]
+
+    def get_snapshot(self):
+        """
+        :return: tuple -> (sorted holiday ordinals, holiday slots, version they were built for).
+        """
+        snapshot = self.snapshot
+        if snapshot is None or snapshot[2] != self.version:
+            with self.lock:
+                snapshot = self.snapshot
+                if snapshot is None or snapshot[2] != self.version:
+                    ordinals = tuple(sorted(self.holiday_set))
+                    slots = tuple(self.weekdays_before(ordinal) - index for index, ordinal in enumerate(ordinals))
+                    snapshot = self.snapshot = (ordinals, slots, self.version)
+        return snapshot
+
+    def year_bitmap(self, year):
+        """
+        Business-day bitmap of a year, built under the lock on a miss; `update_holiday` keeps cached ones current.
+
+        :param year: int -> A year inside the horizon.
+        :return: int -> Bitmap with bit i set when day i of the year (0 = January 1st) is a business day.
+        """
+        bitmap = self.year_bitmaps.get(year)
+        if bitmap is None:
+            with self.lock:
+                bitmap = BusinessCalendar.year_bitmap(self, year)
+        return bitmap
+
+    def build_year_tables(self):
+        """
+        Builds the per-year totals under the lock, so a mutation cannot reset them while they are being computed.
+
+        :return: tuple -> `cumulative_business_days`.
+        """
+        cumulative = self.cumulative_business_days
+        if cumulative is None:
+            with self.lock:
+                cumulative = BusinessCalendar.build_year_tables(self)
+        return cumulative
+
+    def business_days_in_year(self, year):
+        """
+        :param year: int -> A year inside the horizon.
+        :return: int -> Number of business days in the year, from the Fenwick tree.
+        """
+        index = year - self.start_year
+        return self.count_year_table_range(self.year_first_ordinals[index], self.year_first_ordinals[index + 1])
+
+    def add_holiday(self, day):
+        """
+        Closes a working day, e.g. for an ad-hoc closure.
+
+        :param day: date object -> The day to close.
+        :return: bool -> True if the calendar changed, False if the day was already a holiday or not a working day.
+        :raises ValueError: If the day is outside the calendar horizon.
+        """
+        return self.update_holiday(day, add=True)
+
+    def remove_holiday(self, day):
+        """
+        Reopens a holiday.
+
+        :param day: date object -> The holiday to remove.
+        :return: bool -> True if the calendar changed, False if the day was not a holiday.
+        :raises ValueError: If the day is outside the calendar horizon.
+        """
+        return self.update_holiday(day, add=False)
+
+    def update_holiday(self, day, add):
+        """
+        Adds or removes one holiday: updates the set and the Fenwick tree, flips the bit of a cached year bitmap,
+        drops the per-year totals and the NumPy holiday arrays and bumps the version.
+        """
+        self.check_horizon(day, day)
+        ordinal = day.toordinal()
+        with self.lock:
+            if not self.is_weekday_ordinal(ordinal) or (ordinal in self.holiday_set) == add:
+                return False
+
+            if add:
+                self.holiday_set.add(ordinal)
+            else:
+                self.holiday_set.discard(ordinal)
+            self.holiday_counts.add(ordinal - self.first_ordinal, 1 if add else -1)
+            bitmap = self.year_bitmaps.get(day.year)
+            if bitmap is not None:
+                offset = ordinal - self.year_first_ordinals[day.year - self.start_year]
+                self.year_bitmaps[day.year] = bitmap ^ 1 << offset
+            self.reset_year_tables()
+            self.numpy_holidays = None
+            self.version += 1
+        logger.info("%s holiday %s (version %d).", "Added" if add else "Removed", day, self.version)
+        return True
+
+    def freeze(self):
+        """
+        Returns an immutable BusinessCalendar with the current holidays, safe to share with reader threads while this
+        calendar keeps changing. The snapshot keeps `rule_hash` only while no holiday was added or removed, since it
+        no longer matches the rules afterwards.
+
+        :return: BusinessCalendar
+        """
+        with self.lock:
+            holiday_ordinals = tuple(self.holiday_set)
+            rule_hash = self.rule_hash if self.version == 0 else b""
+        return BusinessCalendar.from_ordinals(holiday_ordinals, start_year=self.start_year, end_year=self.end_year,
+                                              weekmask=self.weekmask, rule_hash=rule_hash)
+
+    def holidays_before(self, ordinal):
+        """
+        Cumulative number of holidays strictly before `ordinal`, from the Fenwick tree.
+
+        :param ordinal: int -> Proleptic Gregorian ordinal.
+        :return: int -> Number of holidays before the ordinal.
+        """
+        return self.holiday_counts.prefix_sum(ordinal - self.first_ordinal)
+
+    def holidays_between(self, start_date, end_date):
+        """
+        Counts holidays strictly between two dates.
+
+        :param start_date: date object indicating the start date of the range.
+        :param end_date: date object indicating the end date of the range.
+        :return: int -> Number of holidays in the range.
+        """
+        self.check_horizon(start_date, end_date)
+        start_ordinal, end_ordinal = start_date.toordinal(), end_date.toordinal()
+        if end_ordinal - start_ordinal <= 1:
+            return 0
+        return self.holidays_before(end_ordinal) - self.holidays_before(start_ordinal + 1)
+
+    def count_year_table_range(self, start_ordinal, end_ordinal):
+        """
+        Counts business days in the half-open ordinal range [start_ordinal, end_ordinal) from two Fenwick prefix
+        sums, so multi-year counts stay O(log n) without rebuilding the per-year totals after every mutation.
+
+        :param start_ordinal: int -> First ordinal of the range.
+        :param end_ordinal: int -> Ordinal after the last one of the range.
+        :return: int -> Number of business days.
+        """
+        return self.business_days_before(end_ordinal) - self.business_days_before(start_ordinal)
+
+    def business_day_ordinal(self, position):
+        """
+        Inverse of `business_days_before`, by binary search: the answer lies between the weekday at `position` (no
+        holiday before it) and the weekday at `position` plus the number of holidays.
+
+        :param position: int -> Zero-based business-day position.
+        :return: int -> Proleptic Gregorian ordinal of a business day.
+        """
+        low = self.weekday_ordinal(position)
+        high = self.weekday_ordinal(position + len(self.holiday_set))
+        while low < high:
+            middle = (low + high) // 2
+            if self.business_days_before(middle + 1) > position:
+                high = middle
+            else:
+                low = middle + 1
+        return low
@@ -0,0 +1,112 @@
+"""
+Process-pool batch runner.
+
+Splits a stream of (start_date, end_date) pairs into chunks and fans them out to a `ProcessPoolExecutor`. Each worker
+compiles its `BusinessCalendar` once in the pool initializer and then only counts; results are written back in input
+order while at most a bounded number of chunks is in flight, so memory stays constant for any input size.
+"""
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from src.business_calendar import BusinessCalendar, DEFAULT_END_YEAR, DEFAULT_START_YEAR
+from src.business_day_counter import BusinessDayCounter
+from src.cli import DEFAULT_CHUNK_SIZE, count_chunk, iter_chunks, read_csv_rows, read_jsonl_rows, write_chunk
+from src.date_utils import DayUtils, DEFAULT_WEEKMASK
+
+logger = logging.getLogger(__name__)
+
+# Chunks submitted per worker before the runner waits for the oldest one to be written.
+DEFAULT_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# State of the current worker process, filled in once by init_worker().
+WORKER_STATE = {}
+
+
+def init_worker(command, public_holiday_list=None, holiday_rules=None, weekmask=DEFAULT_WEEKMASK,
+                start_year=DEFAULT_START_YEAR, end_year=DEFAULT_END_YEAR):
+    """
+    Pool initializer: builds the quiet counter and, for the business command, the compiled calendar once per
+    worker process.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+    WORKER_STATE["command"] = command
+    WORKER_STATE["business_day_counter"] = BusinessDayCounter(day_utils_obj=DayUtils(weekmask=weekmask), quiet=True)
+    WORKER_STATE["calendar"] = None
+    if command == "business":
+        WORKER_STATE["calendar"] = BusinessCalendar(public_holiday_list=public_holiday_list,
+                                                    holiday_rules=holiday_rules, start_year=start_year,
+                                                    end_year=end_year, weekmask=weekmask)
+
+
+def count_worker_chunk(chunk):
+    """
+    Counts one chunk inside a worker process.
+
+    :param chunk: list of (start, end, line number) rows with ISO date strings.
+    :return: tuple -> (counts, worker pid, seconds spent counting).
+    """
+    started = time.perf_counter()
+    counts = count_chunk(WORKER_STATE["command"], chunk, WORKER_STATE["business_day_counter"],
+                         WORKER_STATE["calendar"])
+    return counts, os.getpid(), time.perf_counter() - started
+
+
+def record_worker_stats(worker_stats, pid, rows, seconds, failed=0):
+    """
+    Adds one finished chunk to the per-worker throughput statistics.
+    """
+    stats = worker_stats.setdefault(pid, {"chunks": 0, "rows": 0, "failed": 0, "seconds": 0.0,
+                                          "rows_per_second": 0.0})
+    stats["chunks"] += 1
+    stats["rows"] += rows
+    stats["failed"] += failed
+    stats["seconds"] += seconds
+    if stats["seconds"]:
+        stats["rows_per_second"] = stats["rows"] / stats["seconds"]
+
+
+def run_parallel(command, input_stream, output_stream, input_format="csv", chunk_size=DEFAULT_CHUNK_SIZE,
+                 workers=None, public_holiday_list=None, holiday_rules=None, weekmask=DEFAULT_WEEKMASK,
+                 start_year=DEFAULT_START_YEAR, end_year=DEFAULT_END_YEAR):
+    """
+    Parallel counterpart of `src.cli.run`. The output is identical to the sequential runner, in input order.
+
+    :param workers: int -> Number of worker processes, defaults to the CPU count.
+    :return: dict -> Per-worker statistics keyed by pid: chunks, rows, rows failed (written without a count),
+             seconds spent counting and rows_per_second.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+
+    rows = read_csv_rows(input_stream) if input_format == "csv" else read_jsonl_rows(input_stream)
+    if input_format == "csv":
+        output_stream.write(f"start_date,end_date,{command}\n")
+
+    worker_stats = {}
+    pending = deque()
+    max_in_flight = workers * DEFAULT_CHUNKS_IN_FLIGHT_PER_WORKER
+
+    def write_oldest():
+        chunk, future = pending.popleft()
+        counts, pid, seconds = future.result()
+        failed = write_chunk(input_format, command, chunk, counts, output_stream)
+        record_worker_stats(worker_stats, pid, len(chunk), seconds, failed)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(command, public_holiday_list, holiday_rules, weekmask,
+                                       start_year, end_year)) as executor:
+        for chunk in iter_chunks(rows, chunk_size):
+            pending.append((chunk, executor.submit(count_worker_chunk, chunk)))
+            if len(pending) >= max_in_flight:
+                write_oldest()
+        while pending:
+            write_oldest()
+
+    for pid, stats in worker_stats.items():
+        logger.info("Worker %d counted %d rows in %d chunks (%.0f rows/s).",
+                    pid, stats["rows"], stats["chunks"], stats["rows_per_second"])
+    return worker_stats
@@ -0,0 +1,129 @@
+"""
+Opt-in per-stage profiling of business-day queries.
+
+The counting pipeline reports the wall time and the allocated-block delta of these stages:
+
+    validate_dates             the `validate_dates` checks, excluding the wrapped function
+    weekend_math               `total_weekend_days_count` / `count_weekend_days`
+    get_objects                `HolidayFactory.get_objects`
+    get_holidays               `BusinessDayCounter.get_holidays`, rule expansion and filtering included
+    calculate_public_holidays  filtering a holiday list (`count_public_holidays`), lazy rule expansion included
+
+Stages nest, so times are inclusive: get_holidays contains the get_objects and calculate_public_holidays calls it
+makes. Profiling is enabled for the current thread or task only, inside `profile()`:
+
+    with profile("London") as profiler:
+        counter.business_days_between_two_dates(start, end, holiday_rules=rules)
+    profiler.snapshot()  # {"London": {"weekend_math": {"calls": 1, "seconds": ..., "allocated_blocks": ...}, ...}}
+
+When no profiler is active each stage costs one context-variable lookup.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+VALIDATE_DATES = "validate_dates"
+WEEKEND_MATH = "weekend_math"
+GET_OBJECTS = "get_objects"
+GET_HOLIDAYS = "get_holidays"
+CALCULATE_PUBLIC_HOLIDAYS = "calculate_public_holidays"
+STAGES = (VALIDATE_DATES, WEEKEND_MATH, GET_OBJECTS, GET_HOLIDAYS, CALCULATE_PUBLIC_HOLIDAYS)
+
+DEFAULT_CALENDAR_LABEL = "default"
+
+# Profiler of the current thread or asyncio task, None when profiling is disabled.
+ACTIVE_PROFILER = ContextVar("active_profiler", default=None)
+
+
+class StageProfiler:
+    """
+    Aggregates stage timings per calendar.
+
+    Attributes:
+        calendar: Label the next records are aggregated under, set by `profile()`.
+        track_allocations (bool): Whether to record the change in allocated memory blocks of each stage.
+        callback: Optional callable(calendar, stage, seconds, allocated_blocks) invoked for every record.
+        stats (dict): {calendar: {stage: {"calls", "seconds", "allocated_blocks"}}}.
+    """
+
+    def __init__(self, track_allocations=True, callback=None):
+        """
+        :param track_allocations: bool -> Record `sys.getallocatedblocks()` deltas, the net number of blocks a stage
+                                  left allocated (e.g. holiday objects kept by a factory).
+        :param callback: callable(calendar, stage, seconds, allocated_blocks) -> Called for every record (optional).
+        """
+        self.calendar = DEFAULT_CALENDAR_LABEL
+        self.track_allocations = track_allocations
+        self.callback = callback
+        self.stats = {}
+
+    def start(self):
+        """
+        :return: tuple -> Token to pass to `stop()` at the end of the stage.
+        """
+        return time.perf_counter(), sys.getallocatedblocks() if self.track_allocations else 0
+
+    def stop(self, stage, token):
+        """
+        Records one stage started with `start()`.
+
+        :param stage: str -> Stage name, one of STAGES.
+        :param token: tuple -> Value returned by `start()`.
+        """
+        seconds = time.perf_counter() - token[0]
+        allocated_blocks = sys.getallocatedblocks() - token[1] if self.track_allocations else 0
+        self.record(self.calendar, stage, seconds, allocated_blocks)
+
+    def record(self, calendar, stage, seconds, allocated_blocks=0):
+        """
+        Adds one stage measurement to the aggregate of `calendar`.
+        """
+        stages = self.stats.setdefault(calendar, {})
+        entry = stages.get(stage)
+        if entry is None:
+            entry = stages[stage] = {"calls": 0, "seconds": 0.0, "allocated_blocks": 0}
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        entry["allocated_blocks"] += allocated_blocks
+        if self.callback is not None:
+            self.callback(calendar, stage, seconds, allocated_blocks)
+
+    def snapshot(self):
+        """
+        :return: dict -> Copy of the aggregates: {calendar: {stage: {"calls", "seconds", "allocated_blocks",
+                 "mean_seconds"}}}.
+        """
+        return {calendar: {stage: dict(entry, mean_seconds=entry["seconds"] / entry["calls"])
+                           for stage, entry in stages.items()}
+                for calendar, stages in self.stats.items()}
+
+    def reset(self):
+        """
+        Drops every aggregate.
+        """
+        self.stats = {}
+
+
+@contextmanager
+def profile(calendar=DEFAULT_CALENDAR_LABEL, profiler=None, track_allocations=True, callback=None):
+    """
+    Enables stage profiling for the current thread or task.
+
+    :param calendar: Label the stages are aggregated under, e.g. the calendar name.
+    :param profiler: StageProfiler to aggregate into, so several blocks or calendars share one snapshot. A new one is
+                     created when omitted.
+    :param track_allocations: bool -> Passed to a new StageProfiler.
+    :param callback: callable -> Passed to a new StageProfiler.
+    :return: The active StageProfiler.
+    """
+    if profiler is None:
+        profiler = StageProfiler(track_allocations=track_allocations, callback=callback)
+    previous_calendar = profiler.calendar
+    profiler.calendar = calendar
+    token = ACTIVE_PROFILER.set(profiler)
+    try:
+        yield profiler
+    finally:
+        ACTIVE_PROFILER.reset(token)
+        profiler.calendar = previous_calendar
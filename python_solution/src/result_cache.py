@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_RESULT_CACHE_SIZE = 65536
+
+
+class ResultCache(object):
+    """
+    A bounded LRU cache of query results, with an optional time to live.
+
+    Used by BusinessDayCounter to memoize `business_days_between_two_dates`. Keys hold the calendar together with its
+    `version`, so a calendar that changes is never answered from results computed before the change; those entries
+    simply stop being hit and age out. Lookups and updates are serialized by a lock, so one cache can serve several
+    threads; results are computed outside the lock.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept before the least recently used is evicted.
+        ttl (float): Seconds an entry stays valid, or None for no expiry.
+        clock (callable): Monotonic time source, `time.monotonic` by default.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to compute the result.
+        evictions (int): Number of entries dropped because the cache was full.
+        expirations (int): Number of entries dropped because they outlived the ttl.
+
+    Methods:
+        get_or_compute(): Returns the cached result for a key, computing it on a miss.
+        stats(): Returns a snapshot of the counters.
+        clear(): Drops every entry and resets the counters.
+    """
+
+    def __init__(self, maxsize=DEFAULT_RESULT_CACHE_SIZE, ttl=None, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the result stored under `key`, calling `compute()` only on a miss or after the entry expired.
+
+        Args:
+            key (hashable): The query key.
+            compute (callable): Function returning the result of the query.
+
+        Returns:
+            The cached or freshly computed result.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at is None or self.clock() < expires_at:
+                    self.hits += 1
+                    self.entries.move_to_end(key)
+                    return result
+                del self.entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        result = compute()
+        with self.lock:
+            self.entries[key] = (result, None if self.ttl is None else self.clock() + self.ttl)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, expirations, current size, maxsize and ttl.
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "expirations": self.expirations, "size": len(self.entries), "maxsize": self.maxsize,
+                    "ttl": self.ttl}
+
+    def clear(self):
+        """
+        Drops every cached result and resets the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
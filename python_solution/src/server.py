@@ -0,0 +1,355 @@
+"""
+Asyncio query server.
+
+Serves weekday counts, business-day counts and business-day offsets as newline-delimited JSON over a local TCP or
+Unix socket. Calendars are compiled once at startup and stay warm. Requests arriving within a short window, from
+any number of connections, are coalesced into one vectorized evaluation per (operation, calendar):
+
+    python -m src.server --port 8765 --holiday-rules rules.json
+
+    > {"id": 1, "op": "business", "start_date": "2022-12-26", "end_date": "2023-01-03"}
+    < {"id": 1, "result": 4}
+    > {"id": 2, "op": "add", "start_date": "2022-12-30", "business_days": 1, "calendar": "default"}
+    < {"id": 2, "result": "2023-01-03"}
+"""
+import argparse
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import date
+
+import numpy as np
+
+from src.batch import add_business_days_many, business_days_between_many, total_weekend_days_count
+from src.business_calendar import BusinessCalendar, DEFAULT_END_YEAR, DEFAULT_START_YEAR
+from src.calendar_file import load_or_build_calendar
+from src.cli import load_json_file, load_public_holidays
+from src.date_utils import DEFAULT_WEEKMASK
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALENDAR = "default"
+DEFAULT_BATCH_WINDOW = 0.002
+DEFAULT_MAX_BATCH_SIZE = 4096
+# Requests a single connection may have in flight before the server stops reading from it.
+DEFAULT_MAX_PENDING_PER_CONNECTION = 1024
+
+OPERATIONS = ("weekdays", "business", "add", "subtract")
+# No offset can stay inside any calendar beyond this many days, and it keeps offset arithmetic within int64.
+MAX_BUSINESS_DAYS = date.max.toordinal()
+
+
+class RequestCoalescer:
+    """
+    Collects queries from concurrent requests and evaluates them in batches.
+
+    The first query of an empty batch schedules a flush `batch_window` seconds later; a batch that reaches
+    `max_batch_size` is flushed at once, which bounds both the added latency and the batch cost.
+
+    Attributes:
+        calendars (dict): Compiled BusinessCalendar objects by name.
+        batch_window (float): Seconds a batch stays open after its first query.
+        max_batch_size (int): Number of queries that triggers an immediate flush.
+        stats (dict): Number of requests and batches evaluated and the largest batch seen.
+    """
+
+    def __init__(self, calendars, batch_window=DEFAULT_BATCH_WINDOW, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.calendars = calendars
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.pending = []
+        self.flush_handle = None
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    def submit(self, operation, calendar_name, first, second):
+        """
+        Queues one query and returns a future for its result.
+
+        :param operation: One of OPERATIONS.
+        :param calendar_name: Name of a compiled calendar.
+        :param first: int -> ordinal of the start date.
+        :param second: int -> ordinal of the end date, or the business-day offset for add/subtract.
+        :return: asyncio.Future resolved with the int count or the result date.
+        :raises KeyError: If the calendar is unknown.
+        """
+        if calendar_name not in self.calendars:
+            raise KeyError(f"Unknown calendar {calendar_name!r}")
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((operation, calendar_name, first, second, future))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self.flush)
+        return future
+
+    def flush(self):
+        """
+        Evaluates every pending query, one vectorized call per (operation, calendar) group.
+        """
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+
+        self.stats["requests"] += len(pending)
+        self.stats["batches"] += 1
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(pending))
+
+        groups = defaultdict(list)
+        for query in pending:
+            groups[query[0], query[1]].append(query)
+        for (operation, calendar_name), queries in groups.items():
+            calendar = self.calendars[calendar_name]
+            futures = [query[4] for query in queries]
+            try:
+                firsts = np.fromiter((query[2] for query in queries), dtype=np.int64, count=len(queries))
+                seconds = np.fromiter((query[3] for query in queries), dtype=np.int64, count=len(queries))
+                if operation == "weekdays":
+                    self.resolve(futures, evaluate_weekdays(firsts, seconds, calendar))
+                elif operation == "business":
+                    self.resolve(futures, evaluate_business_days(firsts, seconds, calendar))
+                else:
+                    self.resolve(futures, evaluate_offsets(firsts, -seconds if operation == "subtract" else seconds,
+                                                           calendar))
+            except Exception as e:
+                logger.exception("Batch evaluation failed.")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+    @staticmethod
+    def resolve(futures, results):
+        """
+        Completes each future with its result; ValueError results are raised from the future instead.
+        """
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, ValueError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def evaluate_weekdays(start_ordinals, end_ordinals, calendar):
+    """
+    Weekdays strictly between each pair, using the calendar's weekmask and ignoring its holidays.
+
+    :return: list of int counts.
+    """
+    total_days = np.maximum(end_ordinals - start_ordinals - 1, 0)
+    return (total_days - total_weekend_days_count(start_ordinals, total_days, weekmask=calendar.weekmask)).tolist()
+
+
+def evaluate_business_days(start_ordinals, end_ordinals, calendar):
+    """
+    Business days strictly between each pair. Empty ranges count 0; rows outside the horizon become ValueErrors.
+
+    :return: list of int counts or ValueError objects.
+    """
+    counts, valid = business_days_between_many(start_ordinals, end_ordinals, calendar=calendar, return_mask=True)
+    outside_horizon = ~valid & (start_ordinals < end_ordinals)
+    horizon_error = ValueError(f"Dates must be within the calendar horizon {calendar.start_year}-{calendar.end_year}")
+    return [horizon_error if outside else count for count, outside in zip(counts.tolist(), outside_horizon.tolist())]
+
+
+def evaluate_offsets(ordinals, offsets, calendar):
+    """
+    Moves each date by its offset in business days. When any row leaves the horizon the batch falls back to
+    per-row evaluation, so only the offending rows fail.
+
+    :return: list of ISO date strings or ValueError objects.
+    """
+    try:
+        return [date.fromordinal(ordinal).isoformat()
+                for ordinal in add_business_days_many(ordinals, offsets, calendar).tolist()]
+    except ValueError:
+        results = []
+        for ordinal, offset in zip(ordinals.tolist(), offsets.tolist()):
+            try:
+                results.append(calendar.add_business_days(date.fromordinal(ordinal), offset).isoformat())
+            except ValueError as e:
+                results.append(e)
+        return results
+
+
+def parse_request(line):
+    """
+    Decodes one request line.
+
+    :param line: bytes -> JSON object with `op`, `start_date` and `end_date` or `business_days`, and optional `id`
+                 and `calendar` keys.
+    :return: tuple -> (request id, operation, calendar name, first, second) as expected by RequestCoalescer.submit.
+    :raises ValueError: If the request is malformed.
+    """
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    operation = request.get("op")
+    if operation not in OPERATIONS:
+        raise ValueError(f"op must be one of {', '.join(OPERATIONS)}")
+    try:
+        first = date.fromisoformat(request["start_date"]).toordinal()
+        if operation in ("weekdays", "business"):
+            second = date.fromisoformat(request["end_date"]).toordinal()
+        else:
+            second = request["business_days"]
+            if not isinstance(second, int) or isinstance(second, bool):
+                raise ValueError("business_days must be an integer")
+            if abs(second) > MAX_BUSINESS_DAYS:
+                raise ValueError(f"business_days must be between -{MAX_BUSINESS_DAYS} and {MAX_BUSINESS_DAYS}")
+    except KeyError as e:
+        raise ValueError(f"Missing field {e}") from e
+    except TypeError as e:
+        raise ValueError(str(e)) from e
+    return request.get("id"), operation, request.get("calendar", DEFAULT_CALENDAR), first, second
+
+
+class BusinessDayServer:
+    """
+    Newline-delimited JSON server in front of a RequestCoalescer.
+
+    Each connection may pipeline requests; responses are written in request order. Reading pauses while a
+    connection has `max_pending` unanswered requests, which keeps memory and queueing delay bounded.
+    """
+
+    def __init__(self, calendars, batch_window=DEFAULT_BATCH_WINDOW, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_pending=DEFAULT_MAX_PENDING_PER_CONNECTION):
+        """
+        :param calendars: dict -> compiled BusinessCalendar objects by name, queried with the `calendar` key.
+        :param batch_window: float -> seconds a batch stays open after its first request.
+        :param max_batch_size: int -> number of requests that triggers an immediate flush.
+        :param max_pending: int -> unanswered requests per connection before reading pauses.
+        """
+        self.coalescer = RequestCoalescer(calendars, batch_window=batch_window, max_batch_size=max_batch_size)
+        self.max_pending = max_pending
+        self.connection_tasks = set()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Reads requests from one connection and hands their futures to a writer task, in order.
+        """
+        self.connection_tasks.add(asyncio.current_task())
+        responses = asyncio.Queue(maxsize=self.max_pending)
+        writer_task = asyncio.create_task(self.write_responses(responses, writer))
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    await responses.put(self.submit_line(line))
+            await responses.put(None)
+            await writer_task
+        except (ConnectionError, asyncio.CancelledError):
+            writer_task.cancel()
+        finally:
+            writer.close()
+            self.connection_tasks.discard(asyncio.current_task())
+
+    async def wait_connections_closed(self):
+        """
+        Waits until every open connection has been answered and closed by its client.
+        """
+        if self.connection_tasks:
+            await asyncio.wait(self.connection_tasks)
+
+    def submit_line(self, line):
+        """
+        :return: tuple -> (request id, future or ValueError for a malformed request).
+        """
+        try:
+            request_id, operation, calendar_name, first, second = parse_request(line)
+        except ValueError as e:
+            return None, e
+        try:
+            return request_id, self.coalescer.submit(operation, calendar_name, first, second)
+        except KeyError as e:
+            return request_id, ValueError(e.args[0])
+
+    async def write_responses(self, responses, writer):
+        """
+        Writes one JSON response per request, draining the transport whenever its buffer fills.
+        """
+        while (item := await responses.get()) is not None:
+            request_id, future = item
+            try:
+                if isinstance(future, ValueError):
+                    raise future
+                response = {"id": request_id, "result": await future}
+            except ValueError as e:
+                response = {"id": request_id, "error": str(e)}
+            except Exception as e:
+                response = {"id": request_id, "error": f"Internal error: {e}"}
+            writer.write(json.dumps(response).encode() + b"\n")
+            if responses.empty():
+                await writer.drain()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Starts listening on a TCP port, or on a Unix socket when `path` is given.
+
+        :return: asyncio.Server
+        """
+        if path:
+            return await asyncio.start_unix_server(self.handle_connection, path=path)
+        return await asyncio.start_server(self.handle_connection, host=host, port=port)
+
+
+def build_parser():
+    """
+    :return: argparse.ArgumentParser for the command line.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.server",
+                                     description="Serve weekday and business-day queries as JSON lines.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", help="Listen on this Unix socket path instead of TCP.")
+    parser.add_argument("--holiday-rules", help="JSON file with a list of holiday rule objects.")
+    parser.add_argument("--public-holidays", help="JSON file with a list of ISO dates.")
+    parser.add_argument("--weekmask", default=DEFAULT_WEEKMASK, help="Working days, Monday first (default 1111100).")
+    parser.add_argument("--start-year", type=int, default=DEFAULT_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=DEFAULT_END_YEAR)
+    parser.add_argument("--calendar-file", help="Map the compiled calendar from this file, rebuilding it when stale.")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW,
+                        help="Seconds to wait for more requests before evaluating a batch.")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    return parser
+
+
+async def serve(args):
+    """
+    Compiles (or maps) the default calendar and serves until cancelled.
+    """
+    options = dict(public_holiday_list=load_public_holidays(args.public_holidays) if args.public_holidays else None,
+                   holiday_rules=load_json_file(args.holiday_rules) if args.holiday_rules else None,
+                   start_year=args.start_year, end_year=args.end_year, weekmask=args.weekmask)
+    if args.calendar_file:
+        calendar = load_or_build_calendar(args.calendar_file, **options)
+    else:
+        calendar = BusinessCalendar(**options)
+    server = await BusinessDayServer({DEFAULT_CALENDAR: calendar}, batch_window=args.batch_window,
+                                     max_batch_size=args.max_batch_size).start(args.host, args.port,
+                                                                               args.unix_socket)
+    logger.warning("Serving on %s", ", ".join(str(socket.getsockname()) for socket in server.sockets))
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Parses the command line and runs the server.
+
+    :param argv: list of arguments, defaults to sys.argv.
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
+    logging.getLogger().setLevel(logging.WARNING)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import datetime
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from src.profiling import ACTIVE_PROFILER, VALIDATE_DATES
+
 logger = logging.getLogger(__name__)
 
 def validate_dates(func):
@@ -19,6 +20,9 @@ def validate_dates(func):
     :return: Result of the decorated function or 0 if dates are invalid
     """
     def wrapper(start_date, end_date):
+        profiler = ACTIVE_PROFILER.get()
+        if profiler is not None:
+            token = profiler.start()
         logger.info("Validating dates: start_date=%s, end_date=%s", start_date, end_date)
 
         if not isinstance(start_date, datetime.date) or not isinstance(end_date, datetime.date):
@@ -34,8 +38,12 @@ def validate_dates(func):
 
         if start_date >= end_date:
             logger.warning("Invalid date range: start_date >= end_date. Returning 0.")
+            if profiler is not None:
+                profiler.stop(VALIDATE_DATES, token)
             return 0
 
+        if profiler is not None:
+            profiler.stop(VALIDATE_DATES, token)
         result = func(start_date, end_date)
         logger.info("Result after validation: %s", result)
         return result
@@ -15,6 +15,7 @@ def run(start_end_date_list):
     :return:
     """
     day_utils_obj = DayUtils()
+    business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
     case_number = 0
 
     for _date_list in start_end_date_list:
@@ -32,7 +33,6 @@ def run(start_end_date_list):
 
         logging.info(f"Start date: {start_date}, End date: {end_date}")
 
-        business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
         total_week_days = business_day_counter.weekdays_between_two_dates(start_date, end_date)
 
         logging.info("=" * 50)
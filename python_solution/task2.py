@@ -15,6 +15,7 @@ def run(start_end_date_list, public_holiday_list):
     :return:
     """
     day_utils_obj = DayUtils()
+    business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
 
     case_number = 0
 
@@ -36,7 +37,6 @@ def run(start_end_date_list, public_holiday_list):
             continue
 
         logging.info(f"Start date: {start_date}, End date: {end_date}")
-        business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
         total_work_days = business_day_counter.business_days_between_two_dates(start_date, end_date,
                                                                                public_holiday_list=public_holiday_list)
 
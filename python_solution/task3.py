@@ -4,6 +4,7 @@ import logging
 
 from src.business_day_counter import BusinessDayCounter
 from src.date_utils import DayUtils
+from src.factory import compile_rules
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -15,6 +16,9 @@ def run(start_end_date_list, holiday_rules):
     :return:
     """
     day_utils_obj = DayUtils()
+    business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
+    if holiday_rules is not None:
+        holiday_rules = compile_rules(holiday_rules)  # validated once, not on every query
     case_number = 0
     for _date_list in start_end_date_list:
         case_number += 1
@@ -34,7 +38,6 @@ def run(start_end_date_list, holiday_rules):
             continue
 
         logging.info(f"Start date: {start_date}, End date: {end_date}")
-        business_day_counter = BusinessDayCounter(day_utils_obj=day_utils_obj)
         total_work_days = business_day_counter.business_days_between_two_dates(start_date, end_date,
                                                                                holiday_rules=holiday_rules)
 
@@ -0,0 +1,220 @@
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.mutable_calendar import MutableBusinessCalendar
+from unit_tests.test_business_calendar import HOLIDAY_RULES
+
+
+class TestBusinessDaysBetweenMany(unittest.TestCase):
+    """
+    Unit tests for the vectorized batch API.
+    """
+
+    def setUp(self):
+        self.business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        self.calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2025)
+
+    def test_weekend_arithmetic_matches_day_utils(self):
+        """
+        Without holidays the batch result must equal weekdays_between_two_dates row by row.
+        """
+        base = date(2023, 1, 2)
+        pairs = [(base + timedelta(days=i), base + timedelta(days=i + length))
+                 for i in range(7) for length in range(0, 40)]
+        starts = np.array([start for start, _ in pairs], dtype="datetime64[D]")
+        ends = np.array([end for _, end in pairs], dtype="datetime64[D]")
+
+        result = self.business_day_counter.business_days_between_many(starts, ends, public_holiday_list=[])
+        expected = [self.business_day_counter.weekdays_between_two_dates(start, end) for start, end in pairs]
+        self.assertEqual(result.tolist(), expected)
+
+    def test_matches_single_calendar_queries(self):
+        """
+        With rule holidays the batch must agree with the scalar calendar query.
+        """
+        starts = np.arange(date(2022, 12, 1).toordinal(), date(2023, 7, 1).toordinal(), 3)
+        ends = starts + 17
+        result = self.business_day_counter.business_days_between_many(starts, ends, calendar=self.calendar)
+        expected = [self.calendar.business_days_between(date.fromordinal(int(start)), date.fromordinal(int(end)))
+                    for start, end in zip(starts, ends)]
+        self.assertEqual(result.tolist(), expected)
+
+    def test_invalid_rows_are_masked(self):
+        """
+        Reversed rows and rows outside the horizon produce 0 and are flagged in the mask.
+        """
+        starts = np.array(["2023-01-10", "2023-01-02", "2019-01-01"], dtype="datetime64[D]")
+        ends = np.array(["2023-01-02", "2023-01-10", "2019-02-01"], dtype="datetime64[D]")
+        counts, mask = self.business_day_counter.business_days_between_many(starts, ends, calendar=self.calendar,
+                                                                             return_mask=True)
+        self.assertEqual(counts.tolist(), [0, 5, 0])
+        self.assertEqual(mask.tolist(), [False, True, False])
+
+    def test_invalid_rows_do_not_size_the_compiled_horizon(self):
+        """
+        Without a calendar, NaT, reversed and unrepresentable rows are masked instead of failing the batch.
+        """
+        starts = np.array(["NaT", "2023-01-02", "9999-06-01", "0001-01-05", "2023-01-02"], dtype="datetime64[D]")
+        ends = np.array(["2023-01-10", "2023-01-10", "9999-07-01", "0001-01-01", "NaT"], dtype="datetime64[D]")
+        counts, mask = self.business_day_counter.business_days_between_many(starts, ends, holiday_rules=HOLIDAY_RULES,
+                                                                             return_mask=True)
+        self.assertEqual(counts.tolist(), [0, 5, 0, 0, 0])
+        self.assertEqual(mask.tolist(), [False, True, False, False, False])
+
+    def test_rejects_unsupported_dtype(self):
+        """
+        Only datetime64 and integer ordinal arrays are accepted.
+        """
+        with self.assertRaises(TypeError):
+            self.business_day_counter.business_days_between_many(["2023-01-01"], ["2023-01-05"],
+                                                                 calendar=self.calendar)
+
+    def test_holiday_arrays_are_built_once_per_version(self):
+        """
+        The NumPy holiday arrays are reused across batch calls and rebuilt after a mutable calendar changes.
+        """
+        ordinals, slots = self.calendar.holiday_arrays()
+        self.assertEqual(ordinals.tolist(), list(self.calendar.holiday_ordinals))
+        self.assertEqual(slots.tolist(), list(self.calendar.holiday_slots))
+        self.assertFalse(ordinals.flags.writeable)
+        self.business_day_counter.business_days_between_many(np.array([date(2023, 1, 2).toordinal()]),
+                                                             np.array([date(2023, 1, 10).toordinal()]),
+                                                             calendar=self.calendar)
+        self.assertIs(self.calendar.holiday_arrays()[0], ordinals)
+
+        calendar = MutableBusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2025)
+        starts = np.array(["2023-01-02"], dtype="datetime64[D]")
+        ends = np.array(["2023-01-10"], dtype="datetime64[D]")
+        before = calendar.holiday_arrays()[0]
+        self.assertEqual(self.business_day_counter.business_days_between_many(starts, ends, calendar=calendar)
+                         .tolist(), [5])
+        calendar.add_holiday(date(2023, 1, 4))
+        self.assertIsNot(calendar.holiday_arrays()[0], before)
+        self.assertEqual(self.business_day_counter.business_days_between_many(starts, ends, calendar=calendar)
+                         .tolist(), [4])
+        self.assertEqual(calendar.holiday_arrays()[1].tolist(), list(calendar.holiday_slots))
+
+    def test_add_business_days_many(self):
+        """
+        The vectorized offset API agrees with the scalar one and keeps the input dtype.
+        """
+        dates = np.arange(date(2022, 12, 1).toordinal(), date(2023, 7, 1).toordinal(), 5)
+        offsets = np.resize(np.array([-12, -1, 0, 1, 3, 25]), dates.shape)
+        result = self.business_day_counter.add_business_days_many(dates, offsets, calendar=self.calendar)
+        expected = [self.calendar.add_business_days(date.fromordinal(int(ordinal)), int(offset)).toordinal()
+                    for ordinal, offset in zip(dates, offsets)]
+        self.assertEqual(result.tolist(), expected)
+
+        as_datetime = self.business_day_counter.add_business_days_many(
+            np.array(["2022-12-30"], dtype="datetime64[D]"), 1, calendar=self.calendar)
+        self.assertEqual(as_datetime.tolist(), [date(2023, 1, 3)])
+
+
+class TestIterBusinessDayChunks(unittest.TestCase):
+    """
+    Unit tests for the chunked business-day iterator.
+    """
+
+    def setUp(self):
+        self.business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        self.calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2000, end_year=2025)
+
+    def test_chunks_concatenate_to_the_lazy_iterator(self):
+        start_date, end_date = date(2003, 4, 20), date(2024, 6, 11)
+        chunks = list(self.business_day_counter.iter_business_day_chunks(start_date, end_date, self.calendar,
+                                                                         chunk_size=1000))
+        expected = list(self.business_day_counter.iter_business_days(start_date, end_date, self.calendar))
+        self.assertTrue(all(len(chunk) == 1000 for chunk in chunks[:-1]))
+        self.assertLessEqual(len(chunks[-1]), 1000)
+        self.assertEqual(chunks[0].dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(np.concatenate(chunks).astype(object).tolist(), expected)
+
+    def test_ordinal_chunks_and_empty_ranges(self):
+        chunks = list(self.business_day_counter.iter_business_day_chunks(date(2024, 4, 22), date(2024, 4, 29),
+                                                                         self.calendar, as_ordinals=True))
+        self.assertEqual([chunk.tolist() for chunk in chunks],
+                         [[date(2024, 4, day).toordinal() for day in (23, 24, 26)]])
+        self.assertEqual(list(self.business_day_counter.iter_business_day_chunks(date(2024, 4, 27), date(2024, 4, 29),
+                                                                                 self.calendar)), [])
+        with self.assertRaises(ValueError):
+            self.business_day_counter.iter_business_day_chunks(date(2024, 1, 1), date(2024, 2, 1), self.calendar,
+                                                               chunk_size=0)
+
+
+class TestBusinessDayDistanceMatrix(unittest.TestCase):
+    """
+    Unit tests for the pairwise business-day distance matrix.
+    """
+
+    def setUp(self):
+        self.business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        self.calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2025)
+        self.dates = [date(2024, 4, 24), date(2024, 4, 26), date(2020, 1, 1), date(2024, 4, 25), date(2025, 12, 31),
+                      date(2024, 4, 24), date(2023, 6, 12)]
+
+    def test_matrix_matches_pairwise_queries(self):
+        matrix = self.business_day_counter.business_day_distance_matrix(
+            np.array(self.dates, dtype="datetime64[D]"), self.calendar)
+        self.assertEqual(matrix.shape, (len(self.dates), len(self.dates)))
+        self.assertEqual(matrix.tolist(), [[self.calendar.business_days_between(start, end) for end in self.dates]
+                                           for start in self.dates])
+
+    def test_condensed_upper_triangle(self):
+        ordinals = np.array([day.toordinal() for day in self.dates])
+        matrix = self.business_day_counter.business_day_distance_matrix(ordinals, self.calendar)
+        condensed = self.business_day_counter.business_day_distance_matrix(ordinals, self.calendar, condensed=True,
+                                                                           dtype="int32")
+        self.assertEqual(condensed.dtype, np.int32)
+        self.assertEqual(condensed.tolist(), matrix[np.triu_indices(len(self.dates), k=1)].tolist())
+        self.assertEqual(self.business_day_counter.business_day_distance_matrix(ordinals[:1], self.calendar,
+                                                                                condensed=True).size, 0)
+
+    def test_rejects_dates_outside_the_horizon(self):
+        with self.assertRaises(ValueError):
+            self.business_day_counter.business_day_distance_matrix(np.array(["2019-12-31", "2020-01-10"],
+                                                                            dtype="datetime64[D]"), self.calendar)
+
+
+class TestRollingBusinessDays(unittest.TestCase):
+    """
+    Unit tests for trailing-window business-day counts.
+    """
+
+    def setUp(self):
+        self.business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        self.calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2025)
+
+    def test_matches_range_queries(self):
+        dates = [date(2024, 3, 1) + timedelta(days=offset) for offset in range(120)]
+        dates.reverse()
+        for window in (1, 7, 30, 400):
+            result = self.business_day_counter.rolling_business_days(np.array(dates, dtype="datetime64[D]"), window,
+                                                                     self.calendar)
+            self.assertEqual(result.tolist(), [self.calendar.business_days_between(day - timedelta(days=window),
+                                                                                   day + timedelta(days=1))
+                                               for day in dates])
+
+    def test_sparse_ordinals_keep_their_shape(self):
+        ordinals = np.array([[date(2024, 4, 25).toordinal(), date(2024, 4, 26).toordinal()],
+                             [date(2025, 1, 5).toordinal(), date(2020, 12, 31).toordinal()]])
+        result = self.business_day_counter.rolling_business_days(ordinals, 1, self.calendar)
+        self.assertEqual(result.tolist(), [[0, 1], [0, 1]])
+        self.assertEqual(self.business_day_counter.rolling_business_days(np.array([], dtype=np.int64), 30,
+                                                                         self.calendar).size, 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.business_day_counter.rolling_business_days(np.array([date(2024, 1, 1).toordinal()]), 0,
+                                                            self.calendar)
+        with self.assertRaises(ValueError):
+            self.business_day_counter.rolling_business_days(np.array([date(2020, 1, 10).toordinal()]), 30,
+                                                            self.calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,302 @@
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils, build_weekday_year_bitmap
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+
+
+def brute_force_business_days(start_date, end_date, holidays):
+    """
+    Reference implementation that walks every day strictly between the two dates.
+    """
+    count = 0
+    current = start_date + timedelta(days=1)
+    while current < end_date:
+        if current.weekday() < 5 and current not in holidays:
+            count += 1
+        current += timedelta(days=1)
+    return count
+
+
+def brute_force_add_business_days(start_date, business_days, holidays):
+    """
+    Reference implementation that steps one day at a time until enough business days were seen.
+    """
+    step = timedelta(days=1 if business_days > 0 else -1)
+    current, remaining = start_date, abs(business_days)
+    while remaining:
+        current += step
+        if current.weekday() < 5 and current not in holidays:
+            remaining -= 1
+    return current
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    """
+    Unit tests for the BusinessCalendar holiday index.
+    """
+
+    def setUp(self):
+        self.public_holiday_list = [date(2013, 12, 25), date(2013, 12, 26), date(2014, 1, 1),
+                                    date(2013, 12, 25)]
+        self.calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list,
+                                         holiday_rules=HOLIDAY_RULES, start_year=2010, end_year=2030)
+
+    def test_holidays_are_sorted_and_deduplicated(self):
+        """
+        Duplicate static holidays and holidays generated by both sources must appear once.
+        """
+        ordinals = self.calendar.holiday_ordinals
+        self.assertEqual(list(ordinals), sorted(set(ordinals)))
+        self.assertEqual(ordinals.count(date(2014, 1, 1).toordinal()), 1)
+
+    def test_weekend_holidays_are_not_indexed(self):
+        """
+        Anzac Day 2015 falls on a Saturday and must not be stored.
+        """
+        self.assertNotIn(date(2015, 4, 25).toordinal(), self.calendar.holiday_ordinals)
+
+    def test_task_examples(self):
+        """
+        The examples from task2 and task3 still produce the documented results.
+        """
+        static_calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list[:3])
+        self.assertEqual(static_calendar.business_days_between(date(2013, 10, 7), date(2013, 10, 9)), 1)
+        self.assertEqual(static_calendar.business_days_between(date(2013, 12, 24), date(2013, 12, 27)), 0)
+        self.assertEqual(static_calendar.business_days_between(date(2013, 10, 7), date(2014, 1, 1)), 59)
+
+        rules_calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES)
+        self.assertEqual(rules_calendar.business_days_between(date(2022, 12, 26), date(2023, 1, 3)), 4)
+        self.assertEqual(rules_calendar.business_days_between(date(2023, 4, 20), date(2023, 4, 27)), 3)
+        self.assertEqual(rules_calendar.business_days_between(date(2023, 6, 9), date(2023, 6, 15)), 2)
+
+    def test_matches_brute_force(self):
+        """
+        Every range starting in a short window must agree with a day-by-day walk.
+        """
+        holidays = {date.fromordinal(ordinal) for ordinal in self.calendar.holiday_ordinals}
+        base = date(2013, 12, 20)
+        for start_offset in range(10):
+            for length in range(0, 30):
+                start_date = base + timedelta(days=start_offset)
+                end_date = start_date + timedelta(days=length)
+                self.assertEqual(self.calendar.business_days_between(start_date, end_date),
+                                 brute_force_business_days(start_date, end_date, holidays))
+
+    def test_empty_and_reversed_ranges(self):
+        """
+        Adjacent, equal and reversed dates contain no business days.
+        """
+        self.assertEqual(self.calendar.business_days_between(date(2023, 1, 3), date(2023, 1, 4)), 0)
+        self.assertEqual(self.calendar.business_days_between(date(2023, 1, 3), date(2023, 1, 3)), 0)
+        self.assertEqual(self.calendar.business_days_between(date(2023, 1, 9), date(2023, 1, 3)), 0)
+
+    def test_outside_horizon(self):
+        """
+        Queries outside the expanded years must be rejected rather than silently missing rule holidays.
+        """
+        with self.assertRaises(ValueError):
+            self.calendar.business_days_between(date(2009, 12, 1), date(2010, 1, 5))
+
+    def test_business_day_counter_accepts_calendar(self):
+        """
+        BusinessDayCounter delegates to the calendar and rejects mixing it with ad-hoc holidays.
+        """
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        start_date, end_date = date(2013, 10, 7), date(2014, 1, 1)
+        self.assertEqual(
+            business_day_counter.business_days_between_two_dates(start_date, end_date, calendar=self.calendar),
+            business_day_counter.business_days_between_two_dates(start_date, end_date,
+                                                                 public_holiday_list=self.public_holiday_list[:3],
+                                                                 holiday_rules=HOLIDAY_RULES))
+        with self.assertRaises(ValueError):
+            business_day_counter.business_days_between_two_dates(start_date, end_date, calendar=self.calendar,
+                                                                 holiday_rules=HOLIDAY_RULES)
+
+
+class TestBusinessDayOffsets(unittest.TestCase):
+    """
+    Unit tests for add_business_days / subtract_business_days.
+    """
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(public_holiday_list=[date(2013, 12, 25), date(2013, 12, 26)],
+                                         holiday_rules=HOLIDAY_RULES, start_year=2010, end_year=2030)
+        self.holidays = {date.fromordinal(ordinal) for ordinal in self.calendar.holiday_ordinals}
+
+    def test_matches_brute_force(self):
+        """
+        Offsets in both directions agree with stepping day by day, across weekends and holidays.
+        """
+        base = date(2013, 12, 18)
+        for start_offset in range(20):
+            start_date = base + timedelta(days=start_offset)
+            for business_days in range(-30, 31):
+                expected = start_date if business_days == 0 else \
+                    brute_force_add_business_days(start_date, business_days, self.holidays)
+                self.assertEqual(self.calendar.add_business_days(start_date, business_days), expected)
+
+    def test_consistent_with_counting(self):
+        """
+        T+N is the N-th business day after T, so N - 1 business days lie strictly between them.
+        """
+        start_date = date(2022, 12, 23)
+        for business_days in range(1, 400, 37):
+            result = self.calendar.add_business_days(start_date, business_days)
+            self.assertEqual(self.calendar.business_days_between(start_date, result), business_days - 1)
+            self.assertEqual(self.calendar.subtract_business_days(result, business_days - 1),
+                             self.calendar.add_business_days(start_date, 1))
+
+    def test_business_day_counter_offsets(self):
+        """
+        BusinessDayCounter compiles a calendar around the start date when none is given.
+        """
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        self.assertEqual(business_day_counter.add_business_days(date(2022, 12, 30), 1, holiday_rules=HOLIDAY_RULES),
+                         date(2023, 1, 3))
+        self.assertEqual(business_day_counter.subtract_business_days(date(2023, 1, 3), 1, calendar=self.calendar),
+                         date(2022, 12, 30))
+
+    def test_business_day_counter_sizes_the_horizon(self):
+        """
+        The compiled horizon follows the weekmask and grows when static holidays fill whole years.
+        """
+        sundays_only = BusinessDayCounter(day_utils_obj=DayUtils(weekmask="0000001"), quiet=True)
+        self.assertEqual(sundays_only.add_business_days(date(2024, 6, 1), 100), date(2026, 4, 26))
+        self.assertEqual(sundays_only.subtract_business_days(date(2024, 6, 1), 100), date(2022, 7, 3))
+
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        closed_years = [date(2023, 1, 1) + timedelta(days=offset) for offset in range(3 * 366)]
+        self.assertEqual(business_day_counter.add_business_days(date(2023, 1, 1), 5,
+                                                                public_holiday_list=closed_years),
+                         date(2026, 1, 9))
+
+    def test_result_outside_horizon(self):
+        with self.assertRaises(ValueError):
+            self.calendar.add_business_days(date(2030, 12, 1), 100)
+
+    def test_business_day_counter_fails_fast_at_the_edge_of_the_range(self):
+        """
+        Offsets that cannot fit before year 9999 (or after year 1) fail before any calendar is compiled.
+        """
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        with patch("src.business_day_counter.BusinessCalendar") as calendar_class, \
+                patch("src.business_day_counter.compile_offset_calendar") as compile_calendar:
+            for start_date, business_days in [(date(9999, 6, 1), 1), (date(9999, 6, 1), -1),
+                                              (date(9998, 12, 1), 30), (date(1, 1, 20), -20)]:
+                with self.assertRaises(ValueError):
+                    business_day_counter.add_business_days(start_date, business_days, holiday_rules=HOLIDAY_RULES)
+            calendar_class.assert_not_called()
+            compile_calendar.assert_not_called()
+        self.assertEqual(business_day_counter.add_business_days(date(9998, 12, 1), 20), date(9998, 12, 29))
+
+    def test_business_day_counter_reuses_estimated_calendars(self):
+        """
+        Offsets on the same holidays share one compiled calendar until the horizon has to be widened.
+        """
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        first = business_day_counter.get_offset_calendar(date(2023, 3, 1), 10, holiday_rules=HOLIDAY_RULES)
+        self.assertIs(business_day_counter.get_offset_calendar(date(2023, 3, 1), -10,
+                                                               holiday_rules=[dict(rule) for rule in HOLIDAY_RULES]),
+                      first)
+        renamed_rules = [dict(rule, description="renamed") for rule in HOLIDAY_RULES]
+        self.assertIsNot(business_day_counter.get_offset_calendar(date(2023, 3, 1), 10, holiday_rules=renamed_rules),
+                         first)
+        self.assertIsNot(business_day_counter.get_offset_calendar(date(2023, 3, 1), 10, holiday_rules=HOLIDAY_RULES,
+                                                                  span=4), first)
+
+    def test_horizon_must_stop_before_the_last_year(self):
+        for start_year, end_year in [(9990, 9999), (0, 10), (2020, 2010)]:
+            with self.assertRaises(ValueError):
+                BusinessCalendar(start_year=start_year, end_year=end_year)
+            with self.assertRaises(ValueError):
+                BusinessCalendar.from_ordinals([], start_year=start_year, end_year=end_year)
+        with self.assertRaisesRegex(ValueError, "1-9998"):
+            BusinessCalendar(start_year=9990, end_year=9999)
+        self.assertEqual(BusinessCalendar(start_year=9998, end_year=9998).business_days_in_year(9998), 261)
+
+
+class TestBusinessDayBitmaps(unittest.TestCase):
+    """
+    Unit tests for the per-year business-day bitmaps.
+    """
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(public_holiday_list=[date(2013, 12, 25), date(2013, 12, 26)],
+                                         holiday_rules=HOLIDAY_RULES, start_year=2010, end_year=2030)
+        self.holidays = {date.fromordinal(ordinal) for ordinal in self.calendar.holiday_ordinals}
+
+    def test_weekday_year_bitmap(self):
+        for year in (2023, 2024, 2100):
+            bitmap = build_weekday_year_bitmap("1111100", year)
+            days = [date(year, 1, 1) + timedelta(days=offset) for offset in range(bitmap.bit_length() + 7)]
+            self.assertEqual([bool(bitmap >> offset & 1) for offset, day in enumerate(days)],
+                             [day.year == year and day.weekday() < 5 for day in days])
+        self.assertEqual(DayUtils(weekmask="1111001").weekday_year_bitmap(2024).bit_count(), 262)
+
+    def test_is_business_day(self):
+        day = date(2013, 12, 1)
+        while day < date(2014, 2, 1):
+            self.assertEqual(self.calendar.is_business_day(day), day.weekday() < 5 and day not in self.holidays)
+            day += timedelta(days=1)
+        with self.assertRaises(ValueError):
+            self.calendar.is_business_day(date(2031, 1, 1))
+
+    def test_bitmap_counts_match_bisect_counts(self):
+        """
+        Popcount counts agree with the cumulative-position formula within a year, across one year boundary and
+        across leap days.
+        """
+        for start_date in (date(2013, 12, 20), date(2015, 12, 31), date(2016, 2, 27), date(2024, 1, 1)):
+            for length in range(0, 800, 11):
+                end_date = start_date + timedelta(days=length)
+                if length < 2:
+                    continue
+                self.assertEqual(self.calendar.count_bitmap_range(start_date.toordinal() + 1, end_date.toordinal()),
+                                 self.calendar.business_days_before(end_date.toordinal())
+                                 - self.calendar.business_days_before(start_date.toordinal() + 1))
+                self.assertEqual(self.calendar.business_days_between(start_date, end_date),
+                                 brute_force_business_days(start_date, end_date, self.holidays))
+
+
+class TestYearTables(unittest.TestCase):
+    """
+    Unit tests for the per-year and cumulative business-day tables.
+    """
+
+    def setUp(self):
+        self.calendar = BusinessCalendar(public_holiday_list=[date(2013, 12, 25), date(2013, 12, 26)],
+                                         holiday_rules=HOLIDAY_RULES, start_year=1990, end_year=2060)
+        self.holidays = {date.fromordinal(ordinal) for ordinal in self.calendar.holiday_ordinals}
+
+    def test_year_totals(self):
+        self.assertIsNone(self.calendar.cumulative_business_days)
+        for year in (1990, 2013, 2024, 2060):
+            self.assertEqual(self.calendar.business_days_in_year(year),
+                             brute_force_business_days(date(year - 1, 12, 31), date(year + 1, 1, 1), self.holidays))
+        self.assertEqual(len(self.calendar.cumulative_business_days), 2060 - 1990 + 2)
+        self.assertEqual(self.calendar.cumulative_business_days[-1], sum(self.calendar.year_business_days))
+
+    def test_multi_year_counts_match_bisect_counts(self):
+        for start_date in (date(1990, 1, 1), date(1995, 12, 31), date(2013, 12, 24), date(2016, 2, 29)):
+            for end_date in (date(2015, 1, 1), date(2029, 12, 31), date(2045, 6, 15), date(2060, 12, 31)):
+                start_ordinal, end_ordinal = start_date.toordinal() + 1, end_date.toordinal()
+                self.assertEqual(self.calendar.count_year_table_range(start_ordinal, end_ordinal),
+                                 self.calendar.business_days_before(end_ordinal)
+                                 - self.calendar.business_days_before(start_ordinal), (start_date, end_date))
+        self.assertEqual(self.calendar.business_days_between(date(2000, 6, 30), date(2030, 7, 1)),
+                         brute_force_business_days(date(2000, 6, 30), date(2030, 7, 1), self.holidays))
+
+
+if __name__ == "__main__":
+    unittest.main()
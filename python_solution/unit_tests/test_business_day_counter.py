@@ -1,7 +1,10 @@
 import unittest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
+from src.business_calendar import BusinessCalendar
 from src.business_day_counter import BusinessDayCounter
+from src.date_utils import PROLEPTIC, UNIX_EPOCH, UNIX_EPOCH_ORDINAL, DayUtils
+from src.factory import HOLIDAY_EXPANSION_CACHE
 
 
 class TestBusinessDayCounter(unittest.TestCase):
@@ -107,5 +110,209 @@ class TestBusinessDayCounter(unittest.TestCase):
         )
 
 
+class TestQuietMode(unittest.TestCase):
+    """
+    Unit tests for the quiet fast path and its aggregate counters.
+    """
+
+    def setUp(self):
+        self.holiday_rules = [
+            {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+        ]
+        self.public_holiday_list = [date(2013, 12, 25), date(2013, 12, 26), date(2014, 1, 1)]
+        self.verbose_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        self.quiet_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+
+    def test_quiet_results_match_verbose(self):
+        """
+        Quiet mode returns exactly what the logging path returns.
+        """
+        base = date(2013, 12, 20)
+        for start_offset in range(0, 14, 3):
+            for length in range(0, 30, 2):
+                start_date = base + timedelta(days=start_offset)
+                end_date = start_date + timedelta(days=length)
+                self.assertEqual(self.quiet_counter.weekdays_between_two_dates(start_date, end_date),
+                                 self.verbose_counter.weekdays_between_two_dates(start_date, end_date))
+                self.assertEqual(
+                    self.quiet_counter.business_days_between_two_dates(
+                        start_date, end_date, public_holiday_list=self.public_holiday_list,
+                        holiday_rules=self.holiday_rules),
+                    self.verbose_counter.business_days_between_two_dates(
+                        start_date, end_date, public_holiday_list=self.public_holiday_list,
+                        holiday_rules=self.holiday_rules))
+
+    def test_quiet_mode_emits_no_log_records(self):
+        """
+        No log record is created on the hot path, including with a compiled calendar or a moveable holiday that
+        falls on a weekend (New Year's Day 2022 is a Saturday).
+        """
+        calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list)
+        HOLIDAY_EXPANSION_CACHE.clear()
+        with self.assertNoLogs(level="DEBUG"):
+            self.quiet_counter.weekdays_between_two_dates(date(2013, 10, 7), date(2014, 1, 1))
+            self.quiet_counter.business_days_between_two_dates(date(2013, 10, 7), date(2014, 1, 1),
+                                                               calendar=calendar)
+            self.quiet_counter.business_days_between_two_dates(date(2013, 10, 7), date(2013, 10, 5))
+            self.quiet_counter.business_days_between_two_dates("2013-10-07", date(2013, 10, 5))
+            self.quiet_counter.business_days_between_two_dates(date(2021, 12, 20), date(2022, 1, 10),
+                                                               holiday_rules=self.holiday_rules)
+            self.quiet_counter.business_days_between_ordinals(date(2026, 12, 20).toordinal(),
+                                                              date(2027, 1, 10).toordinal(),
+                                                              holiday_rules=self.holiday_rules)
+
+        HOLIDAY_EXPANSION_CACHE.clear()
+        with self.assertLogs("src.factory", level="INFO"):
+            self.verbose_counter.business_days_between_two_dates(date(2021, 12, 20), date(2022, 1, 10),
+                                                                 holiday_rules=self.holiday_rules)
+
+    def test_coinciding_holidays_are_subtracted_once(self):
+        """
+        Two rules moved onto the same Monday and a repeated list entry match the compiled calendar.
+        """
+        holiday_rules = [
+            {"holiday_type": "moveable_holiday", "description": "New Year's Eve", "month": 12, "day": 31},
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+        ]
+        public_holiday_list = [date(2023, 1, 6), date(2023, 1, 6)]
+        start_date, end_date = date(2022, 12, 20), date(2023, 1, 10)
+        calendar = BusinessCalendar(public_holiday_list=public_holiday_list, holiday_rules=holiday_rules,
+                                    start_year=2022, end_year=2023)
+        expected = calendar.business_days_between(start_date, end_date)
+        self.assertEqual(expected, 12)
+        for counter in (self.verbose_counter, self.quiet_counter):
+            self.assertEqual(counter.business_days_between_two_dates(start_date, end_date,
+                                                                     public_holiday_list=public_holiday_list,
+                                                                     holiday_rules=holiday_rules), expected)
+        self.assertEqual(self.quiet_counter.business_days_between_ordinals(
+            start_date.toordinal(), end_date.toordinal(),
+            public_holiday_list=[holiday.toordinal() for holiday in public_holiday_list],
+            holiday_rules=holiday_rules), expected)
+
+    def test_counters(self):
+        """
+        Calls, zero-range returns, subtracted holidays and swallowed errors are aggregated.
+        """
+        self.quiet_counter.business_days_between_two_dates(date(2013, 12, 24), date(2013, 12, 27),
+                                                           public_holiday_list=self.public_holiday_list)
+        self.quiet_counter.business_days_between_two_dates(date(2013, 12, 27), date(2013, 12, 24))
+        self.quiet_counter.weekdays_between_two_dates(date(2013, 12, 24), date(2013, 12, 25))
+        self.quiet_counter.weekdays_between_two_dates(None, date(2013, 12, 25))
+        self.assertEqual(self.quiet_counter.get_counters(),
+                         {"calls": 4, "zero_range_returns": 2, "holidays_subtracted": 2, "errors": 1})
+
+        self.quiet_counter.reset_counters()
+        self.assertEqual(self.quiet_counter.get_counters()["calls"], 0)
+
+
+
+class TestOrdinalEntryPoints(unittest.TestCase):
+    """
+    Unit tests for the integer day-number entry points.
+    """
+
+    def setUp(self):
+        self.holiday_rules = [
+            {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+        ]
+        self.public_holiday_list = [date(2013, 12, 25), date(2013, 12, 26), date(2014, 1, 1)]
+        self.calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list, start_year=2000,
+                                         end_year=2030, weekmask="1111001")
+        self.date_counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask="1111001"), quiet=True)
+        self.counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask="1111001"), quiet=True)
+
+    def test_results_match_date_entry_points(self):
+        for epoch, offset in ((PROLEPTIC, 0), (UNIX_EPOCH, UNIX_EPOCH_ORDINAL)):
+            base = date(2013, 12, 20)
+            for start_offset in range(0, 9):
+                for length in (-3, 0, 1, 2, 5, 9, 17, 400, 3000):
+                    start_date = base + timedelta(days=start_offset)
+                    end_date = start_date + timedelta(days=length)
+                    start, end = start_date.toordinal() - offset, end_date.toordinal() - offset
+                    self.assertEqual(self.counter.weekdays_between_ordinals(start, end, epoch=epoch),
+                                     self.date_counter.weekdays_between_two_dates(start_date, end_date))
+                    self.assertEqual(
+                        self.counter.business_days_between_ordinals(
+                            start, end, public_holiday_list=[day.toordinal() - offset
+                                                             for day in self.public_holiday_list], epoch=epoch),
+                        self.date_counter.business_days_between_two_dates(
+                            start_date, end_date, public_holiday_list=self.public_holiday_list))
+                    self.assertEqual(
+                        self.counter.business_days_between_ordinals(start, end, holiday_rules=self.holiday_rules,
+                                                                    epoch=epoch),
+                        self.date_counter.business_days_between_two_dates(start_date, end_date,
+                                                                          holiday_rules=self.holiday_rules))
+                    self.assertEqual(
+                        self.counter.business_days_between_ordinals(start, end, calendar=self.calendar, epoch=epoch),
+                        self.date_counter.business_days_between_two_dates(start_date, end_date,
+                                                                          calendar=self.calendar))
+                    self.assertEqual(self.calendar.business_days_between_ordinals(start + offset, end + offset),
+                                     self.calendar.business_days_between(start_date, end_date))
+
+    def test_add_business_days_ordinal(self):
+        start_date = date(2013, 12, 23)
+        for business_days in (-10, -1, 0, 1, 3, 250):
+            expected = self.calendar.add_business_days(start_date, business_days)
+            self.assertEqual(self.counter.add_business_days_ordinal(start_date.toordinal(), business_days,
+                                                                    calendar=self.calendar),
+                             expected.toordinal())
+            self.assertEqual(self.counter.add_business_days_ordinal(start_date.toordinal() - UNIX_EPOCH_ORDINAL,
+                                                                    business_days, calendar=self.calendar,
+                                                                    epoch=UNIX_EPOCH),
+                             expected.toordinal() - UNIX_EPOCH_ORDINAL)
+
+    def test_errors_and_horizon(self):
+        self.assertEqual(self.counter.business_days_between_ordinals(0, 20000, calendar=self.calendar,
+                                                                     epoch=UNIX_EPOCH), 0)
+        self.assertEqual(self.counter.business_days_between_ordinals(0, 20000, calendar=self.calendar,
+                                                                     epoch="julian"), 0)
+        self.assertEqual(self.counter.get_counters()["errors"], 2)
+        with self.assertRaises(ValueError):
+            self.counter.weekdays_between_ordinals(0, 20000, epoch="julian")
+        with self.assertRaises(ValueError):
+            self.calendar.business_days_between_ordinals(date(1999, 12, 31).toordinal(), date(2001, 1, 1).toordinal())
+
+
+class TestIterBusinessDays(unittest.TestCase):
+    """
+    Unit tests for the lazy business-day iterator.
+    """
+
+    def setUp(self):
+        self.public_holiday_list = [date(2013, 12, 25), date(2013, 12, 26), date(2014, 1, 1), date(2013, 12, 28)]
+        self.calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list, start_year=2000,
+                                         end_year=2030)
+        self.counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+
+    def test_yields_the_counted_dates(self):
+        base = date(2013, 12, 18)
+        for start_offset in range(0, 9):
+            for length in (-3, 0, 1, 2, 5, 9, 17, 400):
+                start_date = base + timedelta(days=start_offset)
+                end_date = start_date + timedelta(days=length)
+                expected = [start_date + timedelta(days=offset) for offset in range(1, length)
+                            if (start_date + timedelta(days=offset)).weekday() < 5
+                            and start_date + timedelta(days=offset) not in self.public_holiday_list]
+                self.assertEqual(list(self.counter.iter_business_days(start_date, end_date, self.calendar)),
+                                 expected)
+                self.assertEqual(len(expected), self.counter.business_days_between_two_dates(
+                    start_date, end_date, calendar=self.calendar))
+
+    def test_ordinals_and_laziness(self):
+        iterator = self.counter.iter_business_days(date(2000, 1, 1), date(2030, 12, 31), self.calendar,
+                                                   as_ordinals=True)
+        self.assertEqual(next(iterator), date(2000, 1, 3).toordinal())
+        self.assertEqual(next(iterator), date(2000, 1, 4).toordinal())
+
+    def test_outside_horizon_fails_eagerly(self):
+        with self.assertRaises(ValueError):
+            self.counter.iter_business_days(date(1999, 12, 1), date(2000, 2, 1), self.calendar)
+        with self.assertRaises(ValueError):
+            self.counter.iter_business_days(date(2000, 1, 1), date(2000, 2, 1),
+                                            BusinessCalendar(weekmask="1111001"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import os
+import struct
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.batch import add_business_days_many, business_days_between_many
+from src.business_calendar import BusinessCalendar
+from src.calendar_file import (MappedBusinessCalendar, load_or_build_calendar, read_calendar_header,
+                               write_calendar_file)
+
+from unit_tests.test_business_calendar import HOLIDAY_RULES
+
+
+class TestCalendarFile(unittest.TestCase):
+    """
+    Unit tests for the binary calendar format and the memory-mapped loader.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "au.cal")
+        self.public_holiday_list = [date(2013, 12, 25), date(2013, 12, 26)]
+        self.calendar = BusinessCalendar(public_holiday_list=self.public_holiday_list, holiday_rules=HOLIDAY_RULES,
+                                         start_year=2010, end_year=2030, weekmask="1111110")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_answers_the_same_queries(self):
+        write_calendar_file(self.calendar, self.path)
+        with MappedBusinessCalendar(self.path) as mapped:
+            self.assertEqual(list(mapped.holiday_ordinals), list(self.calendar.holiday_ordinals))
+            self.assertEqual(list(mapped.holiday_slots), list(self.calendar.holiday_slots))
+            self.assertEqual((mapped.weekmask, mapped.start_year, mapped.end_year, mapped.rule_hash),
+                             (self.calendar.weekmask, 2010, 2030, self.calendar.rule_hash))
+
+            base = date(2013, 12, 20)
+            for length in range(0, 60, 3):
+                end_date = base + timedelta(days=length)
+                self.assertEqual(mapped.business_days_between(base, end_date),
+                                 self.calendar.business_days_between(base, end_date))
+            for business_days in range(-20, 21):
+                self.assertEqual(mapped.add_business_days(base, business_days),
+                                 self.calendar.add_business_days(base, business_days))
+
+            starts = np.array(["2013-10-07", "2022-12-26"], dtype="datetime64[D]")
+            ends = np.array(["2014-01-01", "2023-01-03"], dtype="datetime64[D]")
+            self.assertEqual(business_days_between_many(starts, ends, calendar=mapped).tolist(),
+                             business_days_between_many(starts, ends, calendar=self.calendar).tolist())
+            self.assertEqual(add_business_days_many(starts, 5, calendar=mapped).tolist(),
+                             add_business_days_many(starts, 5, calendar=self.calendar).tolist())
+
+    def test_empty_calendar(self):
+        write_calendar_file(BusinessCalendar(start_year=2020, end_year=2020), self.path)
+        with MappedBusinessCalendar(self.path) as mapped:
+            self.assertEqual(len(mapped.holiday_ordinals), 0)
+            self.assertEqual(mapped.business_days_between(date(2020, 1, 1), date(2020, 1, 10)), 6)
+
+    def test_invalid_files_are_rejected(self):
+        with open(self.path, "wb") as calendar_file:
+            calendar_file.write(b"not a calendar file at all, just some bytes to fill the header")
+        with self.assertRaises(ValueError):
+            MappedBusinessCalendar(self.path)
+
+        write_calendar_file(self.calendar, self.path)
+        with open(self.path, "r+b") as calendar_file:
+            calendar_file.seek(4)
+            calendar_file.write(struct.pack("<H", 99))
+        with self.assertRaises(ValueError):
+            read_calendar_header(self.path)
+
+        write_calendar_file(self.calendar, self.path)
+        with open(self.path, "r+b") as calendar_file:
+            calendar_file.truncate(os.path.getsize(self.path) - 4)
+        with self.assertRaises(ValueError):
+            MappedBusinessCalendar(self.path)
+
+    def test_load_or_build_reuses_matching_files_only(self):
+        options = dict(public_holiday_list=self.public_holiday_list, holiday_rules=HOLIDAY_RULES,
+                       start_year=2010, end_year=2030, weekmask="1111110")
+        with load_or_build_calendar(self.path, **options) as mapped:
+            self.assertEqual(list(mapped.holiday_ordinals), list(self.calendar.holiday_ordinals))
+        modified = os.path.getmtime(self.path)
+
+        with load_or_build_calendar(self.path, **options):
+            self.assertEqual(os.path.getmtime(self.path), modified)
+
+        options["holiday_rules"] = HOLIDAY_RULES[:1]
+        with load_or_build_calendar(self.path, **options) as mapped:
+            self.assertEqual(mapped.rule_hash, BusinessCalendar(**options).rule_hash)
+            self.assertNotEqual(mapped.rule_hash, self.calendar.rule_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
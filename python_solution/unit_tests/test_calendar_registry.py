@@ -0,0 +1,104 @@
+import unittest
+from datetime import date, timedelta
+
+from src.business_day_counter import BusinessDayCounter
+from src.calendar_registry import CalendarRegistry
+from src.date_utils import DayUtils
+from src.mutable_calendar import MutableBusinessCalendar
+
+
+LONDON_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "moveable_holiday", "description": "Christmas Day", "month": 12, "day": 25},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Early May", "month": 5, "day": 0,
+     "occurrence": 1},
+]
+SYDNEY_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+    {"holiday_type": "certain_occurrence_holiday", "description": "King's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+
+
+class TestCalendarRegistry(unittest.TestCase):
+    """
+    Unit tests for named calendars and their union/intersection calendars.
+    """
+
+    def setUp(self):
+        self.registry = CalendarRegistry()
+        self.registry.register("London", holiday_rules=LONDON_RULES, start_year=2015, end_year=2030)
+        self.registry.register("Sydney", holiday_rules=SYDNEY_RULES, start_year=2018, end_year=2035)
+        self.registry.register("Dubai", start_year=2015, end_year=2030, weekmask="1111001")
+
+    def assert_joint_days(self, joint, names, combine):
+        members = [self.registry.get(name) for name in names]
+        day = date(2023, 1, 1)
+        while day < date(2024, 1, 15):
+            self.assertEqual(joint.is_business_day(day), combine(member.is_business_day(day) for member in members),
+                             day)
+            day += timedelta(days=1)
+
+    def test_union_requires_a_business_day_everywhere(self):
+        joint = self.registry.union("London", "Sydney")
+        self.assert_joint_days(joint, ["London", "Sydney"], all)
+        self.assertEqual((joint.start_year, joint.end_year), (2018, 2030))
+        # New Year's Day is shared and must only be subtracted once.
+        self.assertEqual(joint.business_days_between(date(2022, 12, 30), date(2023, 1, 4)), 1)
+        self.assertEqual(joint.business_days_between(date(2023, 4, 24), date(2023, 5, 2)), 3)
+
+    def test_intersection_requires_a_business_day_somewhere(self):
+        joint = self.registry.intersection("London", "Sydney")
+        self.assert_joint_days(joint, ["London", "Sydney"], any)
+        self.assertIn(date(2023, 1, 2).toordinal(), joint.holiday_ordinals)
+        self.assertNotIn(date(2023, 4, 25).toordinal(), joint.holiday_ordinals)
+
+    def test_members_with_different_weekmasks(self):
+        self.assert_joint_days(self.registry.union("London", "Dubai"), ["London", "Dubai"], all)
+        self.assert_joint_days(self.registry.intersection("London", "Dubai"), ["London", "Dubai"], any)
+        self.assertEqual(self.registry.union("London", "Dubai").weekmask, "1111000")
+        self.assertEqual(self.registry.intersection("London", "Dubai").weekmask, "1111101")
+
+    def test_joint_calendars_are_cached_until_a_member_changes(self):
+        joint = self.registry.union("London", "Sydney")
+        self.assertIs(self.registry.union("Sydney", "London"), joint)
+        self.assertIsNot(self.registry.intersection("London", "Sydney"), joint)
+
+        self.registry.register("Sydney", holiday_rules=SYDNEY_RULES[:1], start_year=2018, end_year=2035)
+        self.assertIsNot(self.registry.union("London", "Sydney"), joint)
+        self.assertNotEqual(self.registry.union("London", "Sydney").rule_hash, joint.rule_hash)
+
+    def test_joint_calendars_follow_mutable_members(self):
+        brisbane = self.registry.add("Brisbane", MutableBusinessCalendar(start_year=2015, end_year=2030))
+        joint = self.registry.union("London", "Brisbane")
+        self.assertIs(self.registry.union("London", "Brisbane"), joint)
+        self.assertTrue(joint.is_business_day(date(2023, 8, 16)))
+
+        brisbane.add_holiday(date(2023, 8, 16))
+        self.assertFalse(brisbane.is_business_day(date(2023, 8, 16)))
+        self.assertFalse(self.registry.union("London", "Brisbane").is_business_day(date(2023, 8, 16)))
+        self.assertIs(self.registry.union("London", "Brisbane"), self.registry.union("Brisbane", "London"))
+
+    def test_joint_calendar_with_business_day_counter(self):
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        joint = self.registry.union("London", "Sydney")
+        start_date = date(2022, 12, 20)
+        for length in range(0, 200, 7):
+            end_date = start_date + timedelta(days=length)
+            self.assertEqual(business_day_counter.business_days_between_two_dates(start_date, end_date,
+                                                                                  calendar=joint),
+                             joint.business_days_between(start_date, end_date))
+
+    def test_errors(self):
+        with self.assertRaises(KeyError):
+            self.registry.union("London", "Tokyo")
+        with self.assertRaises(ValueError):
+            self.registry.union()
+        self.registry.register("Old", start_year=1990, end_year=2000)
+        with self.assertRaises(ValueError):
+            self.registry.union("Old", "Sydney")
+
+
+if __name__ == "__main__":
+    unittest.main()
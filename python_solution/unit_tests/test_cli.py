@@ -0,0 +1,121 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+
+from src.cli import iter_chunks, main, run
+
+
+class TestStreamingCli(unittest.TestCase):
+    """
+    Unit tests for the streaming command line entry point.
+    """
+
+    def test_weekdays_csv(self):
+        input_stream = io.StringIO("start_date,end_date\n2013-10-07,2013-10-09\n2013-10-05,2013-10-14\n"
+                                   "2013-10-07,2014-01-01\n2013-10-07,2013-10-05\n")
+        output_stream = io.StringIO()
+        processed = run("weekdays", input_stream, output_stream, chunk_size=3)
+
+        self.assertEqual(processed, 4)
+        self.assertEqual(output_stream.getvalue(), "start_date,end_date,weekdays\n2013-10-07,2013-10-09,1\n"
+                                                   "2013-10-05,2013-10-14,5\n2013-10-07,2014-01-01,61\n"
+                                                   "2013-10-07,2013-10-05,0\n")
+
+    def test_business_jsonl_with_rules(self):
+        holiday_rules = [{"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1}]
+        input_stream = io.StringIO('{"start_date": "2022-12-26", "end_date": "2023-01-03"}\n\n'
+                                   '{"start_date": "2013-12-24", "end_date": "2013-12-27"}\n')
+        output_stream = io.StringIO()
+        run("business", input_stream, output_stream, input_format="jsonl", holiday_rules=holiday_rules,
+            public_holiday_list=[date(2013, 12, 25), date(2013, 12, 26)])
+
+        self.assertEqual(output_stream.getvalue().splitlines(), [
+            '{"start_date": "2022-12-26", "end_date": "2023-01-03", "business": 4}',
+            '{"start_date": "2013-12-24", "end_date": "2013-12-27", "business": 0}',
+        ])
+
+    def test_rows_outside_the_horizon_have_no_count(self):
+        input_stream = io.StringIO("start_date,end_date\n2250-01-01,2250-02-01\n2013-10-07,2013-10-09\n")
+        output_stream = io.StringIO()
+        stats = {}
+        run("business", input_stream, output_stream, stats=stats)
+
+        self.assertEqual(output_stream.getvalue(), "start_date,end_date,business\n2250-01-01,2250-02-01,\n"
+                                                   "2013-10-07,2013-10-09,1\n")
+        self.assertEqual(stats, {"rows": 2, "failed": 1})
+
+    def test_malformed_dates_are_reported_by_line(self):
+        input_stream = io.StringIO("start_date,end_date\n2013-10-07,2013-10-09\n2013-13-01,2013-10-09\n"
+                                   "2013-10-07,2013-10-14\n")
+        output_stream = io.StringIO()
+        stats = {}
+        with self.assertLogs("src.cli", level="WARNING") as logs:
+            run("weekdays", input_stream, output_stream, chunk_size=2, stats=stats)
+
+        self.assertEqual(output_stream.getvalue(), "start_date,end_date,weekdays\n2013-10-07,2013-10-09,1\n"
+                                                   "2013-13-01,2013-10-09,\n2013-10-07,2013-10-14,4\n")
+        self.assertEqual(stats, {"rows": 3, "failed": 1})
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Line 3", logs.output[0])
+
+        output_stream = io.StringIO()
+        with self.assertLogs("src.cli", level="WARNING") as logs:
+            run("business", io.StringIO('{"start_date": "2013-10-07", "end_date": "2013-10-09"}\n\n'
+                                        '{"start_date": "2013-10-07", "end_date": null}\n'),
+                output_stream, input_format="jsonl")
+        self.assertEqual(output_stream.getvalue().splitlines()[1],
+                         '{"start_date": "2013-10-07", "end_date": null, "business": null}')
+        self.assertIn("Line 3", logs.output[0])
+
+    def run_main(self, command, content, suffix=".csv"):
+        with tempfile.NamedTemporaryFile("w", suffix=suffix, delete=False) as input_file:
+            input_file.write(content)
+        self.addCleanup(os.remove, input_file.name)
+        output_stream = io.StringIO()
+        with redirect_stdout(output_stream), self.assertLogs("src.cli", level="ERROR"):
+            exit_code = main([command, input_file.name])
+        return exit_code, output_stream.getvalue()
+
+    def test_main_exit_code_reports_failed_rows(self):
+        exit_code, output = self.run_main("business", "start_date,end_date\n2250-01-01,2250-02-01\n")
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output, "start_date,end_date,business\n2250-01-01,2250-02-01,\n")
+
+    def test_main_rejects_missing_fields(self):
+        self.assertEqual(self.run_main("weekdays", "start_date,end_date\n2013-10-07\n")[0], 1)
+        self.assertEqual(self.run_main("weekdays", '{"start_date": "2013-10-07", "end_date": null}\n',
+                                       suffix=".jsonl")[0], 1)
+
+    def test_main_reports_unreadable_files(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as rules_file:
+            rules_file.write("[{")
+        self.addCleanup(os.remove, rules_file.name)
+        missing = os.path.join(tempfile.gettempdir(), "missing-business-day-input.csv")
+        for argv in (["business", missing], ["business", "-", "--holiday-rules", rules_file.name],
+                     ["business", "-", "--public-holidays", missing]):
+            with self.assertLogs("src.cli", level="ERROR") as logs:
+                self.assertEqual(main(argv), 1)
+            self.assertIn("Cannot read input", logs.output[0])
+
+    def test_chunks_are_read_lazily(self):
+        """
+        Chunking never pulls more than one chunk ahead from the input iterator.
+        """
+        consumed = []
+
+        def rows():
+            for index in range(10):
+                consumed.append(index)
+                yield index
+
+        chunks = iter_chunks(rows(), 4)
+        self.assertEqual(next(chunks), [0, 1, 2, 3])
+        self.assertEqual(len(consumed), 4)
+        self.assertEqual(list(chunks), [[4, 5, 6, 7], [8, 9]])
+
+
+if __name__ == "__main__":
+    unittest.main()
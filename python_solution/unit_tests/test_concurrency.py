@@ -0,0 +1,138 @@
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.factory import HolidayExpansionCache, HolidayFactory
+from src.mutable_calendar import MutableBusinessCalendar
+from src.result_cache import ResultCache
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+THREADS = 8
+
+
+def date_pairs(count):
+    base = date(2000, 1, 1)
+    return [(base + timedelta(days=index * 37 % 9000), base + timedelta(days=index * 37 % 9000 + index % 800))
+            for index in range(count)]
+
+
+class TestConcurrency(unittest.TestCase):
+    """
+    Unit tests for sharing calendars, factories and caches between threads.
+    """
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def run_in_threads(self, function, items):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            return list(executor.map(function, items))
+
+    def test_factory_objects_are_created_once(self):
+        factory = HolidayFactory(holiday_rules=HOLIDAY_RULES, start_date=date(2020, 1, 1), end_date=date(2025, 1, 1))
+        results = self.run_in_threads(lambda _: factory.get_objects(), range(50))
+        self.assertEqual(len(factory.get_objects()), len(HOLIDAY_RULES))
+        self.assertTrue(all(len(objects) == len(HOLIDAY_RULES) for objects in results))
+        self.assertEqual(len({tuple(factory.iter_holidays()) for _ in range(3)}), 1)
+
+    def test_shared_calendar_matches_sequential_results(self):
+        calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2030)
+        reference = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=1999, end_year=2030)
+        pairs = date_pairs(2000)
+        results = self.run_in_threads(lambda pair: (calendar.business_days_between(*pair),
+                                                    calendar.is_business_day(pair[1])), pairs)
+        self.assertEqual(results, [(reference.business_days_between(*pair), reference.is_business_day(pair[1]))
+                                   for pair in pairs])
+
+    def test_shared_expansion_and_result_caches(self):
+        expansion_cache = HolidayExpansionCache(maxsize=8)
+        result_cache = ResultCache(maxsize=64)
+        counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True, result_cache=result_cache)
+        reference = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        pairs = date_pairs(1500)
+
+        def count(pair):
+            holidays = HolidayFactory(holiday_rules=HOLIDAY_RULES, start_date=pair[0], end_date=pair[1],
+                                      cache=expansion_cache).iter_holidays()
+            return (sum(1 for holiday in holidays if pair[0] < holiday < pair[1]),
+                    counter.business_days_between_two_dates(*pair, holiday_rules=HOLIDAY_RULES))
+
+        results = self.run_in_threads(count, pairs)
+        expected_holidays = [sum(1 for holiday in HolidayFactory(holiday_rules=HOLIDAY_RULES, start_date=start,
+                                                                 end_date=end, cache=HolidayExpansionCache())
+                                 .iter_holidays() if start < holiday < end) for start, end in pairs]
+        self.assertEqual([result[0] for result in results], expected_holidays)
+        self.assertEqual([result[1] for result in results],
+                         [reference.business_days_between_two_dates(*pair, holiday_rules=HOLIDAY_RULES)
+                          for pair in pairs])
+        self.assertEqual(counter.get_counters()["errors"], 0)
+        self.assertLessEqual(expansion_cache.stats()["size"], 8)
+        self.assertLessEqual(result_cache.stats()["size"], 64)
+
+    def test_mutable_calendar_writers_and_frozen_readers(self):
+        calendar = MutableBusinessCalendar(start_year=2020, end_year=2030)
+        frozen = calendar.freeze()
+        days = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(366)]
+        self.run_in_threads(calendar.add_holiday, days)
+        self.assertEqual(calendar.version, sum(1 for day in days if day.weekday() < 5))
+        self.assertEqual(calendar.business_days_in_year(2024), 0)
+        self.assertEqual(frozen.business_days_in_year(2024), 262)
+        self.assertEqual(calendar.freeze().business_days_in_year(2024), 0)
+        self.assertEqual(calendar.freeze().rule_hash, b"")
+
+    def run_writer_during(self, owner, attribute, calendar, day, call=1):
+        """
+        Wraps `owner.<attribute>` so that its `call`-th call is followed by `calendar.add_holiday(day)` from another
+        thread, which gets a moment to run before the wrapped call returns.
+        """
+        wrapped = getattr(owner, attribute)
+        calls, writers = [], []
+
+        def wrapper(*args):
+            result = wrapped(*args)
+            calls.append(args)
+            if len(calls) == call:
+                writers.append(threading.Thread(target=calendar.add_holiday, args=(day,)))
+                writers[0].start()
+                writers[0].join(timeout=0.2)
+            return result
+
+        setattr(owner, attribute, wrapper)
+        return writers
+
+    def test_mutable_calendar_lazy_tables_are_not_left_stale_by_writers(self):
+        """
+        A writer that mutates while a reader builds a year bitmap or the per-year totals must not leave them stale.
+        """
+        calendar = MutableBusinessCalendar(start_year=2020, end_year=2030)
+        writers = self.run_writer_during(calendar, "get_snapshot", calendar, date(2024, 7, 2))
+        calendar.is_business_day(date(2024, 7, 1))
+        writers[0].join()
+        self.assertFalse(calendar.is_business_day(date(2024, 7, 2)))
+        self.assertEqual(calendar.year_bitmap(2024), calendar.freeze().year_bitmap(2024))
+
+        calendar = MutableBusinessCalendar(start_year=2020, end_year=2030)
+        # The third prefix sum is January 1st, 2021: the 2020 holiday then lands after 2020 was totalled.
+        writers = self.run_writer_during(calendar.holiday_counts, "prefix_sum", calendar, date(2020, 7, 2), call=3)
+        calendar.build_year_tables()
+        writers[0].join()
+        self.assertEqual(calendar.build_year_tables(), calendar.freeze().build_year_tables())
+
+
+if __name__ == '__main__':
+    unittest.main()
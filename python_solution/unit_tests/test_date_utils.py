@@ -0,0 +1,120 @@
+import unittest
+from datetime import date, timedelta
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils, normalize_weekmask
+
+
+class TestWeekmask(unittest.TestCase):
+    """
+    Unit tests for configurable weekmasks in DayUtils, BusinessCalendar and BusinessDayCounter.
+    """
+
+    WEEKMASKS = ["1111100", "1111001", "1111110", "0111110", "1010101"]
+
+    def brute_force_weekdays(self, start_date, end_date, weekmask):
+        count = 0
+        current = start_date + timedelta(days=1)
+        while current < end_date:
+            count += weekmask[current.weekday()] == "1"
+            current += timedelta(days=1)
+        return count
+
+    def test_normalize_weekmask(self):
+        self.assertEqual(normalize_weekmask([1, 1, 1, 1, 0, 0, 1]), "1111001")
+        self.assertEqual(normalize_weekmask((True,) * 6 + (False,)), "1111110")
+        for invalid in ["111110", "11111a0", "0000000"]:
+            with self.assertRaises(ValueError):
+                normalize_weekmask(invalid)
+
+    def test_weekend_count_matches_brute_force(self):
+        """
+        Both the logging and the table-only weekend counts agree with a day-by-day walk for every mask.
+        """
+        base = date(2024, 1, 1)
+        for weekmask in self.WEEKMASKS:
+            day_utils = DayUtils(weekmask=weekmask)
+            for start_offset in range(7):
+                start_date = base + timedelta(days=start_offset)
+                for total_days in range(0, 22):
+                    end_date = start_date + timedelta(days=total_days + 1)
+                    expected = total_days - self.brute_force_weekdays(start_date, end_date, weekmask)
+                    self.assertEqual(day_utils.total_weekend_days_count(start_date, total_days), expected)
+                    self.assertEqual(day_utils.count_weekend_days(start_date, total_days), expected)
+
+    def test_public_holidays_follow_the_weekmask(self):
+        """
+        A Friday holiday is ignored on a Friday/Saturday weekend, a Sunday holiday counts on a Sunday-Thursday week.
+        """
+        friday, sunday = date(2024, 1, 5), date(2024, 1, 7)
+        middle_east = DayUtils(weekmask="1111001")
+        self.assertEqual(middle_east.calculate_public_holidays(date(2024, 1, 1), date(2024, 1, 10),
+                                                               [friday, sunday]), 1)
+        self.assertEqual(DayUtils().calculate_public_holidays(date(2024, 1, 1), date(2024, 1, 10),
+                                                              [friday, sunday]), 1)
+
+    def test_counter_and_calendar_with_custom_weekmask(self):
+        """
+        Counts through BusinessDayCounter, the calendar and offsets agree for a Friday/Saturday weekend.
+        """
+        weekmask = "1111001"
+        holidays = [date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 7)]
+        calendar = BusinessCalendar(public_holiday_list=holidays, start_year=2023, end_year=2025,
+                                    weekmask=weekmask)
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask=weekmask))
+        holiday_set = set(holidays)
+
+        start_date = date(2023, 12, 28)
+        for length in range(0, 40):
+            end_date = start_date + timedelta(days=length)
+            expected = sum(1 for offset in range(1, length)
+                           if weekmask[(start_date + timedelta(days=offset)).weekday()] == "1"
+                           and start_date + timedelta(days=offset) not in holiday_set)
+            self.assertEqual(calendar.business_days_between(start_date, end_date), expected)
+            self.assertEqual(business_day_counter.business_days_between_two_dates(
+                start_date, end_date, public_holiday_list=holidays), expected)
+            self.assertEqual(business_day_counter.business_days_between_two_dates(
+                start_date, end_date, calendar=calendar), expected)
+
+        self.assertEqual(calendar.add_business_days(date(2024, 1, 3), 1), date(2024, 1, 8))
+
+    def test_moveable_holidays_move_to_the_next_working_day_of_the_weekmask(self):
+        """
+        On a Friday/Saturday weekend a Friday holiday moves to Sunday and a Sunday holiday stays put; the ad-hoc
+        paths, the calendar and the default mask each use their own substitute day.
+        """
+        holiday_rules = [
+            {"holiday_type": "moveable_holiday", "description": "Friday holiday", "month": 1, "day": 5},
+            {"holiday_type": "moveable_holiday", "description": "Sunday holiday", "month": 1, "day": 7},
+        ]
+        weekmask = "1111001"
+        calendar = BusinessCalendar(holiday_rules=holiday_rules, start_year=2024, end_year=2024, weekmask=weekmask)
+        self.assertEqual([date.fromordinal(ordinal) for ordinal in calendar.holiday_ordinals], [date(2024, 1, 7)])
+        self.assertEqual(BusinessCalendar(holiday_rules=holiday_rules, start_year=2024, end_year=2024).holiday_ordinals,
+                         (date(2024, 1, 5).toordinal(), date(2024, 1, 8).toordinal()))
+
+        start_date, end_date = date(2024, 1, 1), date(2024, 1, 12)
+        expected = calendar.business_days_between(start_date, end_date)
+        self.assertEqual(expected, 7)
+        for quiet in (False, True):
+            business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask=weekmask), quiet=quiet)
+            self.assertEqual(business_day_counter.business_days_between_two_dates(
+                start_date, end_date, holiday_rules=holiday_rules), expected)
+        self.assertEqual(business_day_counter.business_days_between_ordinals(
+            start_date.toordinal(), end_date.toordinal(), holiday_rules=holiday_rules), expected)
+
+        six_day_week = BusinessCalendar(holiday_rules=holiday_rules[1:], start_year=2024, end_year=2024,
+                                        weekmask="1111110")
+        self.assertEqual(six_day_week.holiday_ordinals, (date(2024, 1, 8).toordinal(),))
+
+    def test_mismatched_calendar_weekmask_is_rejected(self):
+        business_day_counter = BusinessDayCounter(day_utils_obj=DayUtils())
+        calendar = BusinessCalendar(start_year=2024, end_year=2024, weekmask="1111001")
+        with self.assertRaises(ValueError):
+            business_day_counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 2, 1),
+                                                                 calendar=calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
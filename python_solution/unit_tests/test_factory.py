@@ -0,0 +1,249 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from unittest.mock import patch
+
+from src.business_calendar import rule_set_hash
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.factory import (HolidayExpansionCache, HolidayFactory, HolidayRule, PublicHoliday, compile_rule, compile_rules,
+                         rule_set_key)
+
+
+class TestHolidayExpansionCache(unittest.TestCase):
+    """
+    Unit tests for the per-(rule, year) expansion cache used by HolidayFactory.
+    """
+
+    def setUp(self):
+        self.cache = HolidayExpansionCache(maxsize=4)
+        self.holiday_rules = [
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+            {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6,
+             "day": 0, "occurrence": 2},
+        ]
+
+    def get_holidays(self, start_date, end_date, holiday_rules=None):
+        holiday_objects = HolidayFactory(holiday_rules=holiday_rules or self.holiday_rules, start_date=start_date,
+                                         end_date=end_date, cache=self.cache).get_objects()
+        return [holiday for holiday_object in holiday_objects for holiday in holiday_object.get_holiday()]
+
+    def test_expansion_is_unchanged(self):
+        """
+        Cached expansion returns the same dates as the original per-period generation.
+        """
+        holidays = self.get_holidays(date(2022, 12, 26), date(2023, 1, 4))
+        self.assertEqual(holidays, [date(2022, 1, 3), date(2023, 1, 2), date(2022, 6, 13), date(2023, 6, 12)])
+
+    def test_overlapping_queries_hit_the_cache(self):
+        """
+        Each rule-year is expanded once; the second query is answered from the cache.
+        """
+        self.get_holidays(date(2022, 12, 26), date(2023, 1, 4))
+        self.assertEqual(self.cache.stats()["misses"], 4)
+        self.get_holidays(date(2023, 3, 1), date(2023, 4, 1))
+        self.assertEqual(self.cache.stats()["misses"], 4)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_description_does_not_affect_the_key(self):
+        """
+        Rules that only differ in their description share cache entries.
+        """
+        renamed_rules = [dict(rule, description="renamed") for rule in self.holiday_rules]
+        self.get_holidays(date(2023, 1, 1), date(2023, 2, 1))
+        self.get_holidays(date(2023, 1, 1), date(2023, 2, 1), holiday_rules=renamed_rules)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_bounded_size_evicts_least_recently_used(self):
+        """
+        The cache never grows past maxsize and counts evictions.
+        """
+        self.get_holidays(date(2020, 1, 1), date(2022, 12, 31))
+        stats = self.cache.stats()
+        self.assertEqual(stats["size"], 4)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["misses"], 6)
+
+    def test_reused_entries_get_a_second_chance(self):
+        """
+        Eviction follows insertion order but skips entries that were hit since they were inserted.
+        """
+        cache = HolidayExpansionCache(maxsize=2)
+        for key in ("a", "b", "a", "c", "a", "d"):
+            cache.get_or_expand(key, 2023, lambda year, key=key: [key])
+        self.assertEqual(set(cache.entries), {("a", 2023), ("d", 2023)})
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2})
+
+    def test_hits_take_no_lock(self):
+        class UnavailableLock(object):
+            def __enter__(self):
+                raise AssertionError("lock taken on a cache hit")
+
+        self.get_holidays(date(2023, 1, 1), date(2023, 2, 1))
+        self.cache.lock = UnavailableLock()
+        self.assertEqual(self.get_holidays(date(2023, 1, 1), date(2023, 2, 1)), [date(2023, 1, 2), date(2023, 6, 12)])
+
+    def test_concurrent_misses_share_the_first_stored_expansion(self):
+        """
+        Threads that miss the same key together each expand it, but all of them return the tuple stored first.
+        """
+        threads = 4
+        barrier = threading.Barrier(threads)
+
+        def expand(year):
+            barrier.wait(timeout=5)
+            return [date(year, 1, 2)]
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda _: self.cache.get_or_expand("rule", 2023, expand), range(threads)))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIs(self.cache.entries[("rule", 2023)], results[0])
+        self.assertEqual(self.cache.stats(), {"hits": 0, "misses": threads, "evictions": 0, "size": 1, "maxsize": 4})
+
+    def test_clear_resets_counters(self):
+        self.get_holidays(date(2023, 1, 1), date(2023, 2, 1))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 4})
+
+
+class TestLazyHolidayExpansion(unittest.TestCase):
+    """
+    Unit tests for the range-pruned, lazy holiday generators.
+    """
+
+    def setUp(self):
+        self.cache = HolidayExpansionCache()
+        self.holiday_rules = [
+            {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+            {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6,
+             "day": 0, "occurrence": 2},
+        ]
+
+    def iter_holidays(self, start_date, end_date):
+        return HolidayFactory(holiday_rules=self.holiday_rules, start_date=start_date, end_date=end_date,
+                              cache=self.cache).iter_holidays()
+
+    def test_iter_holidays_is_lazy(self):
+        """
+        Nothing is expanded until the generator is consumed.
+        """
+        holidays = self.iter_holidays(date(2022, 12, 30), date(2023, 1, 3))
+        self.assertEqual(self.cache.stats()["misses"], 0)
+        self.assertEqual(list(holidays), [date(2023, 1, 2)])
+
+    def test_short_range_only_expands_rules_that_can_fall_inside(self):
+        """
+        A 3-day window crossing New Year only expands New Year's Day of the second year.
+        """
+        list(self.iter_holidays(date(2022, 12, 30), date(2023, 1, 3)))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_interior_years_are_always_expanded(self):
+        """
+        Every rule is expanded for the years strictly inside a multi-year range.
+        """
+        holidays = list(self.iter_holidays(date(2021, 12, 1), date(2023, 2, 1)))
+        self.assertEqual(sorted(holidays), [date(2022, 1, 3), date(2022, 4, 25), date(2022, 6, 13),
+                                            date(2023, 1, 2)])
+
+    def test_pruning_keeps_every_holiday_in_range(self):
+        """
+        The pruned generator yields exactly the full expansion filtered to the range.
+        """
+        start_date, end_date = date(2020, 4, 20), date(2024, 6, 11)
+        factory = HolidayFactory(holiday_rules=self.holiday_rules, start_date=start_date, end_date=end_date,
+                                 cache=self.cache)
+        full = [holiday for holiday_object in factory.get_objects() for holiday in holiday_object.get_holiday()]
+        expected = sorted(holiday for holiday in full if start_date < holiday < end_date)
+        self.assertEqual(sorted(holiday for holiday in self.iter_holidays(start_date, end_date)
+                                if start_date < holiday < end_date), expected)
+
+
+class TestHolidayRule(unittest.TestCase):
+    """
+    Unit tests for compiled, immutable holiday rules.
+    """
+
+    def test_compiled_rule_is_immutable_and_hashable(self):
+        rule = compile_rule({"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25})
+        self.assertEqual((rule.holiday_type, rule.month, rule.day, rule.occurrence), ("public_holiday", 4, 25, None))
+        with self.assertRaises(AttributeError):
+            rule.month = 5
+        with self.assertRaises(AttributeError):
+            rule.extra = 1
+        self.assertIs(compile_rule(rule), rule)
+        self.assertEqual(rule, compile_rule({"holiday_type": "public_holiday", "description": "x", "month": 4,
+                                             "day": 25}))
+        self.assertEqual(len({rule, compile_rule(rule.as_dict())}), 1)
+        self.assertEqual(rule.as_dict(), {"holiday_type": "public_holiday", "description": "Anzac Day",
+                                          "month": 4, "day": 25})
+
+    def test_invalid_rules_are_rejected_at_compile_time(self):
+        for holiday_rule in [
+            {"month": 1, "day": 1},
+            {"holiday_type": "lunar_holiday", "month": 1, "day": 1},
+            {"holiday_type": "public_holiday", "month": 2, "day": 30},
+            {"holiday_type": "moveable_holiday", "month": 13, "day": 1},
+            {"holiday_type": "moveable_holiday", "month": 1},
+            {"holiday_type": "certain_occurrence_holiday", "month": 6, "day": 7, "occurrence": 2},
+            {"holiday_type": "certain_occurrence_holiday", "month": 6, "day": 0, "occurrence": 6},
+            {"holiday_type": "certain_occurrence_holiday", "month": 6, "day": 0},
+        ]:
+            with self.assertRaises(ValueError, msg=holiday_rule):
+                compile_rule(holiday_rule)
+
+    def test_compile_rules_deduplicates(self):
+        holiday_rules = compile_rules([
+            {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+            {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+            {"holiday_type": "moveable_holiday", "description": "New Year", "month": 1, "day": 1},
+        ])
+        self.assertEqual([holiday_rule.description for holiday_rule in holiday_rules], ["New Year's Day", "Anzac Day"])
+        self.assertEqual(hash(holiday_rules), hash(compile_rules(holiday_rules)))
+        self.assertEqual(rule_set_hash(holiday_rules=holiday_rules),
+                         rule_set_hash(holiday_rules=[holiday_rule.as_dict() for holiday_rule in holiday_rules]))
+
+    def test_rules_are_validated_once(self):
+        holiday_rules = compile_rules([{"holiday_type": "public_holiday", "month": 4, "day": 25}])
+        with patch.object(PublicHoliday, "check_holiday") as check_holiday:
+            for year in range(2000, 2010):
+                factory = HolidayFactory(holiday_rules=holiday_rules, start_date=date(year, 1, 1),
+                                         end_date=date(year, 12, 31))
+                self.assertEqual(list(factory.iter_holidays()), [date(year, 4, 25)])
+        check_holiday.assert_not_called()
+        self.assertIsInstance(factory.get_objects()[0].holiday_rule, HolidayRule)
+
+    def test_rule_dictionaries_are_compiled_once_per_rule_set(self):
+        holiday_rules = [{"holiday_type": "public_holiday", "description": "Norway Day", "month": 5, "day": 17}]
+        counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        with patch.object(PublicHoliday, "check_holiday") as check_holiday:
+            for year in range(2000, 2010):
+                self.assertEqual(counter.business_days_between_two_dates(
+                    date(year, 5, 1), date(year, 6, 1), holiday_rules=[dict(rule) for rule in holiday_rules]),
+                    counter.weekdays_between_two_dates(date(year, 5, 1), date(year, 6, 1))
+                    - (date(year, 5, 17).weekday() < 5))
+        self.assertEqual(check_holiday.call_count, 1)
+        self.assertIs(compile_rules(holiday_rules), compile_rules([dict(rule) for rule in holiday_rules]))
+
+        renamed = compile_rules([dict(holiday_rules[0], description="Constitution Day")])
+        self.assertEqual(renamed[0].description, "Constitution Day")
+        self.assertEqual(compile_rules(renamed + (HolidayRule("public_holiday", 5, 17, description="x"),))[0]
+                         .description, "Constitution Day")
+        with self.assertRaises(ValueError):
+            compile_rules([{"holiday_type": "public_holiday", "month": [5], "day": 17}])
+
+    def test_rule_set_key(self):
+        holiday_rules = [{"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday",
+                          "month": 6, "day": 0, "occurrence": 2},
+                         {"holiday_type": "public_holiday", "month": 4, "day": 25}]
+        self.assertEqual(rule_set_key(holiday_rules), rule_set_key(compile_rules(holiday_rules)))
+        self.assertEqual(rule_set_key(holiday_rules), (("certain_occurrence_holiday", 6, 0, 2),
+                                                       ("public_holiday", 4, 25, None)))
+        self.assertEqual(rule_set_key(None), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
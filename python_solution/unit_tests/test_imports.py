@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import src
+from src.business_calendar import BusinessCalendar
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTIONAL_MODULES = ("numpy", "asyncio", "mmap", "src.batch", "src.server", "src.calendar_file")
+
+
+def import_in_fresh_interpreter(statement):
+    """
+    Runs `statement` in a new interpreter and reports the import side effects.
+    """
+    script = (f"import json, logging, sys\n{statement}\n"
+              "print(json.dumps({'handlers': len(logging.getLogger().handlers),"
+              " 'level': logging.getLogger().level, 'modules': sorted(sys.modules)}))")
+    completed = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                               check=True)
+    return json.loads(completed.stdout)
+
+
+class TestImports(unittest.TestCase):
+    """
+    Unit tests for side-effect free, lazy package imports.
+    """
+
+    def test_core_modules_do_not_configure_logging(self):
+        report = import_in_fresh_interpreter("import src.business_day_counter, src.cli, src.mutable_calendar")
+        self.assertEqual(report["handlers"], 0)
+        self.assertEqual(report["level"], 30)
+        self.assertEqual([name for name in OPTIONAL_MODULES if name in report["modules"]], [])
+
+    def test_package_import_loads_no_submodules(self):
+        report = import_in_fresh_interpreter("import src")
+        self.assertEqual([name for name in report["modules"] if name.startswith("src.")], [])
+
+    def test_lazy_attributes(self):
+        self.assertIs(src.BusinessCalendar, BusinessCalendar)
+        self.assertIn("business_days_between_many", dir(src))
+        with self.assertRaises(AttributeError):
+            src.NotAThing
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+from datetime import date, timedelta
+
+from src.business_calendar import BusinessCalendar
+from src.mutable_calendar import FenwickTree, MutableBusinessCalendar
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+
+
+class TestFenwickTree(unittest.TestCase):
+    """
+    Unit tests for the binary indexed tree.
+    """
+
+    def test_prefix_sums_match_a_list(self):
+        random.seed(3)
+        counts = [random.randint(0, 1) for _ in range(100)]
+        tree = FenwickTree(len(counts), (position for position, count in enumerate(counts) if count))
+        for position, delta in [(0, 1), (37, -counts[37]), (99, 2)]:
+            counts[position] += delta
+            tree.add(position, delta)
+        for end in range(-1, 102):
+            self.assertEqual(tree.prefix_sum(end), sum(counts[:max(end, 0)]), end)
+
+
+class TestMutableBusinessCalendar(unittest.TestCase):
+    """
+    Unit tests for adding and removing holidays on a live calendar.
+    """
+
+    def setUp(self):
+        self.calendar = MutableBusinessCalendar(public_holiday_list=[date(2024, 3, 29), date(2024, 4, 1)],
+                                                holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2026)
+
+    def assert_matches_rebuild(self, calendar):
+        """
+        Compares every query with an immutable calendar rebuilt from the current holidays.
+        """
+        rebuilt = BusinessCalendar.from_ordinals(calendar.holiday_ordinals, start_year=calendar.start_year,
+                                                 end_year=calendar.end_year, weekmask=calendar.weekmask)
+        random.seed(7)
+        for _ in range(300):
+            start = date(2020, 1, 1) + timedelta(days=random.randrange(2500))
+            end = start + timedelta(days=random.randrange(400))
+            if end > date(2026, 12, 31):
+                continue
+            self.assertEqual(calendar.business_days_between(start, end), rebuilt.business_days_between(start, end))
+            self.assertEqual(calendar.holidays_between(start, end), rebuilt.holidays_between(start, end))
+            self.assertEqual(calendar.is_business_day(start), rebuilt.is_business_day(start))
+            offset = random.randrange(-200, 200)
+            try:
+                expected = rebuilt.add_business_days(start, offset)
+            except ValueError:
+                continue
+            self.assertEqual(calendar.add_business_days(start, offset), expected)
+
+    def test_initial_calendar_matches_business_calendar(self):
+        self.assertEqual(self.calendar.version, 0)
+        self.assertEqual(self.calendar.holiday_ordinals,
+                         BusinessCalendar(public_holiday_list=[date(2024, 3, 29), date(2024, 4, 1)],
+                                          holiday_rules=HOLIDAY_RULES, start_year=2020,
+                                          end_year=2026).holiday_ordinals)
+        self.assert_matches_rebuild(self.calendar)
+
+    def test_add_and_remove_holiday(self):
+        start, end = date(2024, 7, 1), date(2024, 7, 12)
+        self.assertEqual(self.calendar.business_days_between(start, end), 8)
+        self.calendar.is_business_day(date(2024, 7, 4))  # caches the 2024 bitmap
+
+        self.assertTrue(self.calendar.add_holiday(date(2024, 7, 4)))
+        self.assertEqual(self.calendar.version, 1)
+        self.assertEqual(self.calendar.business_days_between(start, end), 7)
+        self.assertFalse(self.calendar.is_business_day(date(2024, 7, 4)))
+        self.assertIn(date(2024, 7, 4).toordinal(), self.calendar.holiday_ordinals)
+
+        self.assertTrue(self.calendar.remove_holiday(date(2024, 7, 4)))
+        self.assertEqual(self.calendar.version, 2)
+        self.assertEqual(self.calendar.business_days_between(start, end), 8)
+        self.assertTrue(self.calendar.is_business_day(date(2024, 7, 4)))
+
+    def test_mutation_updates_year_totals(self):
+        business_days = self.calendar.business_days_in_year(2024)
+        long_range = self.calendar.business_days_between(date(2020, 6, 1), date(2026, 6, 1))
+        self.calendar.add_holiday(date(2024, 7, 4))
+        self.assertEqual(self.calendar.business_days_in_year(2024), business_days - 1)
+        self.assertEqual(self.calendar.business_days_between(date(2020, 6, 1), date(2026, 6, 1)), long_range - 1)
+
+    def test_no_op_mutations_keep_the_version(self):
+        self.assertFalse(self.calendar.add_holiday(date(2024, 3, 29)))
+        self.assertFalse(self.calendar.add_holiday(date(2024, 7, 6)))  # Saturday
+        self.assertFalse(self.calendar.remove_holiday(date(2024, 7, 4)))
+        self.assertEqual(self.calendar.version, 0)
+
+    def test_mutation_outside_horizon_raises(self):
+        with self.assertRaises(ValueError):
+            self.calendar.add_holiday(date(2030, 1, 2))
+
+    def test_random_mutations_match_rebuild(self):
+        random.seed(11)
+        days = [date(2020, 1, 1) + timedelta(days=random.randrange(2500)) for _ in range(200)]
+        for day in days:
+            if random.random() < 0.7:
+                self.calendar.add_holiday(day)
+            else:
+                self.calendar.remove_holiday(day)
+        self.assertGreater(self.calendar.version, 0)
+        self.assert_matches_rebuild(self.calendar)
+
+
+if __name__ == '__main__':
+    unittest.main()
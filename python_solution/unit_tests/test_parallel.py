@@ -0,0 +1,52 @@
+import io
+import unittest
+from datetime import date, timedelta
+
+from src.cli import run
+from src.parallel import run_parallel
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "certain_occurrence_holiday", "description": "Queen's Birthday", "month": 6, "day": 0,
+     "occurrence": 2},
+]
+
+
+class TestParallelRunner(unittest.TestCase):
+    """
+    Unit tests for the process-pool batch runner.
+    """
+
+    def setUp(self):
+        base = date(2022, 11, 1)
+        lines = ["start_date,end_date"]
+        for index in range(50):
+            start_date = base + timedelta(days=index * 3)
+            end_date = start_date + timedelta(days=(index * 7) % 45 - 5)
+            lines.append(f"{start_date.isoformat()},{end_date.isoformat()}")
+        self.csv_input = "\n".join(lines) + "\n"
+
+    def test_output_matches_sequential_runner_in_order(self):
+        for command in ("weekdays", "business"):
+            expected, actual = io.StringIO(), io.StringIO()
+            run(command, io.StringIO(self.csv_input), expected, chunk_size=7, holiday_rules=HOLIDAY_RULES,
+                start_year=2020, end_year=2025)
+            run_parallel(command, io.StringIO(self.csv_input), actual, chunk_size=7, workers=2,
+                         holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2025)
+            self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_worker_stats_cover_every_row(self):
+        worker_stats = run_parallel("weekdays", io.StringIO(self.csv_input), io.StringIO(), chunk_size=10,
+                                    workers=2)
+        self.assertEqual(sum(stats["rows"] for stats in worker_stats.values()), 50)
+        self.assertEqual(sum(stats["chunks"] for stats in worker_stats.values()), 5)
+        self.assertLessEqual(len(worker_stats), 2)
+
+    def test_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            run_parallel("weekdays", io.StringIO(self.csv_input), io.StringIO(), workers=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from datetime import date
+
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.profiling import (ACTIVE_PROFILER, CALCULATE_PUBLIC_HOLIDAYS, GET_HOLIDAYS, GET_OBJECTS, STAGES,
+                           VALIDATE_DATES, WEEKEND_MATH, StageProfiler, profile)
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+]
+
+
+class TestProfiling(unittest.TestCase):
+    """
+    Unit tests for the per-stage profiling hooks.
+    """
+
+    def setUp(self):
+        self.counter = BusinessDayCounter(day_utils_obj=DayUtils())
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(ACTIVE_PROFILER.get())
+        self.assertEqual(self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1),
+                                                                      holiday_rules=HOLIDAY_RULES), 85)
+
+    def test_records_every_stage_of_a_business_day_query(self):
+        with profile("Sydney") as profiler:
+            result = self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1),
+                                                                  public_holiday_list=[date(2024, 3, 29)],
+                                                                  holiday_rules=HOLIDAY_RULES)
+        self.assertEqual(result, 84)
+        self.assertIsNone(ACTIVE_PROFILER.get())
+
+        stages = profiler.snapshot()["Sydney"]
+        self.assertEqual(set(stages), set(STAGES))
+        self.assertEqual(stages[VALIDATE_DATES]["calls"], 1)
+        self.assertEqual(stages[WEEKEND_MATH]["calls"], 1)
+        self.assertEqual(stages[GET_OBJECTS]["calls"], 1)
+        self.assertEqual(stages[GET_HOLIDAYS]["calls"], 1)
+        self.assertEqual(stages[CALCULATE_PUBLIC_HOLIDAYS]["calls"], 1)
+        self.assertGreaterEqual(stages[GET_HOLIDAYS]["seconds"], stages[CALCULATE_PUBLIC_HOLIDAYS]["seconds"])
+        self.assertAlmostEqual(stages[WEEKEND_MATH]["mean_seconds"], stages[WEEKEND_MATH]["seconds"])
+
+    def test_aggregates_per_calendar(self):
+        profiler = StageProfiler(track_allocations=False)
+        quiet_counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True)
+        for calendar, repeats in (("London", 3), ("Sydney", 1), ("London", 2)):
+            with profile(calendar, profiler=profiler):
+                for _ in range(repeats):
+                    quiet_counter.weekdays_between_two_dates(date(2024, 1, 1), date(2024, 2, 1))
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["London"][WEEKEND_MATH]["calls"], 5)
+        self.assertEqual(snapshot["Sydney"][WEEKEND_MATH]["calls"], 1)
+        self.assertEqual(snapshot["London"][WEEKEND_MATH]["allocated_blocks"], 0)
+        profiler.reset()
+        self.assertEqual(profiler.snapshot(), {})
+
+    def test_callback_receives_each_record(self):
+        records = []
+        with profile("Dubai", callback=lambda *record: records.append(record)):
+            self.counter.weekdays_between_two_dates(date(2024, 1, 1), date(2024, 2, 1))
+        self.assertEqual([record[:2] for record in records], [("Dubai", VALIDATE_DATES), ("Dubai", WEEKEND_MATH)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from datetime import date
+
+from src.business_calendar import BusinessCalendar
+from src.business_day_counter import BusinessDayCounter
+from src.date_utils import DayUtils
+from src.mutable_calendar import MutableBusinessCalendar
+from src.result_cache import ResultCache
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "public_holiday", "description": "Anzac Day", "month": 4, "day": 25},
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+]
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Unit tests for the LRU/TTL result cache.
+    """
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        for key in ("a", "b", "a", "c", "a", "b"):
+            cache.get_or_compute(key, lambda: key.upper())
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 4, "evictions": 2, "expirations": 0, "size": 2,
+                                         "maxsize": 2, "ttl": None})
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(cache.get_or_compute("q", compute), 1)
+        clock.now = 9.5
+        self.assertEqual(cache.get_or_compute("q", compute), 1)
+        clock.now = 10.0
+        self.assertEqual(cache.get_or_compute("q", compute), 2)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.stats()["misses"], 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            ResultCache(ttl=0)
+
+
+class TestCounterResultCache(unittest.TestCase):
+    """
+    Unit tests for memoized business_days_between_two_dates.
+    """
+
+    def setUp(self):
+        self.cache = ResultCache()
+        self.counter = BusinessDayCounter(day_utils_obj=DayUtils(), quiet=True, result_cache=self.cache)
+
+    def test_repeated_queries_hit_the_cache(self):
+        calendar = BusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2030)
+        for _ in range(3):
+            self.assertEqual(self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1),
+                                                                          calendar=calendar), 85)
+            self.assertEqual(self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1),
+                                                                          holiday_rules=HOLIDAY_RULES), 85)
+        self.assertEqual(self.cache.stats()["hits"], 4)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+        self.assertEqual(self.counter.get_counters()["calls"], 6)
+
+    def test_rule_descriptions_do_not_split_entries(self):
+        renamed = [dict(rule, description="renamed") for rule in HOLIDAY_RULES]
+        self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1), holiday_rules=HOLIDAY_RULES)
+        self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 5, 1), holiday_rules=renamed)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_mutated_calendar_is_not_served_stale_results(self):
+        calendar = MutableBusinessCalendar(holiday_rules=HOLIDAY_RULES, start_year=2020, end_year=2030)
+        query = (date(2024, 1, 1), date(2024, 5, 1))
+        self.assertEqual(self.counter.business_days_between_two_dates(*query, calendar=calendar), 85)
+        calendar.add_holiday(date(2024, 2, 1))
+        self.assertEqual(self.counter.business_days_between_two_dates(*query, calendar=calendar), 84)
+        self.assertEqual(self.counter.business_days_between_two_dates(*query, calendar=calendar), 84)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_shared_cache_keeps_weekmasks_apart(self):
+        dubai_counter = BusinessDayCounter(day_utils_obj=DayUtils(weekmask="1111001"), quiet=True,
+                                           result_cache=self.cache)
+        self.assertEqual(self.counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 1, 6)), 4)
+        self.assertEqual(dubai_counter.business_days_between_two_dates(date(2024, 1, 1), date(2024, 1, 6)), 3)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_unhashable_queries_bypass_the_cache(self):
+        self.assertEqual(self.counter.business_days_between_two_dates([2024], date(2024, 1, 8)), 0)
+        self.assertEqual(self.cache.stats()["size"], 0)
+        self.assertEqual(self.counter.get_counters()["errors"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import unittest
+from datetime import date
+
+from src.business_calendar import BusinessCalendar
+from src.server import BusinessDayServer, parse_request
+
+
+HOLIDAY_RULES = [
+    {"holiday_type": "moveable_holiday", "description": "New Year's Day", "month": 1, "day": 1},
+]
+
+
+class TestBusinessDayServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the asyncio query server.
+    """
+
+    async def asyncSetUp(self):
+        calendars = {
+            "default": BusinessCalendar(public_holiday_list=[date(2013, 12, 25), date(2013, 12, 26)],
+                                        holiday_rules=HOLIDAY_RULES, start_year=2010, end_year=2030),
+            "friday_saturday": BusinessCalendar(start_year=2010, end_year=2030, weekmask="1111001"),
+        }
+        self.server = BusinessDayServer(calendars, batch_window=0.05)
+        self.listener = await self.server.start(port=0)
+        port = self.listener.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.wait_connections_closed()
+        self.listener.close()
+        await self.listener.wait_closed()
+
+    async def query(self, requests):
+        self.writer.write(b"".join(json.dumps(request).encode() + b"\n" for request in requests))
+        await self.writer.drain()
+        return [json.loads(await self.reader.readline()) for _ in requests]
+
+    async def test_pipelined_requests_are_answered_in_order(self):
+        responses = await self.query([
+            {"id": 1, "op": "weekdays", "start_date": "2013-10-07", "end_date": "2014-01-01"},
+            {"id": 2, "op": "business", "start_date": "2013-10-07", "end_date": "2014-01-01"},
+            {"id": 3, "op": "business", "start_date": "2022-12-26", "end_date": "2023-01-03"},
+            {"id": 4, "op": "add", "start_date": "2022-12-30", "business_days": 1},
+            {"id": 5, "op": "subtract", "start_date": "2023-01-03", "business_days": 1},
+            {"id": 6, "op": "weekdays", "start_date": "2024-01-01", "end_date": "2024-01-10",
+             "calendar": "friday_saturday"},
+            {"id": 7, "op": "business", "start_date": "2014-01-01", "end_date": "2013-10-07"},
+        ])
+        self.assertEqual([response["id"] for response in responses], [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual([response["result"] for response in responses],
+                         [61, 59, 4, "2023-01-03", "2022-12-30", 6, 0])
+
+    async def test_concurrent_requests_are_coalesced(self):
+        requests = [{"id": index, "op": "business", "start_date": "2013-10-07", "end_date": "2014-01-01"}
+                    for index in range(200)]
+        responses = await self.query(requests)
+        self.assertEqual({response["result"] for response in responses}, {59})
+        self.assertEqual(self.server.coalescer.stats["requests"], 200)
+        self.assertLess(self.server.coalescer.stats["batches"], 200)
+
+    async def test_errors_are_reported_per_request(self):
+        responses = await self.query([
+            {"id": 1, "op": "business", "start_date": "2009-12-01", "end_date": "2010-01-05"},
+            {"id": 2, "op": "add", "start_date": "2030-12-01", "business_days": 100},
+            {"id": 3, "op": "business", "start_date": "2013-10-07", "end_date": "2013-10-09", "calendar": "nope"},
+            {"id": 4, "op": "unknown"},
+            {"id": 5, "op": "add", "start_date": "2022-12-30", "business_days": 1},
+        ])
+        self.assertEqual([("error" in response) for response in responses], [True, True, True, True, False])
+        self.assertEqual(responses[4]["result"], "2023-01-03")
+
+    async def test_failed_batch_resolves_every_future(self):
+        coalescer = self.server.coalescer
+        futures = [coalescer.submit("add", "default", date(2022, 12, 30).toordinal(), 1),
+                   coalescer.submit("add", "default", date(2022, 12, 30).toordinal(), 2 ** 70)]
+        coalescer.flush()
+        for future in futures:
+            with self.assertRaises(OverflowError):
+                future.result()
+        responses = await self.query([{"id": 1, "op": "add", "start_date": "2022-12-30",
+                                       "business_days": 100000000000000000000},
+                                      {"id": 2, "op": "add", "start_date": "2022-12-30", "business_days": 1}])
+        self.assertIn("error", responses[0])
+        self.assertEqual(responses[1]["result"], "2023-01-03")
+
+    def test_parse_request_rejects_malformed_input(self):
+        for line in [b"[]", b'{"op": "business", "start_date": "2013-10-07"}',
+                     b'{"op": "add", "start_date": "2013-10-07", "business_days": "3"}',
+                     b'{"op": "weekdays", "start_date": "not a date", "end_date": "2013-10-09"}',
+                     b'{"op": "add", "start_date": "2013-10-07", "business_days": 100000000000000000000}']:
+            with self.assertRaises(ValueError):
+                parse_request(line)
+
+
+if __name__ == "__main__":
+    unittest.main()